@@ -4,1271 +4,2622 @@
 HellFire GUI Installer
 """
 
+import argparse
+import atexit
+import collections
+import concurrent.futures
+import configparser
+import contextlib
+import ctypes
+import errno
+import fcntl
 import glob
+import hashlib
+import http.server
 import io
+import itertools
+import json
+import lzma
+import multiprocessing
 import os
+import random
+import re
+import shutil
+import signal
+import socket
+import stat
+import subprocess
 import sys
 import tarfile
+import tempfile
 import threading
+import time
+import urllib.parse
+import urllib.request
 import webbrowser
+import zlib
 from pathlib import Path
 
 import requests
-
-try:
-    from PIL import Image, ImageDraw, ImageTk
-    PIL_AVAILABLE = True
-except ImportError:
-    PIL_AVAILABLE = False
-
-import tkinter as tk
-from tkinter import font as tkfont
+import urllib3
+from requests.adapters import BaseAdapter, HTTPAdapter
 
 
 # ---------------------------------------------------------------------------
-# Font fallback for broad Linux distro coverage
+# Shared HTTP session
 # ---------------------------------------------------------------------------
 
-SANS_PREFERENCES = (
-    "Inter", "Inter Variable", "SF Pro Display",
-    "Ubuntu", "Cantarell", "Noto Sans", "Roboto",
-    "DejaVu Sans", "Liberation Sans", "FreeSans", "Sans",
-)
+class Counters:
+    """Thread-safe named counters, printed by ``--diagnostics``."""
 
-SANS_BOLD_PREFERENCES = (
-    "Inter Black", "Inter SemiBold",
-    "Ubuntu Bold", "Cantarell Bold", "Noto Sans Bold",
-    *SANS_PREFERENCES,
-)
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._values = collections.Counter()
 
+    def incr(self, key, n=1):
+        with self._lock:
+            self._values[key] += n
 
-def pick_font(preferred, size, weight="normal"):
-    try:
-        available = {f.lower() for f in tkfont.families()}
-    except Exception:
-        available = set()
-    for name in preferred:
-        if name.lower() in available:
-            return (name, size, weight)
-    return ("TkDefaultFont", size, weight)
+    def snapshot(self):
+        with self._lock:
+            return dict(self._values)
 
+    def merge(self, values):
+        """Add counters reported by another process."""
+        with self._lock:
+            self._values.update(values)
 
-# ---------------------------------------------------------------------------
-# Custom widgets
-# ---------------------------------------------------------------------------
 
-class RoundedFrame(tk.Canvas):
-    """Canvas with a rounded-rect background. Use .interior for content."""
+DIAGNOSTICS = Counters()
 
-    def __init__(self, parent, width, height, parent_bg, card_bg,
-                 border_color=None, radius=14):
-        super().__init__(
-            parent, width=width, height=height,
-            highlightthickness=0, bd=0, bg=parent_bg,
-        )
-        self._cw, self._ch, self._r = width, height, radius
-        self._parent_bg = parent_bg
-        self._card_bg = card_bg
-        self._border_color = border_color
-        self._draw()
-
-        self.interior = tk.Frame(self, bg=card_bg)
-        self.create_window(
-            radius, radius, anchor="nw", window=self.interior,
-            width=width - 2 * radius, height=height - 2 * radius,
-        )
 
-    def _draw(self):
-        self.delete("bg")
-        w, h, r = self._cw, self._ch, self._r
-        c = self._card_bg
-        self.create_arc(0, 0, 2 * r, 2 * r, start=90, extent=90,
-                        fill=c, outline=c, tags="bg")
-        self.create_arc(w - 2 * r, 0, w, 2 * r, start=0, extent=90,
-                        fill=c, outline=c, tags="bg")
-        self.create_arc(0, h - 2 * r, 2 * r, h, start=180, extent=90,
-                        fill=c, outline=c, tags="bg")
-        self.create_arc(w - 2 * r, h - 2 * r, w, h, start=270, extent=90,
-                        fill=c, outline=c, tags="bg")
-        self.create_rectangle(r, 0, w - r, h, fill=c, outline=c, tags="bg")
-        self.create_rectangle(0, r, w, h - r, fill=c, outline=c, tags="bg")
-        self.tag_lower("bg")
-
-    def update_theme(self, parent_bg, card_bg, border_color=None):
-        self._parent_bg = parent_bg
-        self._card_bg = card_bg
-        self._border_color = border_color
-        self.configure(bg=parent_bg)
-        self.interior.configure(bg=card_bg)
-        self._draw()
-
-
-class RoundedButton(tk.Canvas):
-    """Pill button with hover/press/disabled states."""
-
-    def __init__(self, parent, text="", command=None,
-                 width=160, height=42, radius=21,
-                 bg="#ff6b3d", hover_bg="#ff8559", active_bg="#e55a2e",
-                 disabled_bg="#cccccc", disabled_fg="#777",
-                 fg="white", font=None, parent_bg="#ffffff"):
-        super().__init__(
-            parent, width=width, height=height,
-            highlightthickness=0, bd=0, bg=parent_bg,
-        )
-        self._text = text
-        self._command = command
-        self._cw, self._ch, self._r = width, height, radius
-        self._bg, self._hover, self._active = bg, hover_bg, active_bg
-        self._disabled_bg, self._disabled_fg = disabled_bg, disabled_fg
-        self._fg = fg
-        self._font = font or pick_font(SANS_BOLD_PREFERENCES, 11, "bold")
-        self._enabled = True
-        self._current_bg = bg
-        self._draw()
-        self.bind("<Enter>", self._on_enter)
-        self.bind("<Leave>", self._on_leave)
-        self.bind("<ButtonPress-1>", self._on_press)
-        self.bind("<ButtonRelease-1>", self._on_release)
-
-    def _draw(self):
-        self.delete("all")
-        w, h, r = self._cw, self._ch, self._r
-        bg = self._current_bg if self._enabled else self._disabled_bg
-        fg = self._fg if self._enabled else self._disabled_fg
-        self.create_arc(0, 0, 2 * r, h, start=90, extent=180,
-                        fill=bg, outline=bg)
-        self.create_arc(w - 2 * r, 0, w, h, start=270, extent=180,
-                        fill=bg, outline=bg)
-        self.create_rectangle(r, 0, w - r, h, fill=bg, outline=bg)
-        self.create_text(w // 2, h // 2, text=self._text,
-                         fill=fg, font=self._font)
-
-    def configure_text(self, text):
-        self._text = text
-        self._draw()
-
-    def set_enabled(self, enabled):
-        self._enabled = enabled
-        self._current_bg = self._bg
-        self.configure(cursor="hand2" if enabled else "arrow")
-        self._draw()
-
-    def update_colors(self, parent_bg, bg, hover_bg, active_bg,
-                      disabled_bg, disabled_fg, fg):
-        self._bg, self._hover, self._active = bg, hover_bg, active_bg
-        self._disabled_bg, self._disabled_fg = disabled_bg, disabled_fg
-        self._fg = fg
-        self._current_bg = bg
-        self.configure(bg=parent_bg)
-        self._draw()
-
-    def _on_enter(self, _):
-        if self._enabled:
-            self._current_bg = self._hover
-            self.configure(cursor="hand2")
-            self._draw()
+class _CountingPoolMixin:
+    def _new_conn(self):
+        DIAGNOSTICS.incr("http_connections_opened")
+        return super()._new_conn()
 
-    def _on_leave(self, _):
-        if self._enabled:
-            self._current_bg = self._bg
-            self._draw()
 
-    def _on_press(self, _):
-        if self._enabled:
-            self._current_bg = self._active
-            self._draw()
+class _CountingHTTPPool(_CountingPoolMixin, urllib3.HTTPConnectionPool):
+    pass
+
+
+class _CountingHTTPSPool(_CountingPoolMixin, urllib3.HTTPSConnectionPool):
+    pass
 
-    def _on_release(self, _):
-        if not self._enabled:
-            return
-        self._current_bg = self._hover
-        self._draw()
-        if self._command:
-            self._command()
 
+class PooledAdapter(HTTPAdapter):
+    """Keep-alive adapter whose pools count the connections they open."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _CountingHTTPPool,
+            "https": _CountingHTTPSPool,
+        }
 
-class SmoothProgressBar(tk.Canvas):
-    """Rounded progress bar with eased animation + indeterminate shimmer."""
 
-    def __init__(self, parent, width=440, height=8,
-                 bg_track="#ecebf3", fg="#ff6b3d", parent_bg="#ffffff"):
-        super().__init__(
-            parent, width=width, height=height,
-            highlightthickness=0, bd=0, bg=parent_bg,
+def parse_range(header, size):
+    """``(start, end)`` for a single-range ``Range`` header, None if invalid."""
+    m = re.fullmatch(r"bytes=(\d*)-(\d*)", header.strip())
+    if not m or not (m.group(1) or m.group(2)):
+        return None
+    if m.group(1):
+        start = int(m.group(1))
+        end = min(size, int(m.group(2)) + 1) if m.group(2) else size
+    else:
+        start, end = max(0, size - int(m.group(2))), size
+    return (start, end) if start < end else None
+
+
+class _RangeReader(io.RawIOBase):
+    def __init__(self, f, length):
+        self._f = f
+        self._left = length
+        self.decode_content = True
+
+    def readable(self):
+        return True
+
+    def readinto(self, buf):
+        if self._left <= 0:
+            return 0
+        n = self._f.readinto(memoryview(buf)[:self._left])
+        self._left -= n
+        return n
+
+    def close(self):
+        self._f.close()
+        super().close()
+
+
+class FileAdapter(BaseAdapter):
+    """Answers ``file://`` URLs like a Range-capable HTTP server.
+
+    Lets local mirror directories stand in anywhere a download URL does.
+    """
+
+    def send(self, request, stream=False, timeout=None, verify=True,
+             cert=None, proxies=None):
+        resp = requests.Response()
+        resp.url = request.url
+        resp.request = request
+        resp.connection = self
+        resp.raw = io.BytesIO()
+        path = urllib.request.url2pathname(
+            urllib.parse.urlsplit(request.url).path
         )
-        self._cw, self._ch = width, height
-        self._track = bg_track
-        self._fg = fg
-        self._target = 0.0
-        self._current = 0.0
-        self._animating = False
-        self._indeterminate = False
-        self._shimmer_x = -0.3
-        self._draw()
-
-    def _rounded_rect(self, x1, y1, x2, y2, r, fill):
-        if x2 - x1 < 2 * r:
-            r = max(0, (x2 - x1) // 2)
-        if r <= 0:
-            self.create_rectangle(x1, y1, x2, y2, fill=fill, outline=fill)
-            return
-        self.create_arc(x1, y1, x1 + 2 * r, y2, start=90, extent=180,
-                        fill=fill, outline=fill)
-        self.create_arc(x2 - 2 * r, y1, x2, y2, start=270, extent=180,
-                        fill=fill, outline=fill)
-        self.create_rectangle(x1 + r, y1, x2 - r, y2,
-                              fill=fill, outline=fill)
-
-    def _draw(self):
-        self.delete("all")
-        w, h = self._cw, self._ch
-        r = h // 2
-        self._rounded_rect(0, 0, w, h, r, self._track)
-        if self._indeterminate:
-            seg = int(w * 0.3)
-            x = int(self._shimmer_x * w)
-            x1 = max(0, x)
-            x2 = min(w, x + seg)
-            if x2 > x1:
-                self._rounded_rect(x1, 0, x2, h, r, self._fg)
+        try:
+            f = open(path, "rb")
+        except OSError as e:
+            resp.status_code = 404 if isinstance(e, FileNotFoundError) else 403
+            resp.reason = e.strerror
+            return resp
+        st = os.fstat(f.fileno())
+        start, end = 0, st.st_size
+        resp.status_code, resp.reason = 200, "OK"
+        rng = request.headers.get("Range")
+        if rng:
+            span = parse_range(rng, st.st_size)
+            if span is None:
+                f.close()
+                resp.status_code = 416
+                resp.reason = "Range Not Satisfiable"
+                return resp
+            start, end = span
+            resp.status_code, resp.reason = 206, "Partial Content"
+            resp.headers["Content-Range"] = (
+                f"bytes {start}-{end - 1}/{st.st_size}"
+            )
+        resp.headers["Content-Length"] = str(end - start)
+        resp.headers["ETag"] = f'"{st.st_size:x}-{st.st_mtime_ns:x}"'
+        if request.method == "HEAD":
+            f.close()
         else:
-            fw = int(self._current * w)
-            if fw > 0:
-                self._rounded_rect(0, 0, fw, h, r, self._fg)
-
-    def set_value(self, value):
-        self._indeterminate = False
-        self._target = max(0.0, min(1.0, value))
-        if not self._animating:
-            self._animating = True
-            self._tick()
-
-    def _tick(self):
-        if self._indeterminate:
-            self._shimmer_x += 0.02
-            if self._shimmer_x > 1.05:
-                self._shimmer_x = -0.3
-            self._draw()
-            self.after(30, self._tick)
-            return
-        delta = self._target - self._current
-        if abs(delta) < 0.002:
-            self._current = self._target
-            self._draw()
-            self._animating = False
-            return
-        self._current += delta * 0.25
-        self._draw()
-        self.after(16, self._tick)
+            f.seek(start)
+            resp.raw = _RangeReader(f, end - start)
+        return resp
 
-    def start_indeterminate(self):
-        self._indeterminate = True
-        self._shimmer_x = -0.3
-        if not self._animating:
-            self._animating = True
-            self._tick()
+    def close(self):
+        pass
 
-    def stop_indeterminate(self):
-        self._indeterminate = False
-        self._animating = False
-        self._current = 0.0
-        self._draw()
-
-    def update_colors(self, parent_bg, track, fg):
-        self._track = track
-        self._fg = fg
-        self.configure(bg=parent_bg)
-        self._draw()
-
-
-class ToggleSwitch(tk.Canvas):
-    """iOS-style sliding toggle for theme switching."""
-
-    def __init__(self, parent, parent_bg, track_off, track_on, knob,
-                 command=None, on=False):
-        super().__init__(
-            parent, width=44, height=24,
-            highlightthickness=0, bd=0, bg=parent_bg,
+
+def _count_request(r, *args, **kwargs):
+    if not r.url.startswith("file:"):
+        DIAGNOSTICS.incr("http_requests")
+
+
+HTTP_POOL_HOSTS = 8       # distinct hosts kept warm (GitHub API, CDN, …)
+HTTP_POOL_PER_HOST = 16   # ceiling on parallel connections to one host
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def http_session():
+    """The process-wide pooled session used for every network call."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            s = requests.Session()
+            adapter = PooledAdapter(pool_connections=HTTP_POOL_HOSTS,
+                                    pool_maxsize=HTTP_POOL_PER_HOST,
+                                    pool_block=True)
+            s.mount("https://", adapter)
+            s.mount("http://", adapter)
+            s.mount("file://", FileAdapter())
+            s.hooks["response"].append(_count_request)
+            _session = s
+        return _session
+
+
+def diagnostics_snapshot():
+    stats = DIAGNOSTICS.snapshot()
+    stats["http_connections_reused"] = max(
+        0, stats.get("http_requests", 0)
+        - stats.get("http_connections_opened", 0)
+    )
+    if stats.get("download_ms"):
+        stats["download_bytes_per_sec"] = (
+            stats.get("download_bytes", 0) * 1000 // stats["download_ms"]
         )
-        self._on = on
-        self._track_off = track_off
-        self._track_on = track_on
-        self._knob = knob
-        self._command = command
-        self.configure(cursor="hand2")
-        self._draw()
-        self.bind("<Button-1>", self._click)
-
-    def _draw(self):
-        self.delete("all")
-        track = self._track_on if self._on else self._track_off
-        self.create_arc(0, 0, 24, 24, start=90, extent=180,
-                        fill=track, outline=track)
-        self.create_arc(20, 0, 44, 24, start=270, extent=180,
-                        fill=track, outline=track)
-        self.create_rectangle(12, 0, 32, 24, fill=track, outline=track)
-        kx = 22 if self._on else 2
-        self.create_oval(kx, 2, kx + 20, 22,
-                         fill=self._knob, outline=self._knob)
-
-    def _click(self, _):
-        self._on = not self._on
-        self._draw()
-        if self._command:
-            self._command(self._on)
-
-    def update_colors(self, parent_bg, track_off, track_on, knob):
-        self._track_off = track_off
-        self._track_on = track_on
-        self._knob = knob
-        self.configure(bg=parent_bg)
-        self._draw()
-
-
-class PillNavItem(tk.Frame):
-    """Sidebar nav row with a pill-shaped active/hover background."""
-
-    HEIGHT = 38
-    RADIUS = 10
-    LEFT_PAD = 16
-
-    def __init__(self, parent, text, font, on_click=None):
-        super().__init__(parent, height=self.HEIGHT)
-        self.pack_propagate(False)
-        self._text = text
-        self._font = font
-        self._on_click = on_click
-        self._active = False
-        self._hover = False
-        self._colors = None
-
-        self._canvas = tk.Canvas(
-            self, height=self.HEIGHT,
-            highlightthickness=0, bd=0,
+    return stats
+
+
+class RequestPolicy:
+    """Bounded retries with jittered exponential backoff, plus hedging.
+
+    ``request`` retries connection errors, stalls (no bytes for ``stall``
+    seconds) and 429/5xx answers up to ``retries`` times, sleeping a random
+    time of up to ``backoff * 2**attempt`` seconds in between. With
+    ``hedge=True``, meant for idempotent metadata calls only, a second
+    identical request goes out when the first has not answered within
+    ``hedge_after`` seconds, and whichever answers first is used.
+    """
+
+    RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+    TRANSIENT_ERRORS = (
+        requests.ConnectionError,
+        requests.Timeout,
+        requests.exceptions.ChunkedEncodingError,
+        urllib3.exceptions.ProtocolError,
+        urllib3.exceptions.ReadTimeoutError,
+    )
+
+    def __init__(self, retries=3, backoff=0.5, max_backoff=8.0, connect=10,
+                 stall=10, hedge_after=1.0):
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.connect = connect
+        self.stall = stall
+        self.hedge_after = hedge_after
+
+    def delay(self, attempt):
+        """Seconds to wait before retry number ``attempt`` (from 0)."""
+        return random.uniform(
+            0, min(self.max_backoff, self.backoff * 2 ** attempt)
         )
-        self._canvas.pack(fill=tk.BOTH, expand=True)
-        self._canvas.bind("<Configure>", lambda e: self._draw())
-        self._canvas.bind("<Button-1>", self._click)
-        self._canvas.bind("<Enter>", self._enter)
-        self._canvas.bind("<Leave>", self._leave)
-
-    def _draw(self):
-        if not self._colors:
-            return
-        c = self._canvas
-        c.delete("all")
-        w = c.winfo_width()
-        h = self.HEIGHT
-        r = self.RADIUS
-        if w < 2 * r:
-            return
-
-        bg = self._colors["sidebar_bg"]
-        if self._active:
-            fill = self._colors["accent"]
-            text_color = "#ffffff"
-        elif self._hover:
-            fill = self._colors["nav_hover"]
-            text_color = self._colors["text"]
-        else:
-            fill = bg
-            text_color = self._colors["text_muted"]
 
-        c.configure(bg=bg)
-        self.configure(bg=bg)
+    def should_retry(self, error):
+        """Whether ``error`` is worth another try against the same URL."""
+        if isinstance(error, requests.HTTPError):
+            return (error.response is not None
+                    and error.response.status_code in self.RETRY_STATUSES)
+        return isinstance(error, self.TRANSIENT_ERRORS)
+
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def head(self, url, **kwargs):
+        return self.request("HEAD", url, **kwargs)
+
+    def request(self, method, url, hedge=False, **kwargs):
+        """Like ``http_session().request``; the last 429/5xx answer is
+        returned as is once retries run out, so callers still see it."""
+        kwargs.setdefault("timeout", (self.connect, self.stall))
+        send = self._hedged if hedge else self._send
+        for attempt in itertools.count():
+            try:
+                r = send(method, url, kwargs)
+            except Exception as e:
+                if attempt >= self.retries or not self.should_retry(e):
+                    raise
+            else:
+                if (attempt >= self.retries
+                        or r.status_code not in self.RETRY_STATUSES):
+                    return r
+                r.close()
+            DIAGNOSTICS.incr("http_retries")
+            time.sleep(self.delay(attempt))
 
-        if fill != bg:
-            c.create_arc(0, 0, 2 * r, 2 * r, start=90, extent=90,
-                         fill=fill, outline=fill)
-            c.create_arc(w - 2 * r, 0, w, 2 * r, start=0, extent=90,
-                         fill=fill, outline=fill)
-            c.create_arc(0, h - 2 * r, 2 * r, h, start=180, extent=90,
-                         fill=fill, outline=fill)
-            c.create_arc(w - 2 * r, h - 2 * r, w, h, start=270, extent=90,
-                         fill=fill, outline=fill)
-            c.create_rectangle(r, 0, w - r, h, fill=fill, outline=fill)
-            c.create_rectangle(0, r, w, h - r, fill=fill, outline=fill)
+    @staticmethod
+    def _send(method, url, kwargs):
+        return http_session().request(method, url, **kwargs)
 
-        c.create_text(self.LEFT_PAD, h // 2, text=self._text,
-                      fill=text_color, anchor="w", font=self._font)
+    def _spawn(self, method, url, kwargs):
+        # Daemon threads, so a hung loser never holds up interpreter exit.
+        future = concurrent.futures.Future()
 
-    def set_active(self, active):
-        self._active = active
-        self._draw()
+        def run():
+            try:
+                future.set_result(self._send(method, url, kwargs))
+            except Exception as e:
+                future.set_exception(e)
+
+        threading.Thread(target=run, daemon=True).start()
+        return future
+
+    def _hedged(self, method, url, kwargs):
+        first = self._spawn(method, url, kwargs)
+        done, pending = concurrent.futures.wait([first],
+                                                timeout=self.hedge_after)
+        if not done:
+            DIAGNOSTICS.incr("http_hedges")
+            pending.add(self._spawn(method, url, kwargs))
+        error = None
+        while True:
+            for future in done:
+                try:
+                    r = future.result()
+                except Exception as e:
+                    error = e
+                    continue
+                if future is not first:
+                    DIAGNOSTICS.incr("http_hedge_wins")
+                for loser in pending:
+                    loser.add_done_callback(_close_response)
+                return r
+            if not pending:
+                raise error
+            done, pending = concurrent.futures.wait(
+                pending, return_when=concurrent.futures.FIRST_COMPLETED
+            )
 
-    def _enter(self, _):
-        self._hover = True
-        self._canvas.configure(cursor="hand2")
-        self._draw()
 
-    def _leave(self, _):
-        self._hover = False
-        self._draw()
+def _close_response(future):
+    if future.exception() is None:
+        future.result().close()
 
-    def _click(self, _):
-        if self._on_click:
-            self._on_click()
 
-    def update_colors(self, colors):
-        self._colors = colors
-        self._draw()
+REQUEST_POLICY = RequestPolicy()
 
 
 # ---------------------------------------------------------------------------
-# Themes
+# Release lookup
 # ---------------------------------------------------------------------------
 
-THEMES = {
-    "light": {
-        "bg":             "#f4f1fb",
-        "sidebar_bg":     "#ffffff",
-        "card_bg":        "#ffffff",
-        "card_alt":       "#faf9ff",
-        "border":         "#ecebf3",
-        "text":           "#1a1a2e",
-        "text_muted":     "#6b6b80",
-        "text_dim":       "#a0a0b0",
-        "accent":         "#ff6b3d",
-        "accent_hover":   "#ff8559",
-        "accent_active":  "#e55a2e",
-        "accent_soft":    "#fff1eb",
-        "secondary":      "#7c6ef0",
-        "secondary_soft": "#efedff",
-        "track":          "#ecebf3",
-        "success":        "#22c55e",
-        "error":          "#ef4444",
-        "nav_hover":      "#f5f3ff",
-        "toggle_off":     "#dcd9e8",
-        "toggle_on":      "#ff6b3d",
-        "toggle_knob":    "#ffffff",
-        "cta_grad_a":     "#7c6ef0",
-        "cta_grad_b":     "#a594ff",
-    },
-    "dark": {
-        "bg":             "#0e0c14",
-        "sidebar_bg":     "#15131c",
-        "card_bg":        "#1a1822",
-        "card_alt":       "#211e2c",
-        "border":         "#2a2734",
-        "text":           "#f4f1ee",
-        "text_muted":     "#a39ab0",
-        "text_dim":       "#6b6673",
-        "accent":         "#ff6b3d",
-        "accent_hover":   "#ff8559",
-        "accent_active":  "#e55a2e",
-        "accent_soft":    "#2a1d18",
-        "secondary":      "#9787f5",
-        "secondary_soft": "#1f1b2e",
-        "track":          "#2a2734",
-        "success":        "#4ade80",
-        "error":          "#f87171",
-        "nav_hover":      "#211e2c",
-        "toggle_off":     "#2a2734",
-        "toggle_on":      "#ff6b3d",
-        "toggle_knob":    "#f4f1ee",
-        "cta_grad_a":     "#5b4fc7",
-        "cta_grad_b":     "#7c6ef0",
-    },
-}
-
+RELEASE_API = "https://api.github.com/repos/CYFARE/HellFire/releases/latest"
+INSTALL_DIR = Path.home() / "HellFire"
+DOWNLOAD_DIR = Path.home() / "Downloads"
+ARCHIVE_KEYWORD = "hellfire"
 
-# ---------------------------------------------------------------------------
-# Main installer
-# ---------------------------------------------------------------------------
 
-class HellFireInstallerTk:
-    WINDOW_W = 1024
-    WINDOW_H = 660
-    SIDEBAR_W = 220
-    PADDING = 24
+def find_cached_archives(keyword=ARCHIVE_KEYWORD):
+    """Local ``<keyword>*.tar.xz`` archives in the usual download spots."""
+    candidates = []
+    for loc in [".", str(Path.home()), str(DOWNLOAD_DIR)]:
+        candidates += glob.glob(os.path.join(loc, f"{keyword}*.tar.xz"))
+    return candidates
 
-    def __init__(self, root):
-        self.root = root
-        self.root.title("HellFire Installer")
-        self.root.geometry(f"{self.WINDOW_W}x{self.WINDOW_H}")
-        self.root.resizable(False, False)
-        self._center_window()
-
-        self.theme_name = "dark"
-        self.colors = THEMES[self.theme_name]
-        self._themed_widgets = []
-        self._themed_custom = []
-
-        self.root.configure(bg=self.colors["bg"])
-
-        self.keyword = "hellfire"
-        self.base_dir = Path.home() / "HellFire"
-        self.firefox_bin = self.base_dir / "firefox" / "firefox"
-        self.user_bin = Path.home() / ".local" / "bin"
-        self.user_bin_symlink = self.user_bin / "hellfire"
-        self.desktop_file_path = (
-            Path.home() / ".local/share/applications/hellfire.desktop"
-        )
-        self.file_to_extract = None
-        self.avatar_image = None
-        self._installed = False
-
-        self.hero_image_url = "https://github.com/CYFARE.png?size=256"
-        self.social_links = {
-            "GitHub":  "https://github.com/CYFARE/HellFire",
-            "Twitter": "https://x.com/cyfarelabs",
-            "Website": "https://cyfare.net/",
-        }
 
-        self.fonts = {
-            "logo":      pick_font(SANS_BOLD_PREFERENCES, 16, "bold"),
-            "title":     pick_font(SANS_BOLD_PREFERENCES, 22, "bold"),
-            "subtitle":  pick_font(SANS_PREFERENCES, 11, "normal"),
-            "body":      pick_font(SANS_PREFERENCES, 10, "normal"),
-            "body_bold": pick_font(SANS_BOLD_PREFERENCES, 10, "bold"),
-            "small":     pick_font(SANS_PREFERENCES, 9, "normal"),
-            "tiny":      pick_font(SANS_PREFERENCES, 8, "normal"),
-            "section":   pick_font(SANS_BOLD_PREFERENCES, 8, "bold"),
-            "nav":       pick_font(SANS_PREFERENCES, 11, "normal"),
-            "stat_num":  pick_font(SANS_BOLD_PREFERENCES, 18, "bold"),
-            "card_h":    pick_font(SANS_BOLD_PREFERENCES, 13, "bold"),
-            "btn":       pick_font(SANS_BOLD_PREFERENCES, 11, "bold"),
-            "cta_h":     pick_font(SANS_BOLD_PREFERENCES, 17, "bold"),
-            "cta_b":     pick_font(SANS_PREFERENCES, 11, "normal"),
-        }
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME")
+                 or Path.home() / ".cache") / "hellfire"
 
-        self._stats = {
-            "source": ("Source", "—", "Awaiting"),
-            "size":   ("Size",   "—", "Pending"),
-            "files":  ("Files",  "—", "Pending"),
-            "status": ("Status", "Ready", "Click install"),
-        }
-        self._stat_widgets = {}
 
-        self._build_ui()
-        self._load_avatar()
-        threading.Thread(target=self._refresh_stats, daemon=True).start()
+class ReleaseMetadata:
+    """Latest-release JSON cached on disk and revalidated with its ETag.
 
-    # ----- window helpers ----------------------------------------------------
+    Copies younger than ``ttl`` seconds are served without any request;
+    older ones are revalidated with ``If-None-Match`` so an unchanged
+    release costs a bodiless 304. Concurrent callers share one fetch, and
+    a stale copy is served when GitHub errors out (e.g. a 403 rate limit).
+    """
 
-    def _center_window(self):
-        self.root.update_idletasks()
-        x = (self.root.winfo_screenwidth() - self.WINDOW_W) // 2
-        y = (self.root.winfo_screenheight() - self.WINDOW_H) // 2
-        self.root.geometry(f"{self.WINDOW_W}x{self.WINDOW_H}+{x}+{y}")
+    TTL = 600
 
-    # ----- theme system ------------------------------------------------------
+    def __init__(self, path=None, ttl=None):
+        self.path = Path(path or CACHE_DIR / "release.json")
+        self.ttl = self.TTL if ttl is None else ttl
+        self._lock = threading.Lock()
 
-    def _theme(self, widget, **roles):
-        self._themed_widgets.append((widget, roles))
-        self._apply_theme_to(widget, roles)
+    def get(self):
+        with self._lock:
+            cached = self._load()
+            now = time.time()
+            if cached and now - cached["fetched_at"] < self.ttl:
+                DIAGNOSTICS.incr("release_cache_hits")
+                return cached["release"]
+            headers = {}
+            if cached and cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            try:
+                r = REQUEST_POLICY.get(RELEASE_API, headers=headers,
+                                       hedge=True)
+                if r.status_code == 304 and cached:
+                    DIAGNOSTICS.incr("release_cache_revalidated")
+                    self._save(cached["release"], cached.get("etag"), now)
+                    return cached["release"]
+                r.raise_for_status()
+                release = r.json()
+            except Exception:
+                if cached:
+                    DIAGNOSTICS.incr("release_cache_stale")
+                    return cached["release"]
+                raise
+            DIAGNOSTICS.incr("release_cache_misses")
+            self._save(release, r.headers.get("etag"), now)
+            return release
+
+    def _load(self):
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            if isinstance(data.get("release"), dict):
+                return data
+        except (OSError, ValueError, AttributeError):
+            pass
+        return None
 
-    def _apply_theme_to(self, widget, roles):
+    def _save(self, release, etag, fetched_at):
         try:
-            widget.configure(**{
-                opt: self.colors[role] for opt, role in roles.items()
-            })
-        except tk.TclError:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_name(self.path.name + ".tmp")
+            tmp.write_text(json.dumps({
+                "etag": etag, "fetched_at": fetched_at, "release": release,
+            }), encoding="utf-8")
+            os.replace(tmp, self.path)
+        except OSError:
             pass
 
-    def _theme_custom(self, fn):
-        self._themed_custom.append(fn)
-        fn(self.colors)
 
-    def _toggle_theme(self, is_dark):
-        self.theme_name = "dark" if is_dark else "light"
-        self.colors = THEMES[self.theme_name]
-        self.root.configure(bg=self.colors["bg"])
-        for widget, roles in self._themed_widgets:
-            self._apply_theme_to(widget, roles)
-        for fn in self._themed_custom:
-            fn(self.colors)
+RELEASE_METADATA = ReleaseMetadata()
 
-    # ----- UI construction ---------------------------------------------------
 
-    def _build_ui(self):
-        self.outer = tk.Frame(self.root)
-        self._theme(self.outer, bg="bg")
-        self.outer.pack(fill=tk.BOTH, expand=True)
+def latest_release_asset():
+    """``(url, name)`` of the newest .tar.xz release asset, or (None, None)."""
+    for a in RELEASE_METADATA.get().get("assets", []):
+        if a.get("name", "").endswith(".tar.xz"):
+            return a.get("browser_download_url"), a.get("name")
+    return None, None
 
-        self._build_sidebar(self.outer)
 
-        self.main_area = tk.Frame(self.outer)
-        self._theme(self.main_area, bg="bg")
-        self.main_area.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        self._build_main(self.main_area)
+VERSION_RE = re.compile(r"\d+\.\d+(?:\.\d+)?(?:[ab]\d+)?")
 
-    # ----- sidebar -----------------------------------------------------------
 
-    def _build_sidebar(self, parent):
-        self.sidebar = tk.Frame(parent, width=self.SIDEBAR_W)
-        self.sidebar.pack_propagate(False)
-        self.sidebar.pack(side=tk.LEFT, fill=tk.Y)
-        self._theme(self.sidebar, bg="sidebar_bg")
+def parse_application_ini(text):
+    """``{"version", "build_id"}`` from Firefox's application.ini."""
+    parser = configparser.ConfigParser(interpolation=None, strict=False)
+    parser.read_string(text)
+    if not parser.has_option("App", "Version"):
+        return None
+    return {
+        "version": parser.get("App", "Version"),
+        "build_id": parser.get("App", "BuildID", fallback=None),
+    }
 
-        logo_frame = tk.Frame(self.sidebar, height=80)
-        logo_frame.pack(fill=tk.X, padx=24, pady=(28, 28))
-        self._theme(logo_frame, bg="sidebar_bg")
 
-        logo_a = tk.Label(logo_frame, text="HELL", font=self.fonts["logo"])
-        logo_a.pack(side=tk.LEFT)
-        self._theme(logo_a, bg="sidebar_bg", fg="text")
+def installed_version(install_dir=INSTALL_DIR):
+    try:
+        text = (Path(install_dir) / "firefox" / "application.ini").read_text(
+            encoding="utf-8", errors="replace")
+        return parse_application_ini(text)
+    except (OSError, configparser.Error):
+        return None
 
-        logo_b = tk.Label(logo_frame, text="FIRE", font=self.fonts["logo"])
-        logo_b.pack(side=tk.LEFT)
-        self._theme(logo_b, bg="sidebar_bg", fg="accent")
 
-        # Only Install nav — About and Settings removed (no features behind them)
-        nav_data = [("Install", True)]
-        self._nav_items = []
-        for label, active in nav_data:
-            item = PillNavItem(
-                self.sidebar, text=label,
-                font=self.fonts["nav"],
-                on_click=lambda l=label: self._on_nav_click(l),
-            )
-            item.pack(fill=tk.X, padx=14, pady=2)
-            item.set_active(active)
-            self._theme_custom(item.update_colors)
-            self._nav_items.append((label, item))
-
-        section_lbl = tk.Label(
-            self.sidebar, text="OTHER LINKS",
-            font=self.fonts["section"], anchor="w",
-        )
-        section_lbl.pack(fill=tk.X, padx=24, pady=(28, 8))
-        self._theme(section_lbl, bg="sidebar_bg", fg="text_dim")
-
-        for name, url in self.social_links.items():
-            item = PillNavItem(
-                self.sidebar, text=name,
-                font=self.fonts["nav"],
-                on_click=lambda u=url: webbrowser.open(u),
-            )
-            item.pack(fill=tk.X, padx=14, pady=2)
-            self._theme_custom(item.update_colors)
-
-        spacer = tk.Frame(self.sidebar)
-        spacer.pack(fill=tk.BOTH, expand=True)
-        self._theme(spacer, bg="sidebar_bg")
-
-        toggle_row = tk.Frame(self.sidebar)
-        toggle_row.pack(fill=tk.X, padx=24, pady=(12, 28))
-        self._theme(toggle_row, bg="sidebar_bg")
-
-        sun = tk.Label(toggle_row, text="☀", font=self.fonts["body_bold"])
-        sun.pack(side=tk.LEFT)
-        self._theme(sun, bg="sidebar_bg", fg="text_muted")
-
-        self.theme_toggle = ToggleSwitch(
-            toggle_row,
-            parent_bg=self.colors["sidebar_bg"],
-            track_off=self.colors["toggle_off"],
-            track_on=self.colors["toggle_on"],
-            knob=self.colors["toggle_knob"],
-            on=(self.theme_name == "dark"),
-            command=self._toggle_theme,
-        )
-        self.theme_toggle.pack(side=tk.LEFT, padx=10)
-
-        def _update_toggle(colors):
-            self.theme_toggle.update_colors(
-                parent_bg=colors["sidebar_bg"],
-                track_off=colors["toggle_off"],
-                track_on=colors["toggle_on"],
-                knob=colors["toggle_knob"],
-            )
-        self._theme_custom(_update_toggle)
-
-        moon = tk.Label(toggle_row, text="☾", font=self.fonts["body_bold"])
-        moon.pack(side=tk.LEFT)
-        self._theme(moon, bg="sidebar_bg", fg="text_muted")
-
-    def _on_nav_click(self, label):
-        for name, item in self._nav_items:
-            item.set_active(name == label)
-
-    # ----- main area --------------------------------------------------------
-
-    def _build_main(self, parent):
-        wrap = tk.Frame(parent)
-        wrap.pack(fill=tk.BOTH, expand=True, padx=self.PADDING, pady=(16, 20))
-        self._theme(wrap, bg="bg")
-
-        self._build_header(wrap)
-
-        spacer1 = tk.Frame(wrap, height=20)
-        self._theme(spacer1, bg="bg")
-        spacer1.pack(fill=tk.X)
-        self._build_stat_cards(wrap)
-
-        spacer2 = tk.Frame(wrap, height=16)
-        self._theme(spacer2, bg="bg")
-        spacer2.pack(fill=tk.X)
-        self._build_middle_row(wrap)
-
-        spacer3 = tk.Frame(wrap, height=16)
-        self._theme(spacer3, bg="bg")
-        spacer3.pack(fill=tk.X)
-        self._build_cta_card(wrap)
-
-    def _build_header(self, parent):
-        header = tk.Frame(parent, height=44)
-        header.pack(fill=tk.X)
-        header.pack_propagate(False)
-        self._theme(header, bg="bg")
-
-        left = tk.Frame(header)
-        left.pack(side=tk.LEFT, fill=tk.Y)
-        self._theme(left, bg="bg")
-
-        welcome = tk.Label(left, text="Welcome to ",
-                           font=self.fonts["title"])
-        welcome.pack(side=tk.LEFT)
-        self._theme(welcome, bg="bg", fg="text")
-
-        brand = tk.Label(left, text="HellFire", font=self.fonts["title"])
-        brand.pack(side=tk.LEFT)
-        self._theme(brand, bg="bg", fg="accent")
-
-        right = tk.Frame(header)
-        right.pack(side=tk.RIGHT, fill=tk.Y)
-        self._theme(right, bg="bg")
-
-        version_pill = RoundedFrame(
-            right, width=130, height=36,
-            parent_bg=self.colors["bg"],
-            card_bg=self.colors["card_bg"], radius=18,
-        )
-        version_pill.pack(side=tk.RIGHT, padx=(0, 4))
-
-        # Colored dot + text inside the pill
-        pill_inner = tk.Frame(version_pill.interior, bg=self.colors["card_bg"])
-        pill_inner.pack(expand=True)
-
-        dot = tk.Canvas(pill_inner, width=8, height=8,
-                        highlightthickness=0, bd=0,
-                        bg=self.colors["card_bg"])
-        dot.pack(side=tk.LEFT, padx=(0, 6))
-        dot.create_oval(0, 0, 8, 8, fill=self.colors["accent"], outline="")
-
-        def _upd_dot(colors):
-            dot.configure(bg=colors["card_bg"])
-            dot.delete("all")
-            dot.create_oval(0, 0, 8, 8, fill=colors["accent"], outline="")
-        self._theme_custom(_upd_dot)
-
-        ver_label = tk.Label(
-            pill_inner, text="Linux build",
-            font=self.fonts["small"], anchor="center",
-            bg=self.colors["card_bg"], fg=self.colors["text_muted"],
-        )
-        ver_label.pack(side=tk.LEFT)
-        self._theme(ver_label, bg="card_bg", fg="text_muted")
+def archive_version(path):
+    """Read application.ini from an archive, decompressing only up to it."""
+    with open(path, "rb") as f, tarfile.open(fileobj=f, mode="r|xz") as tar:
+        for member in tar:
+            if os.path.normpath(member.name) == "firefox/application.ini":
+                text = tar.extractfile(member).read().decode(
+                    "utf-8", errors="replace")
+                return parse_application_ini(text)
+    return None
 
-        def _upd_pill(colors):
-            version_pill.update_theme(colors["bg"], colors["card_bg"])
-            pill_inner.configure(bg=colors["card_bg"])
-        self._theme_custom(_upd_pill)
 
-    # ----- stat cards row ---------------------------------------------------
+def release_version():
+    """Firefox version the latest release is tagged with, or None."""
+    release = RELEASE_METADATA.get()
+    for text in (release.get("tag_name"), release.get("name")):
+        m = VERSION_RE.search(text or "")
+        if m:
+            return {"version": m.group(0), "build_id": None}
+    return None
 
-    def _build_stat_cards(self, parent):
-        row = tk.Frame(parent, height=98)
-        row.pack(fill=tk.X)
-        row.pack_propagate(False)
-        self._theme(row, bg="bg")
 
-        inner_w = self.WINDOW_W - self.SIDEBAR_W - 2 * self.PADDING
-        gap = 12
-        card_w = (inner_w - gap * 3) // 4
-        card_h = 98
+def same_version(installed, incoming):
+    if not installed or not incoming:
+        return False
+    if installed["version"] != incoming["version"]:
+        return False
+    return incoming["build_id"] is None \
+        or installed["build_id"] == incoming["build_id"]
 
-        keys = ["source", "size", "files", "status"]
-        accent_colors = ["accent", "secondary", "accent", "secondary"]
 
-        for i, (key, accent) in enumerate(zip(keys, accent_colors)):
-            label, value, sub = self._stats[key]
+def same_archive(manifest, name):
+    """Whether an install's manifest records asset ``name`` of the latest
+    release: by SHA-256 when both sides have one, else by asset name.
 
-            card = RoundedFrame(
-                row, width=card_w, height=card_h,
-                parent_bg=self.colors["bg"],
-                card_bg=self.colors["card_bg"], radius=14,
-            )
-            card.pack(side=tk.LEFT, padx=(0 if i == 0 else gap, 0))
+    Nightlies are re-released under the same version, so a version match
+    alone does not mean the install is current.
+    """
+    expected = published_sha256(name)
+    if expected and manifest.get("sha256"):
+        return manifest["sha256"] == expected
+    return manifest.get("source") == name
 
-            def _upd_card(colors, c=card):
-                c.update_theme(colors["bg"], colors["card_bg"])
-            self._theme_custom(_upd_card)
 
-            content = tk.Frame(card.interior)
-            content.pack(fill=tk.BOTH, expand=True, padx=10, pady=8)
-            self._theme(content, bg="card_bg")
+CHECKSUM_ASSETS = ("SHA256SUMS", "sha256sums.txt", "checksums.txt")
 
-            top = tk.Frame(content)
-            top.pack(fill=tk.X)
-            self._theme(top, bg="card_bg")
 
-            lbl = tk.Label(top, text=label, font=self.fonts["small"],
-                           anchor="w")
-            lbl.pack(side=tk.LEFT)
-            self._theme(lbl, bg="card_bg", fg="text_muted")
+def published_sha256(name):
+    """SHA-256 the latest release publishes for asset ``name``, or None.
 
-            dot = tk.Label(top, text="●", font=self.fonts["small"])
-            dot.pack(side=tk.RIGHT)
-            self._theme(dot, bg="card_bg", fg=accent)
+    Uses the asset's own ``digest`` field when GitHub provides one, else a
+    ``<name>.sha256`` or SHA256SUMS-style checksum asset.
+    """
+    try:
+        assets = RELEASE_METADATA.get().get("assets", [])
+    except Exception:
+        return None
+    for a in assets:
+        digest = a.get("digest") or ""
+        if a.get("name") == name and digest.startswith("sha256:"):
+            return digest.split(":", 1)[1].lower()
+    for a in assets:
+        if a.get("name") not in (name + ".sha256",) + CHECKSUM_ASSETS:
+            continue
+        try:
+            r = REQUEST_POLICY.get(a["browser_download_url"], hedge=True)
+            r.raise_for_status()
+        except Exception:
+            continue
+        for line in r.text.splitlines():
+            parts = line.split()
+            if len(parts) == 1 and a["name"] == name + ".sha256":
+                return parts[0].lower()
+            if len(parts) >= 2 and parts[-1].lstrip("*") == name:
+                return parts[0].lower()
+    return None
 
-            val = tk.Label(content, text=value,
-                           font=self.fonts["stat_num"], anchor="w")
-            val.pack(fill=tk.X, pady=(6, 0))
-            self._theme(val, bg="card_bg", fg="text")
 
-            sub_lbl = tk.Label(content, text=sub,
-                               font=self.fonts["tiny"], anchor="w")
-            sub_lbl.pack(fill=tk.X)
-            self._theme(sub_lbl, bg="card_bg", fg="text_dim")
+# ---------------------------------------------------------------------------
+# Download engine
+# ---------------------------------------------------------------------------
 
-            self._stat_widgets[key] = (val, sub_lbl)
+def parse_rate(text):
+    """Bytes per second from ``"500K"``, ``"2M"``, ``"1.5MB/s"`` or ``"0"``."""
+    m = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([kmg]?)(?:i?b)?(?:/s)?\s*",
+                     text, re.IGNORECASE)
+    if not m:
+        raise argparse.ArgumentTypeError(f"invalid rate: {text!r}")
+    scale = {"": 1, "k": 1024, "m": 1024 ** 2, "g": 1024 ** 3}
+    return int(float(m.group(1)) * scale[m.group(2).lower()])
+
+
+def format_rate(rate):
+    if not rate:
+        return "off"
+    if rate >= 1024 * 1024:
+        return f"{rate / (1024 * 1024):g} MB/s"
+    return f"{rate / 1024:g} KB/s"
+
+
+RATE_PRESETS = tuple(mb * 1024 * 1024 for mb in (0, 1, 2, 5, 10, 25, 50))
+
+
+class RateLimiter:
+    """Token bucket shared by every download stream, which also pauses them.
+
+    ``rate`` is in bytes per second (0 for unlimited) and may be changed
+    while transfers run. Streams call ``consume(n)`` after reading ``n``
+    bytes and wait until the bucket is out of debt; it holds at most
+    ``BURST_SECS`` worth of tokens, so the average stays at the cap.
+    """
+
+    BURST_SECS = 0.25
+
+    def __init__(self, rate=0):
+        self._cond = threading.Condition()
+        self._rate = max(0, rate)
+        self._tokens = 0.0
+        self._stamp = time.monotonic()
+        self.paused = False
+        self.pauses = 0
+
+    @property
+    def rate(self):
+        return self._rate
+
+    def set_rate(self, rate):
+        with self._cond:
+            self._refill()
+            self._rate = max(0, rate)
+            self._tokens = min(self._tokens, self._rate * self.BURST_SECS)
+            self._cond.notify_all()
+
+    def pause(self):
+        with self._cond:
+            if not self.paused:
+                self.paused = True
+                self.pauses += 1
+
+    def resume(self):
+        with self._cond:
+            self.paused = False
+            self._stamp = time.monotonic()
+            self._cond.notify_all()
+
+    def consume(self, n):
+        with self._cond:
+            while self.paused:
+                self._cond.wait()
+            self._refill()
+            self._tokens -= n
+            while True:
+                if self.paused:
+                    self._cond.wait()
+                    continue
+                if not self._rate:
+                    return
+                self._refill()
+                if self._tokens >= 0:
+                    return
+                self._cond.wait(-self._tokens / self._rate)
+
+    def _refill(self):
+        now = time.monotonic()
+        if not self.paused:
+            self._tokens = min(self._rate * self.BURST_SECS,
+                               self._tokens + (now - self._stamp) * self._rate)
+        self._stamp = now
+
+
+class SegmentedDownloader:
+    """Fetches a URL over concurrent HTTP Range requests into one file.
+
+    Bytes land in ``<dest>.part`` with a ``<dest>.part.json`` sidecar that
+    records the validators and completed ranges, so an interrupted run
+    resumes where it stopped. The part file is promoted to ``dest`` only
+    once complete. Falls back to a single stream when the server ignores
+    ``Range``. ``progress(done, total)`` is called from the worker threads,
+    one call at a time and in order.
+
+    A SHA-256 of the file is computed while it downloads: a hasher thread
+    follows the contiguous completed prefix, reading it back while it is
+    still in the page cache. ``sha256`` holds the hex digest after ``run``.
+
+    Each stream is read into one reusable buffer. The read size starts at
+    ``CHUNK`` and adapts to throughput, up to ``MAX_CHUNK``, so a fast link
+    costs only a few Python-level iterations per second.
+
+    A request that errors or sends nothing for ``STALL_SECS`` is retried
+    from where it stopped, with backoff, as ``policy`` allows. ``mirrors``
+    are further URLs for the same file, in preference order. Once a source
+    fails for good, the unfinished segments continue from the next one and
+    ``on_failover(url)`` is called. Given the expected ``digest``, partial
+    state is keyed by length and digest rather than by URL, so it survives
+    a source change. Segments go straight to where a source redirects; when
+    that target starts refusing (signed CDN URLs expire), it is resolved
+    again from the source before the source counts as failed.
+
+    An optional shared ``RateLimiter`` caps and pauses the transfer.
+    """
+
+    MIN_SEGMENT = 4 * 1024 * 1024
+    CHUNK = 64 * 1024
+    MAX_CHUNK = 8 * 1024 * 1024
+    READ_TARGET_SECS = 0.05
+    HASH_CHUNK = 1024 * 1024
+    CHECKPOINT_SECS = 1.0
+    STALL_SECS = 15
+
+    def __init__(self, url, dest, segments=4, progress=None, timeout=30,
+                 mirrors=(), digest=None, on_failover=None, limiter=None,
+                 policy=None):
+        self.url = url
+        self.limiter = limiter
+        self.policy = policy or REQUEST_POLICY
+        self.sources = [url, *mirrors]
+        self._resolved = {}
+        self.digest = digest
+        self.on_failover = on_failover
+        self._source = 0
+        self.dest = Path(dest)
+        self.part = self.dest.with_name(self.dest.name + ".part")
+        self.state_path = self.dest.with_name(self.dest.name + ".part.json")
+        self.segments = max(1, segments)
+        self.progress = progress
+        self.timeout = timeout
+        self.total = 0
+        self.done = 0
+        self.resumed = 0
+        self.sha256 = None
+        self.reads = 0
+        self._hash = hashlib.sha256()
+        self._hashed = 0
+        self._progressed = threading.Event()
+        self._finished = False
+        self._state = {}
+        self._pieces = []
+        self._last_checkpoint = 0.0
+        self._lock = threading.Lock()
+        self._abort = threading.Event()
+        self._errors = []
+
+    def run(self):
+        started = time.monotonic()
+        try:
+            return self._run()
+        finally:
+            DIAGNOSTICS.incr("download_ms",
+                             int((time.monotonic() - started) * 1000))
+            DIAGNOSTICS.incr("download_bytes", self.done - self.resumed)
+            DIAGNOSTICS.incr("download_reads", self.reads)
+
+    @property
+    def source(self):
+        """The URL currently being downloaded from."""
+        return self.sources[self._source]
+
+    def _run(self):
+        attempt = 0
+        while True:
+            source = self._source
+            try:
+                r = http_session().get(self.source,
+                                       headers={"Range": "bytes=0-0"},
+                                       stream=True, timeout=self.timeout)
+                r.raise_for_status()
+                break
+            except Exception as e:
+                attempt = self._next_attempt(e, attempt)
+                if attempt:
+                    continue
+                if self._fail_over(source) is None:
+                    raise
+        total = self._range_total(r)
+        if total is None:
+            # Range ignored: the probe response already carries the body,
+            # but it cannot be resumed, so any partial state is stale.
+            with r:
+                self._discard_partial()
+                self.total = int(r.headers.get("content-length", 0))
+                self._single_stream(r)
+            self.sha256 = self._hash.hexdigest()
+            return self._promote()
+        r.close()
+
+        self.total = total
+        if self.digest:
+            validators = {"total": total, "sha256": self.digest}
+        else:
+            validators = {
+                "url": self.url,
+                "etag": r.headers.get("etag"),
+                "last_modified": r.headers.get("last-modified"),
+                "total": total,
+            }
+        completed = self._load_partial(validators)
+        if completed is None:
+            self._discard_partial()
+            completed = []
+        self._state = dict(validators, completed=completed)
+        self.resumed = self.done = sum(e - s for s, e in completed)
+
+        # Skip the redirect hop on every segment.
+        self._resolved[self._source] = r.url
+        fd = os.open(self.part, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            if not completed:
+                self._preallocate(fd, total)
+            self._checkpoint()
+            self._pieces = [
+                [start, start, end]
+                for start, end in self._plan(self._missing(completed, total))
+            ]
+            workers = [
+                threading.Thread(target=self._segment_worker,
+                                 args=(fd, piece), daemon=True)
+                for piece in self._pieces
+            ]
+            hasher = threading.Thread(target=self._hash_worker, args=(fd,),
+                                      daemon=True)
+            hasher.start()
+            for t in workers:
+                t.start()
+            for t in workers:
+                t.join()
+            if not self._errors and any(offset < end
+                                        for _, offset, end in self._pieces):
+                # A worker died of something it does not record.
+                raise IOError("download stopped with segments unfinished")
+            self._finished = True
+            self._progressed.set()
+            hasher.join()
+        except BaseException:
+            # Interrupted, e.g. a cancelled prefetch: keep what landed.
+            self._abort.set()
+            raise
+        finally:
+            if self._abort.is_set():
+                with self._lock:
+                    self._checkpoint()
+            os.close(fd)
+        if self._errors:
+            raise self._errors[0]
+        self.sha256 = self._hash.hexdigest()
+        return self._promote()
+
+    # ----- partial state -----------------------------------------------------
+
+    def _load_partial(self, validators):
+        try:
+            state = json.loads(self.state_path.read_text(encoding="utf-8"))
+            if self.part.stat().st_size != validators["total"]:
+                return None
+        except (OSError, ValueError):
+            return None
+        for key, value in validators.items():
+            if state.get(key) != value:
+                return None
+        return self._merge([tuple(rng) for rng in state.get("completed", [])])
+
+    def _discard_partial(self):
+        for path in (self.part, self.state_path):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+
+    def _checkpoint(self):
+        """Persist completed ranges; callers hold ``_lock`` once running."""
+        done = self._state["completed"] + [
+            (start, offset) for start, offset, _ in self._pieces
+            if offset > start
+        ]
+        state = dict(self._state, completed=self._merge(done))
+        tmp = self.state_path.with_name(self.state_path.name + ".tmp")
+        tmp.write_text(json.dumps(state), encoding="utf-8")
+        os.replace(tmp, self.state_path)
+        self._last_checkpoint = time.monotonic()
+
+    def _promote(self):
+        os.replace(self.part, self.dest)
+        try:
+            self.state_path.unlink()
+        except FileNotFoundError:
+            pass
+        return self.dest
 
-    def _set_stat(self, key, value=None, sub=None):
-        def apply():
-            val_w, sub_w = self._stat_widgets[key]
-            if value is not None:
-                val_w.configure(text=value)
-            if sub is not None:
-                sub_w.configure(text=sub)
-        self.root.after(0, apply)
-
-    # ----- middle row: progress + about -------------------------------------
-
-    def _build_middle_row(self, parent):
-        row = tk.Frame(parent, height=236)
-        row.pack(fill=tk.X)
-        row.pack_propagate(False)
-        self._theme(row, bg="bg")
-
-        inner_w = self.WINDOW_W - self.SIDEBAR_W - 2 * self.PADDING
-        gap = 12
-        progress_w = int(inner_w * 0.66)
-        about_w = inner_w - progress_w - gap
-
-        self._build_progress_card(row, progress_w, 236)
-        spacer = tk.Frame(row, width=gap)
-        spacer.pack(side=tk.LEFT)
-        self._theme(spacer, bg="bg")
-        self._build_about_card(row, about_w, 236)
-
-    def _build_progress_card(self, parent, w, h):
-        card = RoundedFrame(
-            parent, width=w, height=h,
-            parent_bg=self.colors["bg"],
-            card_bg=self.colors["card_bg"], radius=14,
-        )
-        card.pack(side=tk.LEFT)
-
-        def _upd(colors):
-            card.update_theme(colors["bg"], colors["card_bg"])
-        self._theme_custom(_upd)
-
-        body = tk.Frame(card.interior)
-        body.pack(fill=tk.BOTH, expand=True, padx=14, pady=10)
-        self._theme(body, bg="card_bg")
-
-        head = tk.Frame(body)
-        head.pack(fill=tk.X)
-        self._theme(head, bg="card_bg")
-
-        title = tk.Label(head, text="Installation",
-                         font=self.fonts["card_h"], anchor="w")
-        title.pack(side=tk.LEFT)
-        self._theme(title, bg="card_bg", fg="text")
-
-        self.percent_label = tk.Label(head, text="",
-                                      font=self.fonts["body_bold"])
-        self.percent_label.pack(side=tk.RIGHT)
-        self._theme(self.percent_label, bg="card_bg", fg="text_muted")
-
-        sub = tk.Label(
-            body,
-            text="Custom-compiled Firefox build, installed to your home folder.",
-            font=self.fonts["small"], anchor="w", justify="left",
-        )
-        sub.pack(fill=tk.X, pady=(4, 12))
-        self._theme(sub, bg="card_bg", fg="text_muted")
+    # ----- range bookkeeping -------------------------------------------------
 
-        status_row = tk.Frame(body)
-        status_row.pack(fill=tk.X, pady=(0, 6))
-        self._theme(status_row, bg="card_bg")
+    @staticmethod
+    def _range_total(r):
+        if r.status_code != 206:
+            return None
+        m = re.match(r"bytes\s+\d+-\d+/(\d+)",
+                     r.headers.get("content-range", ""))
+        return int(m.group(1)) if m else None
 
-        self.status_dot = tk.Canvas(
-            status_row, width=10, height=10,
-            highlightthickness=0, bd=0,
-        )
-        self.status_dot.pack(side=tk.LEFT, padx=(0, 10))
-        self._set_status_dot(self.colors["text_dim"])
+    @staticmethod
+    def _merge(ranges):
+        merged = []
+        for start, end in sorted(ranges):
+            if merged and start <= merged[-1][1]:
+                merged[-1][1] = max(merged[-1][1], end)
+            else:
+                merged.append([start, end])
+        return [tuple(rng) for rng in merged]
 
-        def _upd_dot(colors):
-            self.status_dot.configure(bg=colors["card_bg"])
-        self._theme_custom(_upd_dot)
+    @staticmethod
+    def _missing(completed, total):
+        gaps, pos = [], 0
+        for start, end in completed:
+            if start > pos:
+                gaps.append((pos, start))
+            pos = max(pos, end)
+        if pos < total:
+            gaps.append((pos, total))
+        return gaps
+
+    def _plan(self, gaps):
+        """Split the missing ``[start, end)`` gaps into up to N pieces."""
+        pieces = list(gaps)
+        while len(pieces) < self.segments:
+            start, end = max(pieces, key=lambda p: p[1] - p[0],
+                             default=(0, 0))
+            if end - start < 2 * self.MIN_SEGMENT:
+                break
+            mid = start + (end - start) // 2
+            pieces.remove((start, end))
+            pieces += [(start, mid), (mid, end)]
+        return sorted(pieces)
 
-        self.status_label = tk.Label(
-            status_row, text="Ready to install",
-            font=self.fonts["body"], anchor="w",
-        )
-        self.status_label.pack(side=tk.LEFT, fill=tk.X, expand=True)
-        self._theme(self.status_label, bg="card_bg", fg="text")
-
-        bar_w = w - 2 * 14 - 28
-        self.progress = SmoothProgressBar(
-            body, width=bar_w, height=6,
-            bg_track=self.colors["track"],
-            fg=self.colors["accent"],
-            parent_bg=self.colors["card_bg"],
-        )
-        self.progress.pack(fill=tk.X, pady=(0, 10))
+    @staticmethod
+    def _preallocate(fd, total):
+        try:
+            os.posix_fallocate(fd, 0, total)
+        except (AttributeError, OSError):
+            os.ftruncate(fd, total)
+
+    # ----- transfer ----------------------------------------------------------
+
+    def _advance(self, n, piece=None):
+        with self._lock:
+            self.done += n
+            if piece is not None:
+                piece[1] += n
+                if (time.monotonic() - self._last_checkpoint
+                        >= self.CHECKPOINT_SECS):
+                    self._checkpoint()
+            if self.progress:
+                self.progress(self.done, self.total)
+        self._progressed.set()
+
+    def _pump(self, r, write):
+        """Feed the body of ``r`` to ``write(view)``; returns bytes read.
+
+        The view is only valid during the call. The read size doubles while
+        reads come back full within half of ``READ_TARGET_SECS`` and halves
+        when one takes more than twice that.
+        """
+        r.raw.decode_content = True
+        buf = memoryview(bytearray(self.CHUNK))
+        size = self.CHUNK
+        count = reads = 0
+        limiter = self.limiter
+        try:
+            while not self._abort.is_set():
+                if limiter is not None and limiter.rate:
+                    # Keep reads near an eighth of a second at the cap.
+                    size = min(size, max(self.CHUNK, limiter.rate // 8))
+                if size > len(buf):
+                    buf = memoryview(bytearray(size))
+                began = time.monotonic()
+                n = r.raw.readinto(buf[:size])
+                if not n:
+                    break
+                write(buf[:n])
+                count += n
+                reads += 1
+                elapsed = time.monotonic() - began
+                if n == size and elapsed < self.READ_TARGET_SECS / 2:
+                    size = min(size * 2, self.MAX_CHUNK)
+                elif elapsed > self.READ_TARGET_SECS * 2:
+                    size = max(size // 2, self.CHUNK)
+                if limiter is not None:
+                    limiter.consume(n)
+        finally:
+            # Segment threads pump concurrently; tally once, under the lock.
+            with self._lock:
+                self.reads += reads
+        return count
+
+    def _single_stream(self, r):
+        with open(self.part, "wb") as f:
+            def write(view):
+                f.write(view)
+                self._hash.update(view)
+                self._advance(len(view))
+            self._pump(r, write)
+
+    def _contiguous_end(self):
+        done = self._state["completed"] + [
+            (start, offset) for start, offset, _ in self._pieces
+        ]
+        merged = self._merge(done)
+        return merged[0][1] if merged and merged[0][0] == 0 else 0
+
+    def _hash_worker(self, fd):
+        while not self._abort.is_set():
+            self._progressed.wait(0.5)
+            self._progressed.clear()
+            finished = self._finished
+            with self._lock:
+                end = self._contiguous_end()
+            while self._hashed < end and not self._abort.is_set():
+                size = min(self.HASH_CHUNK, end - self._hashed)
+                data = os.pread(fd, size, self._hashed)
+                if not data:
+                    break
+                self._hash.update(data)
+                self._hashed += len(data)
+            if finished:
+                return
 
-        def _upd_bar(colors):
-            self.progress.update_colors(
-                colors["card_bg"], colors["track"], colors["accent"]
+    def _next_attempt(self, error, attempt):
+        """Back off and return ``attempt + 1`` when ``error`` is worth
+        retrying on the same source, else 0."""
+        if attempt >= self.policy.retries \
+                or not self.policy.should_retry(error):
+            return 0
+        DIAGNOSTICS.incr("download_retries")
+        self._abort.wait(self.policy.delay(attempt))
+        return attempt + 1
+
+    def _segment_worker(self, fd, piece):
+        source = self._source
+        attempt = 0
+        refreshed = False
+        while True:
+            pauses = self.limiter.pauses if self.limiter else 0
+            offset = piece[1]
+            try:
+                self._fetch_piece(source, fd, piece)
+                return
+            except Exception as e:
+                if self._abort.is_set():
+                    return
+                if self.limiter and self.limiter.pauses != pauses:
+                    continue  # the server dropped us while paused; reopen
+                if piece[1] != offset:
+                    # It was moving; budget retries afresh.
+                    attempt, refreshed = 0, False
+                if not refreshed and self._expire(source, e):
+                    refreshed = True
+                    continue
+                attempt = self._next_attempt(e, attempt)
+                if attempt:
+                    continue
+                source = self._fail_over(source)
+                if source is None:
+                    self._errors.append(e)
+                    self._abort.set()
+                    return
+
+    def _fetch_piece(self, source, fd, piece):
+        start, _, end = piece
+        if piece[1] >= end:
+            return
+        url = self._resolved.get(source, self.sources[source])
+        headers = {"Range": f"bytes={piece[1]}-{end - 1}"}
+        with http_session().get(url, headers=headers, stream=True,
+                                timeout=(self.timeout, self.STALL_SECS)) as r:
+            r.raise_for_status()
+            if r.history:
+                self._resolved[source] = r.url
+            if r.status_code != 206:
+                raise IOError("server stopped honouring Range requests")
+            if self._range_total(r) != self.total:
+                raise IOError(f"{url} serves a different file")
+
+            def write(view):
+                os.pwrite(fd, view, piece[1])
+                self._advance(len(view), piece)
+
+            self._pump(r, write)
+        if not self._abort.is_set() and piece[1] != end:
+            raise requests.ConnectionError(
+                f"segment {start}-{end - 1} ended early"
             )
-        self._theme_custom(_upd_bar)
 
-        path_note = tk.Label(
-            body,
-            text=f"📁  Installs to  {self._tilde(self.base_dir)}",
-            font=self.fonts["small"], anchor="w",
-        )
-        path_note.pack(fill=tk.X, pady=(0, 10))
-        self._theme(path_note, bg="card_bg", fg="text_dim")
-
-        self.action_button = RoundedButton(
-            body, text="Install HellFire",
-            command=self._on_action_clicked,
-            width=170, height=42, radius=21,
-            bg=self.colors["accent"],
-            hover_bg=self.colors["accent_hover"],
-            active_bg=self.colors["accent_active"],
-            disabled_bg=self.colors["track"],
-            disabled_fg=self.colors["text_dim"],
-            fg="white",
-            font=self.fonts["btn"],
-            parent_bg=self.colors["card_bg"],
-        )
-        self.action_button.pack(anchor="w")
-
-        def _upd_btn(colors):
-            self.action_button.update_colors(
-                parent_bg=colors["card_bg"],
-                bg=colors["accent"],
-                hover_bg=colors["accent_hover"],
-                active_bg=colors["accent_active"],
-                disabled_bg=colors["track"],
-                disabled_fg=colors["text_dim"],
-                fg="white",
-            )
-        self._theme_custom(_upd_btn)
+    def _expire(self, source, error):
+        """Forget the redirect target of ``source`` if ``error`` is a 4xx
+        from it; returns whether the next request should resolve again."""
+        response = getattr(error, "response", None)
+        if response is None or not 400 <= response.status_code < 500:
+            return False
+        with self._lock:
+            return self._resolved.pop(source, None) is not None
+
+    def _fail_over(self, failed):
+        """Move past source index ``failed``; returns the index to use now,
+        or None when every source has failed."""
+        with self._lock:
+            if self._source != failed:
+                return self._source  # another worker already switched
+            if failed + 1 >= len(self.sources):
+                return None
+            self._source = failed + 1
+        DIAGNOSTICS.incr("download_failovers")
+        if self.on_failover:
+            self.on_failover(self.source)
+        return failed + 1
+
+
+class CountingReader:
+    """Read-only file wrapper that reports how many bytes were consumed.
+
+    An optional ``hasher`` (e.g. ``hashlib.sha256()``) sees every byte and
+    an optional ``RateLimiter`` paces the reads.
+    """
+
+    def __init__(self, raw, callback=None, hasher=None, limiter=None):
+        self._raw = raw
+        self._callback = callback
+        self.hasher = hasher
+        self.limiter = limiter
+        self.count = 0
+
+    def read(self, size=-1):
+        data = self._raw.read(size)
+        if data:
+            self.count += len(data)
+            if self.limiter is not None:
+                self.limiter.consume(len(data))
+            if self.hasher is not None:
+                self.hasher.update(data)
+            if self._callback:
+                self._callback(self.count)
+        return data
+
+
+PROBE_BYTES = 256 * 1024
+
+
+def probe_source(url, nbytes=PROBE_BYTES, timeout=10):
+    """Time a small ranged GET; returns ``(estimate_secs, total)``.
+
+    The estimate for fetching the whole file is the time to first byte
+    plus the total size over the throughput the probe saw.
+    """
+    started = time.monotonic()
+    headers = {"Range": f"bytes=0-{nbytes - 1}"}
+    with http_session().get(url, headers=headers, stream=True,
+                            timeout=timeout) as r:
+        r.raise_for_status()
+        ttfb = time.monotonic() - started
+        total = SegmentedDownloader._range_total(r)
+        if total is None:
+            total = int(r.headers.get("content-length", 0))
+        got = 0
+        for chunk in r.iter_content(chunk_size=64 * 1024):
+            got += len(chunk)
+            if got >= nbytes:
+                break
+        elapsed = time.monotonic() - started - ttfb
+    rate = got / max(elapsed, 1e-6)
+    return ttfb + total / max(rate, 1.0), total
+
+
+def rank_sources(urls):
+    """Probe ``urls`` concurrently and return them fastest first.
+
+    Sources that fail the probe, or whose size differs from the first
+    responsive source in the given order, are left out.
+    """
+    with concurrent.futures.ThreadPoolExecutor(len(urls)) as pool:
+        futures = [pool.submit(probe_source, url) for url in urls]
+    results = []
+    for url, future in zip(urls, futures):
+        try:
+            estimate, total = future.result()
+        except Exception:
+            DIAGNOSTICS.incr("source_probe_failures")
+            continue
+        results.append((estimate, url, total))
+    if not results:
+        return []
+    expected = results[0][2]
+    return [url for _, url, total in sorted(results) if total == expected]
+
+
+def source_label(url):
+    """Short name for a download URL, as shown on the Source card."""
+    parts = urllib.parse.urlsplit(url)
+    if parts.scheme == "file":
+        return "Local"
+    host = parts.hostname or ""
+    if host == "github.com" or host.endswith(".githubusercontent.com"):
+        return "GitHub"
+    return host
 
-    def _build_about_card(self, parent, w, h):
-        card = RoundedFrame(
-            parent, width=w, height=h,
-            parent_bg=self.colors["bg"],
-            card_bg=self.colors["card_bg"], radius=14,
-        )
-        card.pack(side=tk.LEFT)
 
-        def _upd(colors):
-            card.update_theme(colors["bg"], colors["card_bg"])
-        self._theme_custom(_upd)
+# ---------------------------------------------------------------------------
+# Decompression backends
+# ---------------------------------------------------------------------------
+
+XZ_MAGIC = b"\xfd7zXZ\x00"
 
-        body = tk.Frame(card.interior)
-        body.pack(fill=tk.BOTH, expand=True, padx=10, pady=8)
-        self._theme(body, bg="card_bg")
+XzStream = collections.namedtuple(
+    "XzStream", "offset header blocks index_size padding"
+)
 
-        self.avatar_canvas = tk.Canvas(
-            body, width=72, height=72,
-            highlightthickness=0, bd=0,
-        )
-        self.avatar_canvas.pack(pady=(8, 8))
-        self._draw_avatar_placeholder()
 
-        def _upd_avatar(colors):
-            self.avatar_canvas.configure(bg=colors["card_bg"])
-            self._draw_avatar_placeholder()
-        self._theme_custom(_upd_avatar)
-
-        name = tk.Label(body, text="HellFire Browser",
-                        font=self.fonts["card_h"])
-        name.pack()
-        self._theme(name, bg="card_bg", fg="text")
-
-        handle = tk.Label(body, text="@cyfarelabs",
-                          font=self.fonts["small"])
-        handle.pack(pady=(2, 8))
-        self._theme(handle, bg="card_bg", fg="text_muted")
-
-        divider = tk.Frame(body, height=1)
-        divider.pack(fill=tk.X, padx=8, pady=(2, 10))
-        self._theme(divider, bg="border")
-
-        stats_row = tk.Frame(body)
-        stats_row.pack()
-        self._theme(stats_row, bg="card_bg")
-
-        for i, (num, lbl) in enumerate(
-            [("Custom", "BUILD"), ("Firefox", "BASE"), ("MPL", "LICENSE")]
-        ):
-            if i > 0:
-                sep = tk.Frame(stats_row, width=1)
-                sep.pack(side=tk.LEFT, fill=tk.Y, padx=10)
-                self._theme(sep, bg="border")
-
-            col = tk.Frame(stats_row)
-            col.pack(side=tk.LEFT)
-            self._theme(col, bg="card_bg")
-
-            n = tk.Label(col, text=num, font=self.fonts["body_bold"])
-            n.pack()
-            self._theme(n, bg="card_bg", fg="text")
-
-            l = tk.Label(col, text=lbl, font=self.fonts["tiny"])
-            l.pack()
-            self._theme(l, bg="card_bg", fg="text_dim")
-
-    # ----- CTA card ---------------------------------------------------------
-
-    def _build_cta_card(self, parent):
-        inner_w = self.WINDOW_W - self.SIDEBAR_W - 2 * self.PADDING
-        h = 92
-
-        card = tk.Canvas(
-            parent, width=inner_w, height=h,
-            highlightthickness=0, bd=0,
-        )
-        card.pack()
-        self._theme(card, bg="bg")
-
-        self._cta_canvas = card
-        self._cta_w = inner_w
-        self._cta_h = h
-        self._draw_cta(self.colors)
-
-        def _upd(colors):
-            card.configure(bg=colors["bg"])
-            self._draw_cta(colors)
-        self._theme_custom(_upd)
-
-        card.bind("<Button-1>", self._on_cta_click)
-        card.bind("<Enter>", lambda e: card.configure(cursor="hand2"))
-        card.bind("<Leave>", lambda e: card.configure(cursor=""))
-
-    def _draw_cta(self, colors):
-        c = self._cta_canvas
-        c.delete("all")
-        w, h = self._cta_w, self._cta_h
-        r = 14
-
-        a = self._hex_to_rgb(colors["cta_grad_a"])
-        b = self._hex_to_rgb(colors["cta_grad_b"])
-
-        for y in range(h):
-            if y < r:
-                dy = r - y
-                inner = r * r - dy * dy
-                offset = r - (inner ** 0.5) if inner >= 0 else r
-            elif y >= h - r:
-                dy = y - (h - r - 1)
-                inner = r * r - dy * dy
-                offset = r - (inner ** 0.5) if inner >= 0 else r
-            else:
-                offset = 0
-
-            t = y / max(1, h - 1)
-            r_c = int(a[0] + (b[0] - a[0]) * t)
-            g_c = int(a[1] + (b[1] - a[1]) * t)
-            b_c = int(a[2] + (b[2] - a[2]) * t)
-            color = f"#{r_c:02x}{g_c:02x}{b_c:02x}"
-            c.create_line(int(offset), y, int(w - offset), y, fill=color)
-
-        for x, y, size in [
-            (w - 80, 22, 8),
-            (w - 50, 56, 5),
-            (w - 130, 16, 4),
-            (w - 110, 64, 6),
-            (w - 170, 40, 5),
-        ]:
-            self._draw_sparkle(c, x, y, size, "#ffffff")
-
-        c.create_text(
-            28, 32, text="Optimized Firefox for GNU/Linux",
-            font=self.fonts["cta_h"], fill="#ffffff", anchor="w",
-        )
-        c.create_text(
-            28, 56, text="Custom-compiled Firefox · view source on GitHub →",
-            font=self.fonts["cta_b"], fill="#e8e4ff", anchor="w",
-        )
+def _xz_varint(buf, pos):
+    value = shift = 0
+    while True:
+        if pos >= len(buf) or shift > 63:
+            raise ValueError("corrupt xz index")
+        byte = buf[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return value, pos
+        shift += 7
+
+
+def _xz_encode_varint(value):
+    out = bytearray()
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def read_xz_index(f):
+    """Walk an .xz file backwards from its footer and return its streams.
+
+    Only the stream headers, indexes and footers are read, and their CRCs
+    and sizes are cross-checked, so a truncated or corrupt file is caught
+    without decompressing anything. Each block is reported as
+    ``(unpadded_size, uncompressed_size)``. Raises ValueError when the
+    layout does not add up.
+    """
+    f.seek(0, os.SEEK_END)
+    end = f.tell()
+    streams = []
+    while end > 0:
+        padding = 0
+        while end >= 4:
+            f.seek(end - 4)
+            if f.read(4) != b"\0\0\0\0":
+                break
+            end -= 4
+            padding += 4
+        if end < 24:
+            raise ValueError("truncated xz stream")
+        f.seek(end - 12)
+        footer = f.read(12)
+        if footer[10:12] != b"YZ":
+            raise ValueError("missing xz stream footer")
+        if zlib.crc32(footer[4:10]) != int.from_bytes(footer[:4], "little"):
+            raise ValueError("corrupt xz stream footer")
+        index_size = (int.from_bytes(footer[4:8], "little") + 1) * 4
+        index_start = end - 12 - index_size
+        if index_start < 12:
+            raise ValueError("xz index out of bounds")
+        f.seek(index_start)
+        index = f.read(index_size)
+        if (index[:1] != b"\0" or zlib.crc32(index[:-4])
+                != int.from_bytes(index[-4:], "little")):
+            raise ValueError("corrupt xz index")
+        count, pos = _xz_varint(index, 1)
+        blocks = []
+        for _ in range(count):
+            unpadded, pos = _xz_varint(index, pos)
+            uncompressed, pos = _xz_varint(index, pos)
+            blocks.append((unpadded, uncompressed))
+        if index[pos:-4].strip(b"\0") or (-pos) % 4 != len(index[pos:-4]):
+            raise ValueError("corrupt xz index")
+        start = index_start - 12 - sum((u + 3) & ~3 for u, _ in blocks)
+        if start < 0:
+            raise ValueError("xz blocks out of bounds")
+        f.seek(start)
+        header = f.read(12)
+        if header[:6] != XZ_MAGIC:
+            raise ValueError("missing xz stream header")
+        if (zlib.crc32(header[6:8]) != int.from_bytes(header[8:], "little")
+                or header[6:8] != footer[8:10]):
+            raise ValueError("corrupt xz stream header")
+        streams.append(XzStream(start, header, blocks, index_size, padding))
+        end = start
+    streams.reverse()
+    return streams
+
+
+def validate_xz_archive(path):
+    """Check that an .xz archive is complete; returns its unpacked size.
+
+    Costs a few KB of reads at the end of the file. Raises ValueError for
+    truncated or corrupt archives.
+    """
+    with open(path, "rb") as f:
+        streams = read_xz_index(f)
+    return sum(u for s in streams for _, u in s.blocks)
+
+
+class _ChunkReader:
+    """File-like ``read()`` over an iterator of byte chunks."""
+
+    def __init__(self, chunks):
+        self._chunks = chunks
+        self._buf = memoryview(b"")
+
+    def read(self, size=-1):
+        if size is None or size < 0:
+            parts = [bytes(self._buf)] + list(self._chunks)
+            self._buf = memoryview(b"")
+            return b"".join(parts)
+        while not self._buf:
+            try:
+                self._buf = memoryview(next(self._chunks))
+            except StopIteration:
+                return b""
+        data = bytes(self._buf[:size])
+        self._buf = self._buf[size:]
+        return data
 
-    @staticmethod
-    def _draw_sparkle(canvas, cx, cy, size, color):
-        s = size
-        canvas.create_polygon(
-            cx, cy - s,
-            cx + s * 0.3, cy - s * 0.3,
-            cx + s, cy,
-            cx + s * 0.3, cy + s * 0.3,
-            cx, cy + s,
-            cx - s * 0.3, cy + s * 0.3,
-            cx - s, cy,
-            cx - s * 0.3, cy - s * 0.3,
-            fill=color, outline="",
-        )
 
-    def _on_cta_click(self, _):
-        webbrowser.open(self.social_links["GitHub"])
-
-    # ----- avatar -----------------------------------------------------------
-
-    def _draw_avatar_placeholder(self):
-        c = self.avatar_canvas
-        c.delete("all")
-        c.configure(bg=self.colors["card_bg"])
-        c.create_oval(2, 2, 70, 70,
-                      outline=self.colors["accent"], width=2)
-        c.create_oval(8, 8, 64, 64,
-                      fill=self.colors["accent_soft"], outline="")
-        c.create_text(36, 38, text="🔥",
-                      font=pick_font(SANS_BOLD_PREFERENCES, 24, "bold"),
-                      fill=self.colors["accent"])
-
-    def _load_avatar(self):
-        if not PIL_AVAILABLE:
-            return
+class LzmaDecompressor:
+    """Single-threaded in-process liblzma, the portable fallback."""
+
+    name = "lzma"
+
+    @contextlib.contextmanager
+    def stream(self, fileobj):
+        with lzma.LZMAFile(fileobj) as f:
+            yield f
+
+
+class XzProcessDecompressor:
+    """Pipes the archive through a threaded ``xz -T0`` subprocess."""
 
-        def fetch():
+    name = "xz -T0"
+
+    def __init__(self, binary):
+        self.binary = binary
+
+    @contextlib.contextmanager
+    def stream(self, fileobj):
+        proc = subprocess.Popen(
+            [self.binary, "-dc", "-T0"],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+        errors = []
+
+        def feed():
             try:
-                resp = requests.get(self.hero_image_url, timeout=10)
-                resp.raise_for_status()
-                img = Image.open(io.BytesIO(resp.content)).convert("RGBA")
-                size = 64
-                img = img.resize((size, size), Image.Resampling.LANCZOS)
-                mask = Image.new("L", (size, size), 0)
-                ImageDraw.Draw(mask).ellipse((0, 0, size, size), fill=255)
-                circle = Image.new("RGBA", (size, size), (0, 0, 0, 0))
-                circle.paste(img, (0, 0), mask)
-                photo = ImageTk.PhotoImage(circle)
-                self.avatar_image = photo
-                self.root.after(0, self._apply_avatar)
+                while True:
+                    data = fileobj.read(1024 * 1024)
+                    if not data:
+                        break
+                    proc.stdin.write(data)
+            except BrokenPipeError:
+                pass
             except Exception as e:
-                print(f"Avatar fetch failed: {e}", file=sys.stderr)
+                errors.append(e)
+            finally:
+                try:
+                    proc.stdin.close()
+                except OSError:
+                    pass
+
+        feeder = threading.Thread(target=feed, daemon=True)
+        feeder.start()
+        try:
+            yield proc.stdout
+            # tar stops at its end-of-archive marker; drain the padding so
+            # xz can exit and report its status.
+            while proc.stdout.read(1024 * 1024):
+                pass
+        except BaseException:
+            proc.kill()
+            raise
+        finally:
+            feeder.join()
+            proc.stdout.close()
+            stderr = proc.stderr.read().decode(errors="replace").strip()
+            proc.stderr.close()
+            proc.wait()
+        if errors:
+            raise errors[0]
+        if proc.returncode != 0:
+            raise IOError(stderr or f"xz exited with {proc.returncode}")
+
+
+class ParallelBlockDecompressor:
+    """Decompresses the independent blocks of a multi-block .xz in a pool.
+
+    Each block is wrapped in a minimal single-block stream so liblzma can
+    decode it on its own; liblzma releases the GIL, so plain threads run
+    on separate cores. Output stays in archive order and the uncompressed
+    bytes in flight are capped at ``max_inflight``.
+    """
+
+    def __init__(self, streams, workers=None,
+                 max_inflight=256 * 1024 * 1024):
+        self.streams = streams
+        self.workers = workers or os.cpu_count() or 1
+        self.max_inflight = max_inflight
+        self.name = f"{self.workers} parallel xz blocks"
 
-        threading.Thread(target=fetch, daemon=True).start()
+    @staticmethod
+    def _single_block_stream(header, block, unpadded, uncompressed):
+        index = (b"\0" + _xz_encode_varint(1) + _xz_encode_varint(unpadded)
+                 + _xz_encode_varint(uncompressed))
+        index += b"\0" * (-len(index) % 4)
+        index += zlib.crc32(index).to_bytes(4, "little")
+        backward = (len(index) // 4 - 1).to_bytes(4, "little")
+        flags = header[6:8]
+        footer = (zlib.crc32(backward + flags).to_bytes(4, "little")
+                  + backward + flags + b"YZ")
+        return header + block + index + footer
+
+    def _read_exact(self, fileobj, size):
+        data = fileobj.read(size)
+        if len(data) != size:
+            raise IOError("xz archive ended early")
+        return data
+
+    def _chunks(self, fileobj, pool):
+        pending = collections.deque()
+        inflight = 0
+        for s in self.streams:
+            header = self._read_exact(fileobj, 12)
+            for unpadded, uncompressed in s.blocks:
+                while pending and inflight + uncompressed > self.max_inflight:
+                    size, future = pending.popleft()
+                    inflight -= size
+                    yield future.result()
+                block = self._read_exact(fileobj, (unpadded + 3) & ~3)
+                data = self._single_block_stream(header, block,
+                                                 unpadded, uncompressed)
+                pending.append((uncompressed, pool.submit(lzma.decompress,
+                                                          data)))
+                inflight += uncompressed
+            self._read_exact(fileobj, s.index_size + 12 + s.padding)
+        while pending:
+            yield pending.popleft()[1].result()
+
+    @contextlib.contextmanager
+    def stream(self, fileobj):
+        with concurrent.futures.ThreadPoolExecutor(self.workers) as pool:
+            yield _ChunkReader(self._chunks(fileobj, pool))
+
+
+def choose_decompressor(path=None):
+    """Pick the fastest xz backend for ``path``, or for a network stream."""
+    streams = None
+    if path is not None:
+        try:
+            with open(path, "rb") as f:
+                streams = read_xz_index(f)
+        except (OSError, ValueError):
+            streams = None
+        if not streams or sum(len(s.blocks) for s in streams) < 2:
+            return LzmaDecompressor()
+    binary = shutil.which("xz")
+    if binary:
+        return XzProcessDecompressor(binary)
+    if streams:
+        return ParallelBlockDecompressor(streams)
+    return LzmaDecompressor()
 
-    def _apply_avatar(self):
-        c = self.avatar_canvas
-        c.delete("all")
-        c.configure(bg=self.colors["card_bg"])
-        c.create_oval(1, 1, 71, 71,
-                      outline=self.colors["accent"], width=2)
-        c.create_image(36, 36, image=self.avatar_image)
 
-    # ----- status helpers ----------------------------------------------------
+# ---------------------------------------------------------------------------
+# Extraction
+# ---------------------------------------------------------------------------
 
-    def _set_status_dot(self, color):
-        self.status_dot.delete("all")
-        self.status_dot.configure(bg=self.colors["card_bg"])
-        self.status_dot.create_oval(0, 0, 10, 10, fill=color, outline=color)
+MANIFEST_NAME = ".hellfire-manifest.json"
+STAGING_NAME = ".hellfire-staging"
 
-    def update_status(self, message, *, dot=None):
-        def apply():
-            self.status_label.configure(text=message)
-            if dot is not None:
-                self._set_status_dot(dot)
-        self.root.after(0, apply)
 
-    def update_progress(self, fraction, text=None):
-        def apply():
-            self.progress.set_value(fraction)
-            if text is not None:
-                self.status_label.configure(text=text)
-            self.percent_label.configure(text=f"{int(fraction * 100)}%")
-        self.root.after(0, apply)
+def load_manifest(path):
+    """Return a previous install's manifest; ``files`` maps relpath to entry."""
+    try:
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+        if isinstance(data.get("files"), dict):
+            return data
+    except (OSError, ValueError, AttributeError):
+        pass
+    return {"files": {}}
 
-    def show_indeterminate(self, message):
-        def apply():
-            self.status_label.configure(text=message)
-            self.percent_label.configure(text="")
-            self.progress.start_indeterminate()
-            self._set_status_dot(self.colors["accent"])
-        self.root.after(0, apply)
 
-    def stop_indeterminate(self):
-        self.root.after(0, self.progress.stop_indeterminate)
+def save_manifest(path, entries, source=None, sha256=None):
+    """Write the manifest; ``source`` and ``sha256`` name the archive."""
+    path = Path(path)
+    data = {"version": 1, "source": source, "sha256": sha256,
+            "files": entries}
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps(data), encoding="utf-8")
+    os.replace(tmp, path)
 
-    # ----- install flow ------------------------------------------------------
 
-    def _on_action_clicked(self):
-        if self._installed:
-            return
-        self.action_button.set_enabled(False)
-        self.action_button.configure_text("Installing…")
-        self._set_stat("status", value="Working", sub="In progress")
-        threading.Thread(target=self._install_flow, daemon=True).start()
+_AT_FDCWD = -100
+_RENAME_EXCHANGE = 2
 
-    def _install_flow(self):
-        self.show_indeterminate(f"Searching for '{self.keyword}*.tar.xz'…")
-        candidates = []
-        for loc in [".", str(Path.home()), str(Path.home() / "Downloads")]:
-            candidates += glob.glob(os.path.join(loc, f"{self.keyword}*.tar.xz"))
 
-        if candidates:
-            self.file_to_extract = max(candidates, key=os.path.getmtime)
-            size_mb = os.path.getsize(self.file_to_extract) / (1024 * 1024)
-            self.stop_indeterminate()
-            self._set_stat("source", value="Local", sub="Cached file")
-            self._set_stat("size", value=f"{size_mb:.1f} MB", sub="On disk")
-            self.update_status(
-                f"Found: {os.path.basename(self.file_to_extract)}",
-                dot=self.colors["accent"],
-            )
-        else:
-            self.show_indeterminate("Fetching latest release info…")
-            self._set_stat("source", value="GitHub", sub="Fetching")
-            url, name = self._latest_release_asset()
-            if not url:
-                self.stop_indeterminate()
-                self._fail("No release found on GitHub.")
-                return
-            self.stop_indeterminate()
-            self.update_status(f"Downloading {name}…",
-                               dot=self.colors["accent"])
-            ok, path = self._download(url, name)
-            if not ok:
-                self._fail(f"Download failed: {path}")
-                return
-            self.file_to_extract = path
-            size_mb = os.path.getsize(path) / (1024 * 1024)
-            self._set_stat("size", value=f"{size_mb:.1f} MB", sub="Downloaded")
+def exchange_paths(a, b):
+    """Atomically swap two paths on one filesystem with ``renameat2``.
 
-        try:
-            self.base_dir.mkdir(parents=True, exist_ok=True)
-        except Exception as e:
-            self._fail(f"Directory error: {e}")
-            return
+    Returns False when the kernel, libc or filesystem cannot do it.
+    """
+    try:
+        renameat2 = ctypes.CDLL(None, use_errno=True).renameat2
+    except (OSError, AttributeError):
+        return False
+    renameat2.argtypes = [ctypes.c_int, ctypes.c_char_p,
+                          ctypes.c_int, ctypes.c_char_p, ctypes.c_uint]
+    if renameat2(_AT_FDCWD, os.fsencode(a), _AT_FDCWD, os.fsencode(b),
+                 _RENAME_EXCHANGE) == 0:
+        return True
+    err = ctypes.get_errno()
+    if err in (errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP):
+        return False
+    raise OSError(err, os.strerror(err), a)
 
-        self.update_status("Extracting archive…", dot=self.colors["accent"])
-        ok, err = self._extract_archive(self.file_to_extract, self.base_dir)
-        if not ok:
-            self._fail(f"Extraction failed: {err}")
-            return
 
-        self.show_indeterminate("Finalizing setup…")
-        if not self.firefox_bin.exists():
-            self.stop_indeterminate()
-            self._fail("'firefox' binary missing in archive.")
-            return
+def swap_in(stage, out, names):
+    """Move top-level ``names`` from ``stage`` over their copies in ``out``.
 
-        try:
+    Each replaced path ends up inside ``stage``, so removing ``stage``
+    afterwards disposes of the old tree. Where ``renameat2`` is missing the
+    live path is renamed aside first, leaving it absent for one rename.
+    """
+    for name in names:
+        new, live = os.path.join(stage, name), os.path.join(out, name)
+        if not os.path.lexists(live):
+            os.rename(new, live)
+        elif not exchange_paths(new, live):
+            os.rename(live, new + ".old")
+            os.rename(new, live)
+
+
+_FICLONE = 0x40049409
+
+
+def reflink(src, dest):
+    """Copy-on-write clone of ``src`` at ``dest``; OSError if unsupported."""
+    with open(src, "rb") as s, open(dest, "wb") as d:
+        fcntl.ioctl(d.fileno(), _FICLONE, s.fileno())
+
+
+class ContentStore:
+    """Extracted files kept once, under ``objects/`` named by SHA-256 and
+    mode, and hard-linked into every install tree that ships them.
+
+    Where a link is refused (another filesystem, another user's object)
+    the file is reflinked instead, or copied as a last resort. Objects are
+    never written in place. One whose only link is its own name is used by
+    no tree any more and ``collect()`` deletes it.
+    """
+
+    TMP_MAX_AGE = 24 * 3600
+
+    def __init__(self, root):
+        self.root = Path(root)
+        self.objects = self.root / "objects"
+        self.tmp = self.root / "tmp"
+        self.tmp.mkdir(parents=True, exist_ok=True)
+        self.objects.mkdir(exist_ok=True)
+
+    def object_path(self, digest, mode):
+        return self.objects / digest[:2] / f"{digest}-{stat.S_IMODE(mode):o}"
+
+    def temp_file(self):
+        """``(file, path)`` for writing a new object's bytes."""
+        fd, path = tempfile.mkstemp(dir=self.tmp)
+        return os.fdopen(fd, "wb"), path
+
+    def add_bytes(self, data, digest, mode, dest):
+        """Place content ``data`` at ``dest``; returns whether it was new."""
+        if self._place_existing(self.object_path(digest, mode), dest):
+            return False
+        f, tmp = self.temp_file()
+        with f:
+            f.write(data)
+        return self.add_file(tmp, digest, mode, dest)
+
+    def add_file(self, tmp, digest, mode, dest):
+        """Like ``add_bytes`` for content already written to ``tmp`` (from
+        ``temp_file``), which is consumed."""
+        obj = self.object_path(digest, mode)
+        if self._place_existing(obj, dest):
+            os.unlink(tmp)
+            return False
+        os.chmod(tmp, stat.S_IMODE(mode))
+        # Link the tree first: a published object always has a second link
+        # by the time another process's collect() could look at it.
+        self._materialize(tmp, dest)
+        obj.parent.mkdir(exist_ok=True)
+        try:
+            os.link(tmp, obj)
+        except OSError:
+            pass  # published meanwhile by a concurrent install
+        os.unlink(tmp)
+        DIAGNOSTICS.incr("store_objects_added")
+        return True
+
+    def collect(self):
+        """Delete objects no tree links to, and stale temp files."""
+        removed = 0
+        for path in self.objects.glob("*/*"):
+            try:
+                if os.lstat(path).st_nlink == 1:
+                    os.unlink(path)
+                    removed += 1
+            except OSError:
+                pass
+        cutoff = time.time() - self.TMP_MAX_AGE
+        for path in self.tmp.iterdir():
+            try:
+                if os.lstat(path).st_mtime < cutoff:
+                    os.unlink(path)
+            except OSError:
+                pass
+        return removed
+
+    def _place_existing(self, obj, dest):
+        try:
+            self._materialize(obj, dest)
+        except FileNotFoundError:
+            return False
+        DIAGNOSTICS.incr("store_hits")
+        return True
+
+    @staticmethod
+    def _materialize(src, dest):
+        # dest may already link to an object (a duplicate tar member), and
+        # the fallbacks below must never write through such a link.
+        try:
+            os.unlink(dest)
+        except FileNotFoundError:
+            pass
+        try:
+            os.link(src, dest)
+            return
+        except FileNotFoundError:
+            raise
+        except OSError:
+            pass
+        try:
+            reflink(src, dest)
+        except OSError:
+            shutil.copyfile(src, dest)
+            shutil.copymode(src, dest)
+
+
+class ParallelExtractor:
+    """Demuxes a tar stream and writes file payloads from a thread pool.
+
+    The calling thread walks the archive and buffers small regular files;
+    a bounded pool writes them concurrently, with at most ``max_buffered``
+    bytes held in memory. Members too large to buffer are streamed to disk
+    by the calling thread. Directory metadata is applied last, as
+    ``tarfile.extractall`` does.
+
+    ``out`` is a fresh tree. Given ``reuse``, the live install root, and
+    its manifest as ``previous``, files whose content matches an untouched
+    copy in ``reuse`` are hard-linked from it rather than rewritten. Given
+    a ``ContentStore``, every regular file is placed from it instead.
+    ``entries`` is the manifest of the tree as extracted. ``only``
+    restricts extraction to a set of relative paths.
+    """
+
+    WORKERS = 8
+    MAX_BUFFERED = 64 * 1024 * 1024
+    CHUNK = 1024 * 1024
+
+    def __init__(self, out, workers=None, max_buffered=None, on_member=None,
+                 previous=None, only=None, reuse=None, store=None):
+        self.out = os.path.abspath(out)
+        self.reuse = os.path.abspath(reuse) if reuse else None
+        self.store = store
+        self.workers = workers or self.WORKERS
+        self.max_buffered = max_buffered or self.MAX_BUFFERED
+        self.on_member = on_member
+        self.previous = previous or {}
+        self.only = only
+        self.entries = {}
+        self.count = 0
+        self.written = 0
+        self._buffered = 0
+        self._cond = threading.Condition()
+        self._futures = []
+        self._dirs = []
+        self._filter = getattr(tarfile, "data_filter", None)
+
+    def extract(self, fileobj):
+        with tarfile.open(fileobj=fileobj, mode="r|") as tar, \
+                concurrent.futures.ThreadPoolExecutor(self.workers) as pool:
+            for member in tar:
+                self._extract_member(tar, pool, member)
+                self.count += 1
+                if self.on_member:
+                    self.on_member(self.count)
+            self._drain()
+        for path, member in sorted(self._dirs, reverse=True):
+            self._apply_attrs(path, member)
+        return self.count
+
+    def _extract_member(self, tar, pool, member):
+        if self._filter is not None:
+            member = self._filter(member, self.out)
+        rel = os.path.normpath(member.name)
+        path = os.path.join(self.out, rel)
+        if self.only is not None and rel not in self.only:
+            return
+        if member.isdir():
+            os.makedirs(path, exist_ok=True)
+            self._dirs.append((path, member))
+        elif member.isreg() and member.size <= self.max_buffered // 4:
+            data = tar.extractfile(member).read()
+            self._reserve(len(data))
+            self._futures.append(
+                pool.submit(self._write_buffered, path, rel, member, data)
+            )
+        elif member.isreg():
+            self._write_streamed(tar, path, rel, member)
+        else:
+            # Links and special files are rare; hard links need their
+            # target on disk, so let pending writes land first.
+            if member.islnk():
+                self._drain()
+                # os.link refuses to replace an existing file, and tarfile's
+                # copy fallback would need to seek backwards in the stream.
+                if os.path.lexists(path) and not os.path.isdir(path):
+                    os.unlink(path)
+            tar.extract(member, path=self.out, set_attrs=True,
+                        **({"filter": "fully_trusted"}
+                           if self._filter is not None else {}))
+            if member.issym():
+                self.entries[rel] = {"link": member.linkname}
+            elif member.islnk():
+                target = self.entries.get(os.path.normpath(member.linkname))
+                if target:
+                    self.entries[rel] = dict(target)
+
+    def _reserve(self, size):
+        with self._cond:
+            while self._buffered and self._buffered + size > self.max_buffered:
+                self._cond.wait()
+            self._buffered += size
+
+    def _release(self, size):
+        with self._cond:
+            self._buffered -= size
+            self._cond.notify_all()
+
+    def _drain(self):
+        futures, self._futures = self._futures, []
+        for future in futures:
+            future.result()
+
+    def _live_path(self, rel, path):
+        return os.path.join(self.reuse, rel) if self.reuse else path
+
+    def _unchanged_candidate(self, rel, path, member):
+        """Previous entry for ``rel`` if the on-disk copy is still as left
+        and ``member`` has the same mode and mtime, so that it can be
+        hard-linked without touching its attributes."""
+        old = self.previous.get(rel)
+        if (not old or "sha256" not in old or old["size"] != member.size
+                or old["mode"] != member.mode
+                or old["mtime"] != int(member.mtime)):
+            return None
+        try:
+            st = os.lstat(path)
+        except OSError:
+            return None
+        if (not stat.S_ISREG(st.st_mode) or st.st_size != old["size"]
+                or int(st.st_mtime) != old["mtime"]):
+            return None
+        return old
+
+    def _record(self, rel, member, digest, wrote):
+        with self._cond:
+            self.entries[rel] = {
+                "size": member.size, "mode": member.mode,
+                "mtime": int(member.mtime), "sha256": digest,
+            }
+            if wrote:
+                self.written += 1
+
+    def _write_buffered(self, path, rel, member, data):
+        try:
+            digest = hashlib.sha256(data).hexdigest()
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            if self.store is not None:
+                wrote = self.store.add_bytes(data, digest, member.mode, path)
+                self._apply_shared_attrs(path, member)
+                self._record(rel, member, digest, wrote)
+                return
+            live = self._live_path(rel, path)
+            old = self._unchanged_candidate(rel, live, member)
+            if old and old["sha256"] == digest and self._link(live, path):
+                self._record(rel, member, digest, wrote=False)
+                return
+            with open(path, "wb") as f:
+                f.write(data)
+            self._apply_attrs(path, member)
+            self._record(rel, member, digest, wrote=True)
+        finally:
+            self._release(len(data))
+
+    def _write_streamed(self, tar, path, rel, member):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        src = tar.extractfile(member)
+        digest = hashlib.sha256()
+        wrote = True
+        live = self._live_path(rel, path)
+        if self.store is not None:
+            f, tmp = self.store.temp_file()
+            with f:
+                while True:
+                    chunk = src.read(self.CHUNK)
+                    if not chunk:
+                        break
+                    digest.update(chunk)
+                    f.write(chunk)
+            wrote = self.store.add_file(tmp, digest.hexdigest(), member.mode,
+                                        path)
+            self._apply_shared_attrs(path, member)
+            self._record(rel, member, digest.hexdigest(), wrote)
+            return
+        if live != path and self._unchanged_candidate(rel, live, member):
+            wrote = self._stage_streamed(src, live, path, digest)
+        else:
+            with open(path, "wb") as f:
+                while True:
+                    chunk = src.read(self.CHUNK)
+                    if not chunk:
+                        break
+                    digest.update(chunk)
+                    f.write(chunk)
+        if wrote:  # a hard link already has the attributes and is shared
+            self._apply_attrs(path, member)
+        self._record(rel, member, digest.hexdigest(), wrote)
+
+    def _stage_streamed(self, src, live, path, digest):
+        """Stream ``src`` to ``path``, or hard-link ``live`` there when the
+        bytes match it; returns whether anything was written."""
+        out = None
+        try:
+            with open(live, "rb") as f:
+                pos = 0
+                while True:
+                    chunk = src.read(self.CHUNK)
+                    if not chunk:
+                        break
+                    digest.update(chunk)
+                    if out is None and f.read(len(chunk)) != chunk:
+                        # Diverged: copy the matching prefix, then go on
+                        # writing what the archive sends.
+                        out = open(path, "wb")
+                        f.seek(0)
+                        left = pos
+                        while left:
+                            data = f.read(min(self.CHUNK, left))
+                            if not data:
+                                raise IOError(f"{live} changed while read")
+                            out.write(data)
+                            left -= len(data)
+                    if out is not None:
+                        out.write(chunk)
+                    pos += len(chunk)
+        finally:
+            if out is not None:
+                out.close()
+        if out is not None:
+            return True
+        if not self._link(live, path):
+            shutil.copyfile(live, path)
+            return True
+        return False
+
+    @staticmethod
+    def _link(live, path):
+        try:
+            os.link(live, path)
+            return True
+        except OSError:
+            return False
+
+    def _apply_shared_attrs(self, path, member):
+        # Another user's store object keeps its owner's timestamps; the
+        # mode is part of the object's name anyway.
+        try:
+            self._apply_attrs(path, member)
+        except PermissionError:
+            pass
+
+    @staticmethod
+    def _apply_attrs(path, member):
+        if member.mode is not None:
+            os.chmod(path, member.mode)
+        if member.mtime is not None:
+            os.utime(path, (member.mtime, member.mtime))
+
+
+# ---------------------------------------------------------------------------
+# Installed versions
+# ---------------------------------------------------------------------------
+
+# <base>/versions/<version>/ each hold a firefox/ tree and its manifest;
+# <base>/current links to the active one and <base>/firefox to its tree,
+# so launchers and old paths follow a switch made by one rename.
+VERSIONS_NAME = "versions"
+CURRENT_NAME = "current"
+KEEP_VERSIONS = 3
+
+
+def version_name(root):
+    """Directory name for the tree at ``root``, e.g. ``144.0a1-2025…``."""
+    info = installed_version(root)
+    if not info:
+        return None
+    return "-".join(filter(None, (info["version"], info["build_id"])))
+
+
+def install_root(base=INSTALL_DIR):
+    """Directory holding the active ``firefox`` tree and its manifest."""
+    current = Path(base) / CURRENT_NAME
+    return current if current.is_dir() else Path(base)
+
+
+def current_version(base=INSTALL_DIR):
+    """Name of the version ``current`` points at, or None."""
+    try:
+        return os.path.basename(os.readlink(Path(base) / CURRENT_NAME))
+    except OSError:
+        return None
+
+
+def list_versions(base=INSTALL_DIR):
+    """Installed version names, most recently installed first."""
+    root = Path(base) / VERSIONS_NAME
+    try:
+        names = [n for n in os.listdir(root) if not n.startswith(".")]
+    except FileNotFoundError:
+        return []
+
+    def installed_at(name):
+        try:
+            return os.path.getmtime(root / name / MANIFEST_NAME)
+        except OSError:
+            return 0.0
+
+    return sorted(names, key=installed_at, reverse=True)
+
+
+def _replace_symlink(link, target):
+    tmp = link.with_name(link.name + ".tmp")
+    try:
+        tmp.unlink()
+    except FileNotFoundError:
+        pass
+    tmp.symlink_to(target)
+    os.replace(tmp, link)
+
+
+def switch_version(name, base=INSTALL_DIR):
+    """Make version ``name`` the active one with a single atomic rename."""
+    base = Path(base)
+    if not (base / VERSIONS_NAME / name / "firefox").is_dir():
+        raise FileNotFoundError(f"HellFire {name} is not installed")
+    _replace_symlink(base / CURRENT_NAME, Path(VERSIONS_NAME) / name)
+    legacy = base / "firefox"
+    if legacy.is_symlink() or not legacy.exists():
+        _replace_symlink(legacy, Path(CURRENT_NAME) / "firefox")
+
+
+def previous_version(base=INSTALL_DIR):
+    """Version a rollback returns to: the newest one installed before the
+    active version, else the newest other one; None if there is none."""
+    current = current_version(base)
+    names = list_versions(base)
+    others = [n for n in names if n != current]
+    if current in names:
+        older = names[names.index(current) + 1:]
+        if older:
+            return older[0]
+    return others[0] if others else None
+
+
+def prune_versions(keep, base=INSTALL_DIR):
+    """Delete the oldest versions so at most ``keep`` remain, never the
+    active one; returns the names removed."""
+    current = current_version(base)
+    others = [n for n in list_versions(base) if n != current]
+    removed = others[max(0, keep - 1):]
+    for name in removed:
+        shutil.rmtree(Path(base) / VERSIONS_NAME / name, ignore_errors=True)
+    return removed
+
+
+def migrate_legacy_install(base=INSTALL_DIR):
+    """Move a pre-versioning ``<base>/firefox`` tree under ``versions/``.
+
+    Returns the version name it was filed under, or None if there was
+    nothing to move.
+    """
+    base = Path(base)
+    legacy = base / "firefox"
+    if legacy.is_symlink() or not legacy.is_dir():
+        return None
+    stem = version_name(base) or "legacy"
+    for n in itertools.count(1):
+        name = stem if n == 1 else f"{stem}.{n}"
+        dest = base / VERSIONS_NAME / name
+        if not dest.exists():
+            break
+    dest.mkdir(parents=True)
+    manifest = base / MANIFEST_NAME
+    if manifest.exists():
+        os.replace(manifest, dest / MANIFEST_NAME)
+    os.rename(legacy, dest / "firefox")
+    switch_version(name, base)
+    return name
+
+
+# ---------------------------------------------------------------------------
+# Install verification
+# ---------------------------------------------------------------------------
+
+def file_sha256(path, chunk=1024 * 1024):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(chunk), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+class DigestMemo:
+    """SHA-256 of local files, memoized on disk by (path, size, mtime)."""
+
+    def __init__(self, path=None):
+        self.path = Path(path or CACHE_DIR / "digests.json")
+        self._lock = threading.Lock()
+
+    def get(self, path):
+        path = os.path.abspath(path)
+        st = os.stat(path)
+        with self._lock:
+            entry = self._load().get(path)
+        if entry and entry[:2] == [st.st_size, st.st_mtime_ns]:
+            DIAGNOSTICS.incr("digest_memo_hits")
+            return entry[2]
+        DIAGNOSTICS.incr("digest_memo_misses")
+        digest = file_sha256(path)
+        self.remember(path, digest)
+        return digest
+
+    def remember(self, path, digest):
+        path = os.path.abspath(path)
+        st = os.stat(path)
+        with self._lock:
+            memo = {p: e for p, e in self._load().items() if os.path.exists(p)}
+            memo[path] = [st.st_size, st.st_mtime_ns, digest]
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                tmp = self.path.with_name(self.path.name + ".tmp")
+                tmp.write_text(json.dumps(memo), encoding="utf-8")
+                os.replace(tmp, self.path)
+            except OSError:
+                pass
+
+    def _load(self):
+        try:
+            memo = json.loads(self.path.read_text(encoding="utf-8"))
+            return memo if isinstance(memo, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+
+DIGEST_MEMO = DigestMemo()
+
+
+def verify_archive(path, digest=None):
+    """Compare an archive with its published SHA-256.
+
+    Returns ``(ok, detail)``; archives without a published checksum pass
+    as ``"unverified"``.
+    """
+    expected = published_sha256(os.path.basename(path))
+    if expected is None:
+        return True, "unverified"
+    actual = digest or DIGEST_MEMO.get(path)
+    if actual != expected:
+        return False, "checksum mismatch"
+    return True, "verified"
+
+
+def verify_install(out, entries, workers=None):
+    """Check an installed tree against its manifest, hashing in parallel.
+
+    Returns ``{relpath: problem}`` for every entry that is missing, has
+    the wrong type, size or mode, or whose content differs.
+    """
+    def check(item):
+        rel, entry = item
+        path = os.path.join(out, rel)
+        try:
+            st = os.lstat(path)
+        except FileNotFoundError:
+            return rel, "missing"
+        except OSError as e:
+            return rel, e.strerror or "unreadable"
+        if "link" in entry:
+            if (not stat.S_ISLNK(st.st_mode)
+                    or os.readlink(path) != entry["link"]):
+                return rel, "wrong link"
+            return rel, None
+        if not stat.S_ISREG(st.st_mode):
+            return rel, "not a file"
+        if st.st_size != entry["size"]:
+            return rel, "size mismatch"
+        if stat.S_IMODE(st.st_mode) != entry["mode"]:
+            return rel, "mode mismatch"
+        try:
+            if file_sha256(path) != entry["sha256"]:
+                return rel, "content mismatch"
+        except OSError as e:
+            return rel, e.strerror or "unreadable"
+        return rel, None
+
+    with concurrent.futures.ThreadPoolExecutor(workers) as pool:
+        return {
+            rel: problem
+            for rel, problem in pool.map(check, entries.items())
+            if problem
+        }
+
+
+def repair_install(out, archive, paths):
+    """Re-extract just ``paths`` from ``archive`` over the tree at ``out``.
+
+    Damaged files are unlinked first, so a copy hard-linked into another
+    version or the file store is never written through.
+    """
+    for rel in paths:
+        path = os.path.join(out, rel)
+        if os.path.lexists(path) and not os.path.isdir(path):
+            os.unlink(path)
+    backend = choose_decompressor(archive)
+    extractor = ParallelExtractor(out, only=set(paths))
+    with open(archive, "rb") as f, backend.stream(f) as data:
+        extractor.extract(data)
+    return extractor
+
+
+def installed_from(archive, manifest):
+    """Whether ``archive`` is the one the install in ``manifest`` came from:
+    by SHA-256 when the manifest has one, else by file name."""
+    if manifest.get("sha256"):
+        return DIGEST_MEMO.get(archive) == manifest["sha256"]
+    return os.path.basename(archive) == manifest.get("source")
+
+
+def run_maintenance(options):
+    """``--verify`` / ``--repair`` entry point; returns a process exit code."""
+    out = install_root(INSTALL_DIR)
+    manifest = load_manifest(out / MANIFEST_NAME)
+    entries = manifest["files"]
+    if not entries:
+        print(f"No install manifest in {out}", file=sys.stderr)
+        return 2
+
+    started = time.monotonic()
+    problems = verify_install(out, entries)
+    for rel, problem in sorted(problems.items()):
+        print(f"{problem}: {rel}")
+    print(f"{len(entries) - len(problems)} / {len(entries)} entries OK "
+          f"({time.monotonic() - started:.1f}s)")
+    if not problems or not options.repair:
+        return 1 if problems else 0
+
+    cached = []
+    for candidate in find_cached_archives():
+        try:
+            validate_xz_archive(candidate)
+            if installed_from(candidate, manifest):
+                cached.append(candidate)
+        except (OSError, ValueError) as e:
+            print(f"Skipping {candidate}: {e}", file=sys.stderr)
+    if cached:
+        archive = max(cached, key=os.path.getmtime)
+    else:
+        url, name = latest_release_asset()
+        if not url:
+            print("No release found on GitHub.", file=sys.stderr)
+            return 1
+        if not same_archive(manifest, name):
+            print(f"The install came from {manifest.get('source')}, which "
+                  f"is neither cached nor the latest release; reinstall "
+                  f"instead.", file=sys.stderr)
+            return 1
+        print(f"Fetching {name}…")
+        DOWNLOAD_DIR.mkdir(parents=True, exist_ok=True)
+        downloader = SegmentedDownloader(url, DOWNLOAD_DIR / name,
+                                         segments=options.segments)
+        archive = str(downloader.run())
+        DIGEST_MEMO.remember(archive, downloader.sha256)
+        if not installed_from(archive, manifest):
+            print(f"{name} differs from the installed release",
+                  file=sys.stderr)
+            return 1
+    ok, detail = verify_archive(archive)
+    if not ok:
+        print(f"{os.path.basename(archive)}: {detail}", file=sys.stderr)
+        return 1
+    print(f"Repairing {len(problems)} entries from "
+          f"{os.path.basename(archive)}…")
+    repair_install(out, archive, problems)
+
+    remaining = verify_install(out, {rel: entries[rel] for rel in problems})
+    for rel, problem in sorted(remaining.items()):
+        print(f"still {problem}: {rel}")
+    print("Repair complete" if not remaining else "Repair incomplete")
+    return 1 if remaining else 0
+
+
+# ---------------------------------------------------------------------------
+# Peer cache
+# ---------------------------------------------------------------------------
+
+PEER_PORT = 47631
+PEER_PROBE = b"HELLFIRE-PEER?"
+
+
+class _PeerHandler(http.server.BaseHTTPRequestHandler):
+    server_version = "HellFirePeer/1"
+
+    def do_HEAD(self):
+        self._respond(body=False)
+
+    def do_GET(self):
+        self._respond(body=True)
+
+    def _respond(self, body):
+        offer = self.server.offer
+        if self.path == "/peer.json":
+            data = json.dumps(offer).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            if body:
+                self.wfile.write(data)
+            return
+        if self.path != "/" + offer["name"]:
+            self.send_error(404)
+            return
+        size = offer["size"]
+        start, end = 0, size
+        rng = self.headers.get("Range")
+        if rng:
+            span = parse_range(rng, size)
+            if span is None:
+                self.send_response(416)
+                self.send_header("Content-Range", f"bytes */{size}")
+                self.end_headers()
+                return
+            start, end = span
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{end - 1}/{size}")
+        else:
+            self.send_response(200)
+        self.send_header("Content-Type", "application/x-xz")
+        self.send_header("Content-Length", str(end - start))
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("ETag", f'"{offer["sha256"]}"')
+        self.end_headers()
+        if body:
+            with open(self.server.archive, "rb") as f:
+                self.connection.sendfile(f, start, end - start)
+            DIAGNOSTICS.incr("peer_bytes_served", end - start)
+
+    def log_message(self, format, *args):
+        DIAGNOSTICS.incr("peer_requests")
+
+
+class PeerServer:
+    """Serves one verified archive to other installers on the LAN.
+
+    HTTP on ``port`` answers ``/peer.json`` (name, size, SHA-256) and the
+    archive itself with Range support; a UDP socket on the same port
+    answers discovery broadcasts with the same offer.
+    """
+
+    def __init__(self, archive, port=PEER_PORT, digest=None):
+        self.archive = Path(archive)
+        self.offer = {
+            "name": self.archive.name,
+            "size": self.archive.stat().st_size,
+            "sha256": digest or DIGEST_MEMO.get(self.archive),
+            "port": port,
+        }
+        self.httpd = http.server.ThreadingHTTPServer(("", port), _PeerHandler)
+        self.httpd.archive = self.archive
+        self.httpd.offer = self.offer
+        self.udp = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.udp.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.udp.bind(("", port))
+
+    def serve_forever(self):
+        threading.Thread(target=self._answer_probes, daemon=True).start()
+        self.httpd.serve_forever()
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        self.udp.close()
+
+    def _answer_probes(self):
+        reply = json.dumps(self.offer).encode()
+        while True:
+            try:
+                data, addr = self.udp.recvfrom(512)
+            except OSError:
+                return
+            if data == PEER_PROBE:
+                self.udp.sendto(reply, addr)
+
+
+def _peer_address(spec, port=PEER_PORT):
+    host, sep, p = spec.rpartition(":")
+    return (host, int(p)) if sep and p.isdigit() else (spec, port)
+
+
+def discover_peers(port=PEER_PORT, timeout=0.5):
+    """Broadcast a discovery probe; returns ``[(host, offer)]`` replies."""
+    found = []
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+        sock.sendto(PEER_PROBE, ("<broadcast>", port))
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            sock.settimeout(max(0.01, deadline - time.monotonic()))
+            try:
+                data, (host, _) = sock.recvfrom(4096)
+                found.append((host, json.loads(data)))
+            except socket.timeout:
+                break
+            except ValueError:
+                continue
+    return found
+
+
+def find_peer(name, peers=(), discover=False, port=PEER_PORT):
+    """URL of a LAN peer offering asset ``name``, or None.
+
+    Configured ``HOST[:PORT]`` peers are asked first, then broadcast
+    replies. A peer whose SHA-256 differs from the published one is
+    ignored; what it serves is verified again after download regardless.
+    Without a published SHA-256 nothing can vouch for a peer's copy, so
+    peers are not used at all.
+    """
+    def ask(spec):
+        host, p = _peer_address(spec, port)
+        r = http_session().get(f"http://{host}:{p}/peer.json", timeout=2)
+        r.raise_for_status()
+        return host, r.json()
+
+    offers = []
+    if peers:
+        with concurrent.futures.ThreadPoolExecutor(len(peers)) as pool:
+            for future in [pool.submit(ask, spec) for spec in peers]:
+                try:
+                    offers.append(future.result())
+                except Exception:
+                    continue
+    if discover:
+        try:
+            offers += discover_peers(port)
+        except OSError:
+            pass
+    candidates = [(host, offer) for host, offer in offers
+                  if offer.get("name") == name]
+    if not candidates:
+        return None
+    expected = published_sha256(name)
+    if expected is None:
+        return None
+    for host, offer in candidates:
+        if offer.get("sha256") == expected:
+            return f"http://{host}:{offer.get('port', port)}/{name}"
+    return None
+
+
+# ---------------------------------------------------------------------------
+# Install pipeline
+# ---------------------------------------------------------------------------
+
+EXIT_OK = 0
+EXIT_FAILED = 1
+EXIT_NO_RELEASE = 3
+EXIT_DOWNLOAD = 4
+EXIT_VERIFY = 5
+EXIT_EXTRACT = 6
+EXIT_SETUP = 7
+
+EVENT_FIELDS = {
+    "status": ("message", "dot"),
+    "progress": ("fraction", "message"),
+    "busy": ("message",),
+    "idle": (),
+    "stat": ("key", "value", "sub"),
+    "done": ("message",),
+    "fail": ("message", "code"),
+    "release": ("url", "name"),
+}
+
+
+class InstallPipeline:
+    """Search, fetch, verify, extract and finalize, without any UI.
+
+    Progress goes to ``emit(kind, *args)`` as small picklable events.
+    Status dots are named by role ("accent", "success", "error"), and the
+    front end maps them to colours:
+
+        ("status", message, dot)       dot may be None
+        ("progress", fraction, text)   text may be None
+        ("busy", message)              indeterminate progress
+        ("idle",)                      indeterminate progress ends
+        ("stat", key, value, sub)      None leaves that field unchanged
+        ("done", message)
+        ("fail", message, code)        code is one of the EXIT_* values
+        ("release", url, name)         refresh_stats found no local archive
+    """
+
+    def __init__(self, options, emit, limiter=None):
+        self.options = options
+        self.emit = emit
+        self.limiter = limiter or RateLimiter(options.limit_rate)
+        self.keyword = ARCHIVE_KEYWORD
+        self.base_dir = INSTALL_DIR
+        self.live_dir = self.base_dir / CURRENT_NAME
+        self.firefox_bin = self.live_dir / "firefox" / "firefox"
+        self.user_bin = Path.home() / ".local" / "bin"
+        self.user_bin_symlink = self.user_bin / "hellfire"
+        self.desktop_file_path = (
+            Path.home() / ".local/share/applications/hellfire.desktop"
+        )
+        self.file_to_extract = None
+        self.source_url = None
+        self.store = None
+        self.download_segments = options.segments
+        self.stream_extract = options.stream
+
+    # ----- events ------------------------------------------------------------
+
+    def update_status(self, message, *, dot=None):
+        self.emit("status", message, dot)
+
+    def update_progress(self, fraction, text=None):
+        self.emit("progress", fraction, text)
+
+    def show_indeterminate(self, message):
+        self.emit("busy", message)
+
+    def stop_indeterminate(self):
+        self.emit("idle")
+
+    def _set_stat(self, key, value=None, sub=None):
+        self.emit("stat", key, value, sub)
+
+    def _fail(self, message, code=EXIT_FAILED):
+        self.emit("fail", message, code)
+        return code
+
+    def _succeed(self, message):
+        self.emit("done", message)
+        return EXIT_OK
+
+    # ----- install flow ------------------------------------------------------
+
+    def run(self):
+        """Install or update; returns an exit status (``EXIT_OK``...)."""
+        try:
+            migrate_legacy_install(self.base_dir)
+        except OSError as e:
+            return self._fail(f"Directory error: {e}", EXIT_SETUP)
+        self.show_indeterminate(f"Searching for '{self.keyword}*.tar.xz'…")
+        cached = self._pick_cached_archive(find_cached_archives(self.keyword))
+
+        stream_url = None
+        if cached:
+            self.file_to_extract = cached
+            size_mb = os.path.getsize(self.file_to_extract) / (1024 * 1024)
+            self._set_stat("source", value="Local", sub="Cached file")
+            self._set_stat("size", value=f"{size_mb:.1f} MB", sub="On disk")
+            done = self._up_to_date(lambda: archive_version(cached))
+            if done is not None:
+                return done
+            self.stop_indeterminate()
+            self.update_status(
+                f"Found: {os.path.basename(self.file_to_extract)}",
+                dot="accent",
+            )
+        else:
+            self.show_indeterminate("Fetching latest release info…")
+            self._set_stat("source", value="GitHub", sub="Fetching")
+            url, name = self._latest_release_asset()
+            if not url:
+                self.stop_indeterminate()
+                return self._fail("No release found on GitHub.",
+                                  EXIT_NO_RELEASE)
+            done = self._up_to_date(release_version, name)
+            if done is not None:
+                return done
+            self.stop_indeterminate()
+            peer_url = self._find_peer(name)
+            if self.stream_extract:
+                stream_url = peer_url or self._rank_sources(url, name)[0]
+                stream_name = name
+            else:
+                path = None
+                if peer_url:
+                    path = self._download_from_peer(peer_url, name)
+                if path is None:
+                    urls = self._rank_sources(url, name)
+                    self.update_status(f"Downloading {name}…", dot="accent")
+                    ok, path = self._download(urls[0], name, urls[1:])
+                    if not ok:
+                        return self._fail(f"Download failed: {path}",
+                                          EXIT_DOWNLOAD)
+                    ok, detail = verify_archive(path)
+                    if not ok:
+                        os.remove(path)
+                        return self._fail(f"Download rejected: {detail}",
+                                          EXIT_VERIFY)
+                    self._set_stat("source",
+                                   value=source_label(self.source_url),
+                                   sub=detail.title())
+                self.file_to_extract = path
+                size_mb = os.path.getsize(path) / (1024 * 1024)
+                self._set_stat("size", value=f"{size_mb:.1f} MB",
+                               sub="Downloaded")
+
+        try:
+            self.base_dir.mkdir(parents=True, exist_ok=True)
+        except Exception as e:
+            return self._fail(f"Directory error: {e}", EXIT_SETUP)
+
+        if stream_url:
+            self.update_status("Downloading and extracting…", dot="accent")
+            ok, err = self._stream_extract(stream_url, stream_name,
+                                           self.base_dir)
+            if not ok:
+                return self._fail(f"Streaming install failed: {err}",
+                                  EXIT_EXTRACT)
+        else:
+            self.update_status("Extracting archive…", dot="accent")
+            ok, err = self._extract_archive(self.file_to_extract,
+                                            self.base_dir)
+            if not ok:
+                return self._fail(f"Extraction failed: {err}", EXIT_EXTRACT)
+
+        self.show_indeterminate("Finalizing setup…")
+        if not self.firefox_bin.exists():
+            self.stop_indeterminate()
+            return self._fail("'firefox' binary missing in archive.",
+                              EXIT_EXTRACT)
+
+        err = self._finalize()
+        if err:
+            self.stop_indeterminate()
+            return self._fail(f"Setup failed: {err}", EXIT_SETUP)
+
+        prune_versions(self.options.keep, self.base_dir)
+        if self.store is not None:
+            self.store.collect()
+        self.stop_indeterminate()
+        self.update_progress(1.0, "Installation complete")
+        self._set_stat("status", value="Done", sub="Successful")
+        return self._succeed("Installation complete — launch from your menu")
+
+    def rollback(self, name=None):
+        """Make version ``name``, by default the previous one, active again.
+
+        Only the ``current`` link changes, so this takes milliseconds.
+        Returns an exit status.
+        """
+        try:
+            migrate_legacy_install(self.base_dir)
+        except OSError as e:
+            return self._fail(f"Directory error: {e}", EXIT_SETUP)
+        target = name or previous_version(self.base_dir)
+        if not target:
+            return self._fail("No other HellFire version is installed.")
+        was = current_version(self.base_dir)
+        if target == was:
+            return self._succeed(f"HellFire {target} is already active")
+        try:
+            switch_version(target, self.base_dir)
+        except OSError as e:
+            return self._fail(f"Rollback failed: {e}")
+        err = self._finalize()
+        if err:
+            return self._fail(f"Setup failed: {err}", EXIT_SETUP)
+        self._set_stat("status", value="Done", sub="Rolled back")
+        return self._succeed(f"Switched from HellFire {was} to {target}")
+
+    def _up_to_date(self, incoming_version, name=None):
+        """Finish early when the installed build already matches.
+
+        ``name`` is the release asset when only its tag version is known.
+        Returns the run's exit status when it finished, None to carry on.
+        """
+        if self.options.force:
+            return None
+        installed = installed_version(self.live_dir)
+        if not installed or not self.firefox_bin.exists():
+            return None
+        self.show_indeterminate("Checking installed version…")
+        try:
+            incoming = incoming_version()
+        except Exception:
+            incoming = None
+        if not same_version(installed, incoming):
+            return None
+        manifest = load_manifest(self.live_dir / MANIFEST_NAME)
+        if name and not same_archive(manifest, name):
+            return None
+        err = self._finalize()
+        self.stop_indeterminate()
+        if err:
+            return self._fail(f"Setup failed: {err}", EXIT_SETUP)
+        self.update_progress(1.0, "Already up to date")
+        self._set_stat("status", value="Done", sub="Up to date")
+        return self._succeed(
+            f"HellFire {installed['version']} is already up to date"
+        )
+
+    def _finalize(self):
+        """Refresh the launcher symlink and .desktop entry; returns an error."""
+        try:
             self.user_bin.mkdir(parents=True, exist_ok=True)
             if self.user_bin_symlink.exists() or self.user_bin_symlink.is_symlink():
                 self.user_bin_symlink.unlink()
             self.user_bin_symlink.symlink_to(self.firefox_bin)
 
             icon_path = (
-                self.base_dir / "firefox/browser/chrome/icons/default/default128.png"
+                self.live_dir / "firefox/browser/chrome/icons/default/default128.png"
             )
             desktop_entry = (
                 "[Desktop Entry]\n"
@@ -1283,113 +2634,287 @@ class HellFireInstallerTk:
             self.desktop_file_path.parent.mkdir(parents=True, exist_ok=True)
             self.desktop_file_path.write_text(desktop_entry, encoding="utf-8")
         except Exception as e:
-            self.stop_indeterminate()
-            self._fail(f"Setup failed: {e}")
-            return
-
-        self.stop_indeterminate()
-        self.update_progress(1.0, "Installation complete")
-        self.update_status("Installation complete — launch from your menu",
-                           dot=self.colors["success"])
-        self._set_stat("status", value="Done", sub="Successful")
-        self._installed = True
-        self.root.after(0, self._mark_done)
-
-    def _mark_done(self):
-        self.action_button.configure_text("✓ Installed")
-        self.action_button.set_enabled(False)
-
-    def _fail(self, message):
-        self.update_status(message, dot=self.colors["error"])
-        self._set_stat("status", value="Failed", sub="Click retry")
-        self.root.after(0, lambda: (
-            self.action_button.set_enabled(True),
-            self.action_button.configure_text("Retry"),
-        ))
+            return str(e)
+        return None
 
     # ----- network -----------------------------------------------------------
 
     def _latest_release_asset(self):
-        api = "https://api.github.com/repos/CYFARE/HellFire/releases/latest"
         try:
-            r = requests.get(api, timeout=12)
-            r.raise_for_status()
-            for a in r.json().get("assets", []):
-                if a.get("name", "").endswith(".tar.xz"):
-                    return a.get("browser_download_url"), a.get("name")
+            return latest_release_asset()
         except Exception:
             self.update_status("GitHub API error",
-                               dot=self.colors["error"])
+                               dot="error")
         return None, None
 
-    def _download(self, url, filename):
+    def _find_peer(self, name):
+        if not (self.options.peer or self.options.discover_peers):
+            return None
+        self.show_indeterminate("Looking for LAN peers…")
+        try:
+            url = find_peer(name, self.options.peer or (),
+                            self.options.discover_peers,
+                            self.options.peer_port)
+        except Exception:
+            url = None
+        self.stop_indeterminate()
+        if url:
+            self._set_stat("source", value="Peer", sub=url.split("/")[2])
+        return url
+
+    def _download_from_peer(self, url, name):
+        """Fetch and verify ``name`` from a LAN peer; None to fall back."""
+        host = url.split("/")[2]
+        self.update_status(f"Downloading {name} from {host}…", dot="accent")
+        ok, path = self._download(url, name)
+        if ok:
+            ok, detail = verify_archive(path)
+            if ok and detail == "verified":
+                self._set_stat("source", value="Peer", sub=detail.title())
+                return path
+            os.remove(path)
+            path = detail
+        self.update_status(f"Peer {host} failed ({path}), using GitHub",
+                           dot="error")
+        self._set_stat("source", value="GitHub", sub="Fetching")
+        return None
+
+    def _rank_sources(self, url, name):
+        """Configured download URLs for asset ``name``, fastest first."""
+        urls = [url if src == "github" else f"{src.rstrip('/')}/{name}"
+                for src in self.options.source or ["github"]]
+        if len(urls) > 1:
+            self.show_indeterminate(f"Probing {len(urls)} download sources…")
+            urls = rank_sources(urls) or urls
+            self.stop_indeterminate()
+        self._set_stat("source", value=source_label(urls[0]),
+                       sub=f"Fastest of {len(urls)}" if len(urls) > 1
+                       else "Fetching")
+        return urls
+
+    def _download(self, url, filename, mirrors=()):
         try:
-            dest_dir = Path.home() / "Downloads"
+            dest_dir = DOWNLOAD_DIR
             dest_dir.mkdir(parents=True, exist_ok=True)
             dest = dest_dir / filename
-
-            with requests.get(url, stream=True, timeout=30) as r:
-                r.raise_for_status()
-                total = int(r.headers.get("content-length", 0))
-                done = 0
-                with open(dest, "wb") as f:
-                    for chunk in r.iter_content(chunk_size=8192):
-                        if not chunk:
-                            continue
-                        f.write(chunk)
-                        done += len(chunk)
-                        if total > 0:
-                            frac = done / total
-                            mb_d = done / (1024 * 1024)
-                            mb_t = total / (1024 * 1024)
-                            self.update_progress(
-                                frac,
-                                f"Downloading… {mb_d:.1f} / {mb_t:.1f} MB",
-                            )
-                            self._set_stat("size",
-                                           value=f"{mb_t:.1f} MB",
-                                           sub=f"{int(frac * 100)}% done")
+            started = time.monotonic()
+
+            def progress(done, total):
+                if total <= 0:
+                    return
+                frac = done / total
+                mb_d = done / (1024 * 1024)
+                mb_t = total / (1024 * 1024)
+                rate = mb_d / max(1e-6, time.monotonic() - started)
+                self.update_progress(
+                    frac,
+                    f"Downloading… {mb_d:.1f} / {mb_t:.1f} MB "
+                    f"· {rate:.1f} MB/s",
+                )
+                self._set_stat("size",
+                               value=f"{mb_t:.1f} MB",
+                               sub=f"{int(frac * 100)}% done")
+
+            def failover(new_url):
+                self._set_stat("source", value=source_label(new_url),
+                               sub="Failover")
+
+            downloader = SegmentedDownloader(
+                url, dest, segments=self.download_segments, progress=progress,
+                mirrors=mirrors, digest=published_sha256(filename),
+                on_failover=failover, limiter=self.limiter,
+            )
+            try:
+                downloader.run()
+            finally:
+                self.source_url = downloader.source
+            DIGEST_MEMO.remember(dest, downloader.sha256)
             return True, str(dest)
         except Exception as e:
             return False, str(e)
 
+    def _pick_cached_archive(self, candidates):
+        """Newest cached archive that passes its checksum, or None."""
+        for path in sorted(candidates, key=os.path.getmtime, reverse=True):
+            self.show_indeterminate(
+                f"Verifying {os.path.basename(path)}…"
+            )
+            try:
+                validate_xz_archive(path)
+                ok, detail = verify_archive(path)
+            except (OSError, ValueError) as e:
+                ok, detail = False, str(e)
+            if ok:
+                return path
+            self.update_status(
+                f"Skipping {os.path.basename(path)}: {detail}",
+                dot="error",
+            )
+        return None
+
     def _extract_archive(self, archive, out):
         try:
-            with tarfile.open(archive, "r:xz") as tar:
-                members = tar.getmembers()
-                total = max(1, len(members))
-                kwargs = {}
-                if hasattr(tarfile, "data_filter"):
-                    kwargs["filter"] = "data"
-                step = max(1, total // 100)
-                for i, member in enumerate(members):
-                    tar.extract(member, path=out, **kwargs)
-                    if i % step == 0 or i == total - 1:
-                        frac = (i + 1) / total
-                        self.update_progress(
-                            frac, f"Extracting… {i + 1} / {total} files"
-                        )
-                        self._set_stat("files",
-                                       value=f"{i + 1}",
-                                       sub=f"of {total}")
+            total = max(1, os.path.getsize(archive))
+            backend = choose_decompressor(archive)
+            shown = [-1]
+
+            # Compressed bytes consumed track the real work far better than
+            # a member count, since libxul dominates the payload.
+            def progress(done):
+                pct = int(done / total * 100)
+                if pct != shown[0]:
+                    shown[0] = pct
+                    self.update_progress(
+                        done / total, f"Extracting… {pct}% · {backend.name}"
+                    )
+
+            self.update_status(f"Extracting archive ({backend.name})…")
+            with open(archive, "rb") as f:
+                reader = CountingReader(f, progress, hashlib.sha256())
+                with backend.stream(reader) as data:
+                    result = self._untar_stream(data, out)
+                while reader.read(1024 * 1024):
+                    pass  # hash the xz index/footer tar did not need
+            digest = reader.hasher.hexdigest()
+            DIGEST_MEMO.remember(archive, digest)
+            self._swap_in(result, out, os.path.basename(archive), digest)
+            self._set_stat("files", value=f"{result.count}",
+                           sub=f"{result.written} written")
             return True, ""
         except Exception as e:
             return False, str(e)
 
+    def _stream_extract(self, url, name, out):
+        """Untar the release straight off the wire, without a local copy."""
+        try:
+            with REQUEST_POLICY.get(
+                url, stream=True,
+                timeout=(30, SegmentedDownloader.STALL_SECS),
+            ) as r:
+                r.raise_for_status()
+                r.raw.decode_content = True
+                total = int(r.headers.get("content-length", 0))
+                started = time.monotonic()
+
+                def progress(done):
+                    if total <= 0:
+                        return
+                    mb_d = done / (1024 * 1024)
+                    rate = mb_d / max(1e-6, time.monotonic() - started)
+                    self.update_progress(
+                        done / total,
+                        f"Downloading & extracting… {mb_d:.1f} / "
+                        f"{total / (1024 * 1024):.1f} MB · {rate:.1f} MB/s",
+                    )
+
+                backend = choose_decompressor()
+                self.update_status(
+                    f"Downloading and extracting ({backend.name})…"
+                )
+                reader = CountingReader(r.raw, progress, hashlib.sha256(),
+                                        self.limiter)
+                with backend.stream(reader) as data:
+                    result = self._untar_stream(data, out)
+                while reader.read(1024 * 1024):
+                    pass  # hash the xz index/footer tar did not need
+            expected = published_sha256(name)
+            if expected and reader.hasher.hexdigest() != expected:
+                shutil.rmtree(Path(result.out).parent, ignore_errors=True)
+                return False, "checksum mismatch, nothing was installed"
+            self._swap_in(result, out, name, reader.hasher.hexdigest())
+            self._set_stat("size", value=f"{total / (1024 * 1024):.1f} MB",
+                           sub="Streamed")
+            self._set_stat("files", value=f"{result.count}",
+                           sub=f"{result.written} written")
+            return True, ""
+        except Exception as e:
+            return False, str(e)
+
+    def _untar_stream(self, fileobj, out):
+        """Extract an uncompressed tar stream into a staging directory.
+
+        The active version is not touched: files unchanged since it was
+        installed are hard-linked from it. Returns the finished extractor,
+        whose tree ``_swap_in`` then installs.
+        """
+        def on_member(count):
+            if count % 50 == 0:
+                self._set_stat("files", value=f"{count}", sub="extracted")
+
+        stage = Path(out) / STAGING_NAME
+        shutil.rmtree(stage, ignore_errors=True)  # left by a killed run
+        (stage / "incoming").mkdir(parents=True)
+        live = install_root(out)
+        self.store = self._content_store(stage)
+        extractor = ParallelExtractor(
+            stage / "incoming", on_member=on_member, reuse=live,
+            previous=load_manifest(live / MANIFEST_NAME)["files"],
+            store=self.store,
+        )
+        try:
+            extractor.extract(fileobj)
+        except BaseException:
+            shutil.rmtree(stage, ignore_errors=True)
+            raise
+        return extractor
+
+    def _content_store(self, near):
+        """The ``--store`` in use, or None when off or unusable from the
+        filesystem ``near`` is on, since trees could not link into it."""
+        if not self.options.store:
+            return None
+        try:
+            store = ContentStore(self.options.store)
+            usable = store.root.stat().st_dev == Path(near).stat().st_dev
+        except OSError as e:
+            usable, reason = False, e.strerror
+        else:
+            reason = "on another filesystem"
+        if not usable:
+            self.update_status(f"Not using the file store ({reason})",
+                               dot="error")
+            return None
+        return store
+
+    def _swap_in(self, extractor, out, source=None, digest=None):
+        """File the staged tree under ``versions/`` and make it active.
+
+        Reinstalling a version already present exchanges the two trees in
+        one rename. Returns the version name.
+        """
+        tree = Path(extractor.out)
+        stage = tree.parent
+        if not (tree / self.firefox_bin.relative_to(self.live_dir)).exists():
+            shutil.rmtree(stage, ignore_errors=True)
+            raise IOError("'firefox' binary missing in archive")
+        save_manifest(tree / MANIFEST_NAME, extractor.entries, source=source,
+                      sha256=digest)
+        name = version_name(tree) or "unversioned"
+        os.rename(tree, stage / name)
+        versions = Path(out) / VERSIONS_NAME
+        versions.mkdir(exist_ok=True)
+        swap_in(stage, versions, [name])
+        switch_version(name, out)
+        shutil.rmtree(stage, ignore_errors=True)
+        return name
+
     # ----- stats refresh -----------------------------------------------------
 
-    def _refresh_stats(self):
+    def refresh_stats(self):
         """Pre-fetch release info so top cards show real data on launch."""
-        # 1) Check for a local cached file first
-        candidates = []
-        for loc in [".", str(Path.home()), str(Path.home() / "Downloads")]:
-            candidates += glob.glob(os.path.join(loc, f"{self.keyword}*.tar.xz"))
-
-        if candidates:
-            cached = max(candidates, key=os.path.getmtime)
-            size_mb = os.path.getsize(cached) / (1024 * 1024)
+        # 1) Check for a complete local cached file first; the xz index
+        #    also tells us the unpacked size without decompressing.
+        candidates = find_cached_archives(self.keyword)
+
+        for cached in sorted(candidates, key=os.path.getmtime, reverse=True):
+            try:
+                unpacked = validate_xz_archive(cached)
+            except (OSError, ValueError):
+                continue
+            size_mb = unpacked / (1024 * 1024)
             self._set_stat("source", value="Local", sub="Cached file")
-            self._set_stat("size", value=f"{size_mb:.1f} MB", sub=os.path.basename(cached)[:26])
+            self._set_stat("size", value=f"{size_mb:.1f} MB",
+                           sub=f"Unpacked · {os.path.basename(cached)}"[:26])
             self._set_stat("files", value="—", sub="Pending")
             self._set_stat("status", value="Ready", sub="Click install")
             return
@@ -1399,7 +2924,8 @@ class HellFireInstallerTk:
         url, name = self._latest_release_asset()
         if url and name:
             try:
-                r = requests.head(url, timeout=10, allow_redirects=True)
+                r = REQUEST_POLICY.head(url, allow_redirects=True,
+                                        hedge=True)
                 size = int(r.headers.get("content-length", 0))
                 if size > 0:
                     size_mb = size / (1024 * 1024)
@@ -1410,6 +2936,7 @@ class HellFireInstallerTk:
             except Exception:
                 self._set_stat("source", value="GitHub", sub="Latest release")
                 self._set_stat("size", value="—", sub=name[:26])
+            self.emit("release", url, name)
         else:
             self._set_stat("source", value="GitHub", sub="Unavailable")
             self._set_stat("size", value="—", sub="API error")
@@ -1417,28 +2944,1834 @@ class HellFireInstallerTk:
         self._set_stat("files", value="—", sub="Pending")
         self._set_stat("status", value="Ready", sub="Click install")
 
-    # ----- utils -------------------------------------------------------------
 
-    @staticmethod
-    def _hex_to_rgb(h):
-        h = h.lstrip("#")
-        return tuple(int(h[i:i + 2], 16) for i in (0, 2, 4))
+def follow_controls(conn, limiter):
+    """Apply ``("limit", bytes_per_sec)``, ``("pause",)`` and
+    ``("resume",)`` messages from ``conn`` to ``limiter`` in a thread."""
+    def listen():
+        while True:
+            try:
+                kind, *args = conn.recv()
+            except (EOFError, OSError):
+                return
+            if kind == "limit":
+                limiter.set_rate(args[0])
+            elif kind == "pause":
+                limiter.pause()
+            elif kind == "resume":
+                limiter.resume()
 
-    @staticmethod
-    def _tilde(path):
+    threading.Thread(target=listen, daemon=True).start()
+
+
+def run_pipeline_process(options, conn):
+    """Child-process entry point: install, sending events over ``conn``.
+
+    The parent may send controls for ``follow_controls`` back over the same
+    pipe at any time.
+    """
+    lock = threading.Lock()
+    limiter = RateLimiter(options.limit_rate)
+
+    def emit(*event):
+        with lock:
+            conn.send(event)
+
+    follow_controls(conn, limiter)
+    try:
+        InstallPipeline(options, emit, limiter).run()
+    except Exception as e:
+        emit("fail", f"Installer error: {e}", EXIT_FAILED)
+    finally:
+        emit("diagnostics", DIAGNOSTICS.snapshot())
+        conn.close()
+
+
+PREFETCH_NICE = 10
+
+
+def run_prefetch_process(options, url, name, conn=None):
+    """Child-process entry point: download the release at low priority.
+
+    One connection and a raised nice value leave the machine to the user;
+    SIGTERM stops the transfer after checkpointing it, so the install that
+    follows resumes from the partial file. Controls sent over ``conn`` are
+    applied as for the install.
+    """
+    signal.signal(signal.SIGTERM, lambda *args: sys.exit(1))
+    os.nice(PREFETCH_NICE)
+    installed = installed_version(INSTALL_DIR)
+    if installed and same_version(installed, release_version()) \
+            and same_archive(load_manifest(install_root() / MANIFEST_NAME),
+                             name):
+        return
+    limiter = RateLimiter(options.limit_rate)
+    if conn is not None:
+        follow_controls(conn, limiter)
+    pipeline = InstallPipeline(options, lambda *event: None, limiter)
+    pipeline.download_segments = 1
+    urls = pipeline._rank_sources(url, name)
+    ok, _ = pipeline._download(urls[0], name, urls[1:])
+    sys.exit(0 if ok else 1)
+
+
+# ---------------------------------------------------------------------------
+# Progress channel
+# ---------------------------------------------------------------------------
+
+class ProgressChannel:
+    """Latest-value mailbox between worker threads and the UI.
+
+    Workers publish by overwriting a keyed slot, which is a single dict
+    store and never blocks. The UI polls at its own cadence and renders only
+    the slots that changed since the previous frame, in publish order, so
+    intermediate values are dropped instead of queued.
+    """
+
+    def __init__(self):
+        self._seq = itertools.count(1)
+        self._slots = {}
+        self.published = 0
+
+    def publish(self, key, value):
+        seq = next(self._seq)
+        self._slots[key] = (seq, value)
+        self.published = seq
+
+    def changes(self, since):
+        """Return ``[(seq, key, value)]`` published after ``since``."""
+        fresh = [(seq, key, value)
+                 for key, (seq, value) in list(self._slots.items())
+                 if seq > since]
+        fresh.sort(key=lambda item: item[0])
+        return fresh
+
+
+# ---------------------------------------------------------------------------
+# Command line
+# ---------------------------------------------------------------------------
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="HellFire installer")
+    parser.add_argument(
+        "--segments", type=int, default=4, metavar="N",
+        help="parallel HTTP range requests per download (default: 4)",
+    )
+    parser.add_argument(
+        "--stream", action="store_true",
+        help="extract while downloading instead of keeping the archive",
+    )
+    parser.add_argument(
+        "--limit-rate", type=parse_rate, default=0, metavar="RATE",
+        help="cap download bandwidth, e.g. 500K or 2M bytes per second "
+             "(default: unlimited; adjustable live in the window)",
+    )
+    parser.add_argument(
+        "--prefetch", action="store_true",
+        help="start downloading the latest release in the background at "
+             "launch, before Install is clicked",
+    )
+    parser.add_argument(
+        "--force", action="store_true",
+        help="reinstall even when the installed version is current",
+    )
+    parser.add_argument(
+        "--store", nargs="?", const=str(INSTALL_DIR / "store"), metavar="DIR",
+        help="keep extracted files once in a content-addressed store and "
+             "hard-link each installed version from it (default DIR: "
+             "~/HellFire/store); DIR must be on the install's filesystem "
+             "and may be shared by several users",
+    )
+    parser.add_argument(
+        "--keep", type=int, default=KEEP_VERSIONS, metavar="N",
+        help=f"installed versions to keep for --rollback, the active one "
+             f"included (default: {KEEP_VERSIONS})",
+    )
+    parser.add_argument(
+        "--diagnostics", action="store_true",
+        help="print network and pipeline counters as JSON on exit",
+    )
+    parser.add_argument(
+        "--source", action="append", metavar="URL",
+        help="download source in preference order (repeatable): 'github', "
+             "an HTTP mirror or a file:// directory holding the release "
+             "asset; several are probed and the fastest is used, failing "
+             "over to the others if it stalls (default: github)",
+    )
+    parser.add_argument(
+        "--peer", action="append", metavar="HOST[:PORT]",
+        help="LAN installer to fetch the release from before GitHub "
+             "(repeatable)",
+    )
+    parser.add_argument(
+        "--discover-peers", action="store_true",
+        help="find LAN peers with a UDP broadcast",
+    )
+    parser.add_argument(
+        "--serve", action="store_true",
+        help="serve the newest verified cached archive to LAN peers until "
+             "interrupted (after installing, with --headless)",
+    )
+    parser.add_argument(
+        "--peer-port", type=int, default=PEER_PORT, metavar="PORT",
+        help=f"TCP/UDP port for --serve and peer discovery "
+             f"(default: {PEER_PORT})",
+    )
+    checks = parser.add_mutually_exclusive_group()
+    checks.add_argument(
+        "--headless", action="store_true",
+        help="install without a display, printing one JSON event per line; "
+             "exit status 0 when installed or already current, 3 no release, "
+             "4 download failed, 5 checksum mismatch, 6 extraction failed, "
+             "7 setup failed, 1 anything else",
+    )
+    checks.add_argument(
+        "--verify", action="store_true",
+        help="check the installed files against the install manifest "
+             "and exit (status 1 if anything is damaged)",
+    )
+    checks.add_argument(
+        "--repair", action="store_true",
+        help="verify, then re-extract only missing or damaged files",
+    )
+    checks.add_argument(
+        "--rollback", nargs="?", const="", metavar="VERSION",
+        help="switch back to the previously installed version, or to "
+             "VERSION, and exit; lists the installed versions",
+    )
+    return parser.parse_args(argv)
+
+
+def run_headless(options):
+    """Install without Tk, printing one JSON object per event on stdout.
+
+    Progress is reported once per whole percent and unchanged stats are
+    not repeated. Returns the pipeline's exit status.
+    """
+    last = {}
+    lock = threading.Lock()
+
+    def emit(kind, *args):
+        event = {"event": kind, **dict(zip(EVENT_FIELDS[kind], args))}
+        if kind == "progress":
+            key, value = kind, int(event["fraction"] * 100)
+        elif kind == "stat":
+            key, value = (kind, event["key"]), event
+        else:
+            key = value = None
+        line = json.dumps(event, ensure_ascii=False) + "\n"
+        with lock:
+            if key is not None:
+                if last.get(key) == value:
+                    return
+                last[key] = value
+            sys.stdout.write(line)
+            sys.stdout.flush()
+
+    try:
+        return InstallPipeline(options, emit).run()
+    except KeyboardInterrupt:
+        return 130
+
+
+def run_peer_server(options):
+    """Serve the newest verified cached archive until interrupted."""
+    for path in sorted(find_cached_archives(ARCHIVE_KEYWORD),
+                       key=os.path.getmtime, reverse=True):
         try:
-            return "~/" + str(path.relative_to(Path.home()))
-        except ValueError:
-            return str(path)
+            validate_xz_archive(path)
+            ok, detail = verify_archive(path)
+        except (OSError, ValueError):
+            ok = False
+        if ok and detail == "verified":
+            break
+    else:
+        print("No verified archive to serve", file=sys.stderr)
+        return EXIT_NO_RELEASE
+    try:
+        server = PeerServer(path, options.peer_port)
+    except OSError as e:
+        print(f"Cannot serve on port {options.peer_port}: {e}",
+              file=sys.stderr)
+        return EXIT_FAILED
+    print(f"Serving {os.path.basename(path)} on port {options.peer_port}",
+          file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+    return EXIT_OK
+
+
+def run_rollback(options):
+    """``--rollback`` entry point; returns a process exit code."""
+    def emit(kind, *args):
+        if kind == "done":
+            print(args[0])
+        elif kind == "fail":
+            print(args[0], file=sys.stderr)
+
+    status = InstallPipeline(options, emit).rollback(options.rollback or None)
+    current = current_version()
+    for name in list_versions():
+        print(f"{'*' if name == current else ' '} {name}")
+    return status
 
 
 def main():
+    options = parse_args()
+    if options.diagnostics:
+        atexit.register(lambda: print(json.dumps(diagnostics_snapshot()),
+                                      file=sys.stderr))
+    if options.verify or options.repair:
+        sys.exit(run_maintenance(options))
+    if options.rollback is not None:
+        sys.exit(run_rollback(options))
+    if options.headless:
+        status = run_headless(options)
+        if options.serve and status == EXIT_OK:
+            status = run_peer_server(options)
+        sys.exit(status)
+    if options.serve:
+        sys.exit(run_peer_server(options))
+    run_gui(options)
+
+
+# ---------------------------------------------------------------------------
+# Font fallback for broad Linux distro coverage
+# ---------------------------------------------------------------------------
+
+SANS_PREFERENCES = (
+    "Inter", "Inter Variable", "SF Pro Display",
+    "Ubuntu", "Cantarell", "Noto Sans", "Roboto",
+    "DejaVu Sans", "Liberation Sans", "FreeSans", "Sans",
+)
+
+SANS_BOLD_PREFERENCES = (
+    "Inter Black", "Inter SemiBold",
+    "Ubuntu Bold", "Cantarell Bold", "Noto Sans Bold",
+    *SANS_PREFERENCES,
+)
+
+
+def pick_font(preferred, size, weight="normal"):
+    from tkinter import font as tkfont
+
+    try:
+        available = {f.lower() for f in tkfont.families()}
+    except Exception:
+        available = set()
+    for name in preferred:
+        if name.lower() in available:
+            return (name, size, weight)
+    return ("TkDefaultFont", size, weight)
+
+
+# ---------------------------------------------------------------------------
+# Themes
+# ---------------------------------------------------------------------------
+
+THEMES = {
+    "light": {
+        "bg":             "#f4f1fb",
+        "sidebar_bg":     "#ffffff",
+        "card_bg":        "#ffffff",
+        "card_alt":       "#faf9ff",
+        "border":         "#ecebf3",
+        "text":           "#1a1a2e",
+        "text_muted":     "#6b6b80",
+        "text_dim":       "#a0a0b0",
+        "accent":         "#ff6b3d",
+        "accent_hover":   "#ff8559",
+        "accent_active":  "#e55a2e",
+        "accent_soft":    "#fff1eb",
+        "secondary":      "#7c6ef0",
+        "secondary_soft": "#efedff",
+        "track":          "#ecebf3",
+        "success":        "#22c55e",
+        "error":          "#ef4444",
+        "nav_hover":      "#f5f3ff",
+        "toggle_off":     "#dcd9e8",
+        "toggle_on":      "#ff6b3d",
+        "toggle_knob":    "#ffffff",
+        "cta_grad_a":     "#7c6ef0",
+        "cta_grad_b":     "#a594ff",
+    },
+    "dark": {
+        "bg":             "#0e0c14",
+        "sidebar_bg":     "#15131c",
+        "card_bg":        "#1a1822",
+        "card_alt":       "#211e2c",
+        "border":         "#2a2734",
+        "text":           "#f4f1ee",
+        "text_muted":     "#a39ab0",
+        "text_dim":       "#6b6673",
+        "accent":         "#ff6b3d",
+        "accent_hover":   "#ff8559",
+        "accent_active":  "#e55a2e",
+        "accent_soft":    "#2a1d18",
+        "secondary":      "#9787f5",
+        "secondary_soft": "#1f1b2e",
+        "track":          "#2a2734",
+        "success":        "#4ade80",
+        "error":          "#f87171",
+        "nav_hover":      "#211e2c",
+        "toggle_off":     "#2a2734",
+        "toggle_on":      "#ff6b3d",
+        "toggle_knob":    "#f4f1ee",
+        "cta_grad_a":     "#5b4fc7",
+        "cta_grad_b":     "#7c6ef0",
+    },
+}
+
+
+# ---------------------------------------------------------------------------
+# GUI
+# ---------------------------------------------------------------------------
+
+def build_gui():
+    """Import tkinter and PIL and define the GUI; returns the installer class.
+
+    Only ``run_gui`` calls this, so the display-free modes never load Tk.
+    """
+    import tkinter as tk
+
+    try:
+        from PIL import Image, ImageDraw, ImageTk
+        PIL_AVAILABLE = True
+    except ImportError:
+        PIL_AVAILABLE = False
+
+    # ----- custom widgets ----------------------------------------------------
+
+    class RoundedFrame(tk.Canvas):
+        """Canvas with a rounded-rect background. Use .interior for content."""
+
+        def __init__(self, parent, width, height, parent_bg, card_bg,
+                     border_color=None, radius=14):
+            super().__init__(
+                parent, width=width, height=height,
+                highlightthickness=0, bd=0, bg=parent_bg,
+            )
+            self._cw, self._ch, self._r = width, height, radius
+            self._parent_bg = parent_bg
+            self._card_bg = card_bg
+            self._border_color = border_color
+            self._draw()
+
+            self.interior = tk.Frame(self, bg=card_bg)
+            self.create_window(
+                radius, radius, anchor="nw", window=self.interior,
+                width=width - 2 * radius, height=height - 2 * radius,
+            )
+
+        def _draw(self):
+            self.delete("bg")
+            w, h, r = self._cw, self._ch, self._r
+            c = self._card_bg
+            self.create_arc(0, 0, 2 * r, 2 * r, start=90, extent=90,
+                            fill=c, outline=c, tags="bg")
+            self.create_arc(w - 2 * r, 0, w, 2 * r, start=0, extent=90,
+                            fill=c, outline=c, tags="bg")
+            self.create_arc(0, h - 2 * r, 2 * r, h, start=180, extent=90,
+                            fill=c, outline=c, tags="bg")
+            self.create_arc(w - 2 * r, h - 2 * r, w, h, start=270, extent=90,
+                            fill=c, outline=c, tags="bg")
+            self.create_rectangle(r, 0, w - r, h, fill=c, outline=c, tags="bg")
+            self.create_rectangle(0, r, w, h - r, fill=c, outline=c, tags="bg")
+            self.tag_lower("bg")
+
+        def update_theme(self, parent_bg, card_bg, border_color=None):
+            self._parent_bg = parent_bg
+            self._card_bg = card_bg
+            self._border_color = border_color
+            self.configure(bg=parent_bg)
+            self.interior.configure(bg=card_bg)
+            self._draw()
+
+    class RoundedButton(tk.Canvas):
+        """Pill button with hover/press/disabled states."""
+
+        def __init__(self, parent, text="", command=None,
+                     width=160, height=42, radius=21,
+                     bg="#ff6b3d", hover_bg="#ff8559", active_bg="#e55a2e",
+                     disabled_bg="#cccccc", disabled_fg="#777",
+                     fg="white", font=None, parent_bg="#ffffff"):
+            super().__init__(
+                parent, width=width, height=height,
+                highlightthickness=0, bd=0, bg=parent_bg,
+            )
+            self._text = text
+            self._command = command
+            self._cw, self._ch, self._r = width, height, radius
+            self._bg, self._hover, self._active = bg, hover_bg, active_bg
+            self._disabled_bg, self._disabled_fg = disabled_bg, disabled_fg
+            self._fg = fg
+            self._font = font or pick_font(SANS_BOLD_PREFERENCES, 11, "bold")
+            self._enabled = True
+            self._current_bg = bg
+            self._draw()
+            self.bind("<Enter>", self._on_enter)
+            self.bind("<Leave>", self._on_leave)
+            self.bind("<ButtonPress-1>", self._on_press)
+            self.bind("<ButtonRelease-1>", self._on_release)
+
+        def _draw(self):
+            self.delete("all")
+            w, h, r = self._cw, self._ch, self._r
+            bg = self._current_bg if self._enabled else self._disabled_bg
+            fg = self._fg if self._enabled else self._disabled_fg
+            self.create_arc(0, 0, 2 * r, h, start=90, extent=180,
+                            fill=bg, outline=bg)
+            self.create_arc(w - 2 * r, 0, w, h, start=270, extent=180,
+                            fill=bg, outline=bg)
+            self.create_rectangle(r, 0, w - r, h, fill=bg, outline=bg)
+            self.create_text(w // 2, h // 2, text=self._text,
+                             fill=fg, font=self._font)
+
+        def configure_text(self, text):
+            self._text = text
+            self._draw()
+
+        def set_enabled(self, enabled):
+            self._enabled = enabled
+            self._current_bg = self._bg
+            self.configure(cursor="hand2" if enabled else "arrow")
+            self._draw()
+
+        def update_colors(self, parent_bg, bg, hover_bg, active_bg,
+                          disabled_bg, disabled_fg, fg):
+            self._bg, self._hover, self._active = bg, hover_bg, active_bg
+            self._disabled_bg, self._disabled_fg = disabled_bg, disabled_fg
+            self._fg = fg
+            self._current_bg = bg
+            self.configure(bg=parent_bg)
+            self._draw()
+
+        def _on_enter(self, _):
+            if self._enabled:
+                self._current_bg = self._hover
+                self.configure(cursor="hand2")
+                self._draw()
+
+        def _on_leave(self, _):
+            if self._enabled:
+                self._current_bg = self._bg
+                self._draw()
+
+        def _on_press(self, _):
+            if self._enabled:
+                self._current_bg = self._active
+                self._draw()
+
+        def _on_release(self, _):
+            if not self._enabled:
+                return
+            self._current_bg = self._hover
+            self._draw()
+            if self._command:
+                self._command()
+
+    class SmoothProgressBar(tk.Canvas):
+        """Rounded progress bar with eased animation and an indeterminate
+        shimmer."""
+
+        def __init__(self, parent, width=440, height=8,
+                     bg_track="#ecebf3", fg="#ff6b3d", parent_bg="#ffffff"):
+            super().__init__(
+                parent, width=width, height=height,
+                highlightthickness=0, bd=0, bg=parent_bg,
+            )
+            self._cw, self._ch = width, height
+            self._track = bg_track
+            self._fg = fg
+            self._target = 0.0
+            self._current = 0.0
+            self._animating = False
+            self._indeterminate = False
+            self._shimmer_x = -0.3
+            self._draw()
+
+        def _rounded_rect(self, x1, y1, x2, y2, r, fill):
+            if x2 - x1 < 2 * r:
+                r = max(0, (x2 - x1) // 2)
+            if r <= 0:
+                self.create_rectangle(x1, y1, x2, y2, fill=fill, outline=fill)
+                return
+            self.create_arc(x1, y1, x1 + 2 * r, y2, start=90, extent=180,
+                            fill=fill, outline=fill)
+            self.create_arc(x2 - 2 * r, y1, x2, y2, start=270, extent=180,
+                            fill=fill, outline=fill)
+            self.create_rectangle(x1 + r, y1, x2 - r, y2,
+                                  fill=fill, outline=fill)
+
+        def _draw(self):
+            self.delete("all")
+            w, h = self._cw, self._ch
+            r = h // 2
+            self._rounded_rect(0, 0, w, h, r, self._track)
+            if self._indeterminate:
+                seg = int(w * 0.3)
+                x = int(self._shimmer_x * w)
+                x1 = max(0, x)
+                x2 = min(w, x + seg)
+                if x2 > x1:
+                    self._rounded_rect(x1, 0, x2, h, r, self._fg)
+            else:
+                fw = int(self._current * w)
+                if fw > 0:
+                    self._rounded_rect(0, 0, fw, h, r, self._fg)
+
+        def set_value(self, value):
+            self._indeterminate = False
+            self._target = max(0.0, min(1.0, value))
+            if not self._animating:
+                self._animating = True
+                self._tick()
+
+        def _tick(self):
+            if self._indeterminate:
+                self._shimmer_x += 0.02
+                if self._shimmer_x > 1.05:
+                    self._shimmer_x = -0.3
+                self._draw()
+                self.after(30, self._tick)
+                return
+            delta = self._target - self._current
+            if abs(delta) < 0.002:
+                self._current = self._target
+                self._draw()
+                self._animating = False
+                return
+            self._current += delta * 0.25
+            self._draw()
+            self.after(16, self._tick)
+
+        def start_indeterminate(self):
+            self._indeterminate = True
+            self._shimmer_x = -0.3
+            if not self._animating:
+                self._animating = True
+                self._tick()
+
+        def stop_indeterminate(self):
+            self._indeterminate = False
+            self._animating = False
+            self._current = 0.0
+            self._draw()
+
+        def update_colors(self, parent_bg, track, fg):
+            self._track = track
+            self._fg = fg
+            self.configure(bg=parent_bg)
+            self._draw()
+
+    class ToggleSwitch(tk.Canvas):
+        """iOS-style sliding toggle for theme switching."""
+
+        def __init__(self, parent, parent_bg, track_off, track_on, knob,
+                     command=None, on=False):
+            super().__init__(
+                parent, width=44, height=24,
+                highlightthickness=0, bd=0, bg=parent_bg,
+            )
+            self._on = on
+            self._track_off = track_off
+            self._track_on = track_on
+            self._knob = knob
+            self._command = command
+            self.configure(cursor="hand2")
+            self._draw()
+            self.bind("<Button-1>", self._click)
+
+        def _draw(self):
+            self.delete("all")
+            track = self._track_on if self._on else self._track_off
+            self.create_arc(0, 0, 24, 24, start=90, extent=180,
+                            fill=track, outline=track)
+            self.create_arc(20, 0, 44, 24, start=270, extent=180,
+                            fill=track, outline=track)
+            self.create_rectangle(12, 0, 32, 24, fill=track, outline=track)
+            kx = 22 if self._on else 2
+            self.create_oval(kx, 2, kx + 20, 22,
+                             fill=self._knob, outline=self._knob)
+
+        def _click(self, _):
+            self._on = not self._on
+            self._draw()
+            if self._command:
+                self._command(self._on)
+
+        def update_colors(self, parent_bg, track_off, track_on, knob):
+            self._track_off = track_off
+            self._track_on = track_on
+            self._knob = knob
+            self.configure(bg=parent_bg)
+            self._draw()
+
+    class PillNavItem(tk.Frame):
+        """Sidebar nav row with a pill-shaped active/hover background."""
+
+        HEIGHT = 38
+        RADIUS = 10
+        LEFT_PAD = 16
+
+        def __init__(self, parent, text, font, on_click=None):
+            super().__init__(parent, height=self.HEIGHT)
+            self.pack_propagate(False)
+            self._text = text
+            self._font = font
+            self._on_click = on_click
+            self._active = False
+            self._hover = False
+            self._colors = None
+
+            self._canvas = tk.Canvas(
+                self, height=self.HEIGHT,
+                highlightthickness=0, bd=0,
+            )
+            self._canvas.pack(fill=tk.BOTH, expand=True)
+            self._canvas.bind("<Configure>", lambda e: self._draw())
+            self._canvas.bind("<Button-1>", self._click)
+            self._canvas.bind("<Enter>", self._enter)
+            self._canvas.bind("<Leave>", self._leave)
+
+        def _draw(self):
+            if not self._colors:
+                return
+            c = self._canvas
+            c.delete("all")
+            w = c.winfo_width()
+            h = self.HEIGHT
+            r = self.RADIUS
+            if w < 2 * r:
+                return
+
+            bg = self._colors["sidebar_bg"]
+            if self._active:
+                fill = self._colors["accent"]
+                text_color = "#ffffff"
+            elif self._hover:
+                fill = self._colors["nav_hover"]
+                text_color = self._colors["text"]
+            else:
+                fill = bg
+                text_color = self._colors["text_muted"]
+
+            c.configure(bg=bg)
+            self.configure(bg=bg)
+
+            if fill != bg:
+                c.create_arc(0, 0, 2 * r, 2 * r, start=90, extent=90,
+                             fill=fill, outline=fill)
+                c.create_arc(w - 2 * r, 0, w, 2 * r, start=0, extent=90,
+                             fill=fill, outline=fill)
+                c.create_arc(0, h - 2 * r, 2 * r, h, start=180, extent=90,
+                             fill=fill, outline=fill)
+                c.create_arc(w - 2 * r, h - 2 * r, w, h, start=270, extent=90,
+                             fill=fill, outline=fill)
+                c.create_rectangle(r, 0, w - r, h, fill=fill, outline=fill)
+                c.create_rectangle(0, r, w, h - r, fill=fill, outline=fill)
+
+            c.create_text(self.LEFT_PAD, h // 2, text=self._text,
+                          fill=text_color, anchor="w", font=self._font)
+
+        def set_active(self, active):
+            self._active = active
+            self._draw()
+
+        def _enter(self, _):
+            self._hover = True
+            self._canvas.configure(cursor="hand2")
+            self._draw()
+
+        def _leave(self, _):
+            self._hover = False
+            self._draw()
+
+        def _click(self, _):
+            if self._on_click:
+                self._on_click()
+
+        def update_colors(self, colors):
+            self._colors = colors
+            self._draw()
+
+    # ----- main installer ----------------------------------------------------
+
+    class HellFireInstallerTk:
+        WINDOW_W = 1024
+        WINDOW_H = 660
+        SIDEBAR_W = 220
+        PADDING = 24
+        UI_FRAME_MS = 33  # ~30 Hz render cadence for worker progress
+
+        def __init__(self, root, options=None):
+            self.root = root
+            self.options = options or parse_args([])
+            self.root.title("HellFire Installer")
+            self.root.geometry(f"{self.WINDOW_W}x{self.WINDOW_H}")
+            self.root.resizable(False, False)
+            self._center_window()
+
+            self.theme_name = "dark"
+            self.colors = THEMES[self.theme_name]
+            self._themed_widgets = []
+            self._themed_custom = []
+
+            self.root.configure(bg=self.colors["bg"])
+
+            self.base_dir = INSTALL_DIR
+            self.avatar_image = None
+            self._installed = False
+            self._worker = None
+            self._events = None
+            self._prefetch = None
+            self._prefetch_controls = None
+            self._paused = False
+            self.limit_rate = self.options.limit_rate
+
+            self.hero_image_url = "https://github.com/CYFARE.png?size=256"
+            self.social_links = {
+                "GitHub":  "https://github.com/CYFARE/HellFire",
+                "Twitter": "https://x.com/cyfarelabs",
+                "Website": "https://cyfare.net/",
+            }
+
+            self.fonts = {
+                "logo":      pick_font(SANS_BOLD_PREFERENCES, 16, "bold"),
+                "title":     pick_font(SANS_BOLD_PREFERENCES, 22, "bold"),
+                "subtitle":  pick_font(SANS_PREFERENCES, 11, "normal"),
+                "body":      pick_font(SANS_PREFERENCES, 10, "normal"),
+                "body_bold": pick_font(SANS_BOLD_PREFERENCES, 10, "bold"),
+                "small":     pick_font(SANS_PREFERENCES, 9, "normal"),
+                "tiny":      pick_font(SANS_PREFERENCES, 8, "normal"),
+                "section":   pick_font(SANS_BOLD_PREFERENCES, 8, "bold"),
+                "nav":       pick_font(SANS_PREFERENCES, 11, "normal"),
+                "stat_num":  pick_font(SANS_BOLD_PREFERENCES, 18, "bold"),
+                "card_h":    pick_font(SANS_BOLD_PREFERENCES, 13, "bold"),
+                "btn":       pick_font(SANS_BOLD_PREFERENCES, 11, "bold"),
+                "cta_h":     pick_font(SANS_BOLD_PREFERENCES, 17, "bold"),
+                "cta_b":     pick_font(SANS_PREFERENCES, 11, "normal"),
+            }
+
+            self._stats = {
+                "source": ("Source", "—", "Awaiting"),
+                "size":   ("Size",   "—", "Pending"),
+                "files":  ("Files",  "—", "Pending"),
+                "status": ("Status", "Ready", "Click install"),
+            }
+            self._stat_widgets = {}
+
+            self.channel = ProgressChannel()
+            self._rendered_seq = 0
+            self._build_ui()
+            self._load_avatar()
+            self._poll_progress()
+            self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+            stats = InstallPipeline(self.options,
+                                    lambda *event: self._on_event(event))
+            threading.Thread(target=stats.refresh_stats, daemon=True).start()
+
+        # ----- window helpers ------------------------------------------------
+
+        def _center_window(self):
+            self.root.update_idletasks()
+            x = (self.root.winfo_screenwidth() - self.WINDOW_W) // 2
+            y = (self.root.winfo_screenheight() - self.WINDOW_H) // 2
+            self.root.geometry(f"{self.WINDOW_W}x{self.WINDOW_H}+{x}+{y}")
+
+        # ----- theme system --------------------------------------------------
+
+        def _theme(self, widget, **roles):
+            self._themed_widgets.append((widget, roles))
+            self._apply_theme_to(widget, roles)
+
+        def _apply_theme_to(self, widget, roles):
+            try:
+                widget.configure(**{
+                    opt: self.colors[role] for opt, role in roles.items()
+                })
+            except tk.TclError:
+                pass
+
+        def _theme_custom(self, fn):
+            self._themed_custom.append(fn)
+            fn(self.colors)
+
+        def _toggle_theme(self, is_dark):
+            self.theme_name = "dark" if is_dark else "light"
+            self.colors = THEMES[self.theme_name]
+            self.root.configure(bg=self.colors["bg"])
+            for widget, roles in self._themed_widgets:
+                self._apply_theme_to(widget, roles)
+            for fn in self._themed_custom:
+                fn(self.colors)
+
+        # ----- UI construction -----------------------------------------------
+
+        def _build_ui(self):
+            self.outer = tk.Frame(self.root)
+            self._theme(self.outer, bg="bg")
+            self.outer.pack(fill=tk.BOTH, expand=True)
+
+            self._build_sidebar(self.outer)
+
+            self.main_area = tk.Frame(self.outer)
+            self._theme(self.main_area, bg="bg")
+            self.main_area.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+            self._build_main(self.main_area)
+
+        # ----- sidebar -------------------------------------------------------
+
+        def _build_sidebar(self, parent):
+            self.sidebar = tk.Frame(parent, width=self.SIDEBAR_W)
+            self.sidebar.pack_propagate(False)
+            self.sidebar.pack(side=tk.LEFT, fill=tk.Y)
+            self._theme(self.sidebar, bg="sidebar_bg")
+
+            logo_frame = tk.Frame(self.sidebar, height=80)
+            logo_frame.pack(fill=tk.X, padx=24, pady=(28, 28))
+            self._theme(logo_frame, bg="sidebar_bg")
+
+            logo_a = tk.Label(logo_frame, text="HELL", font=self.fonts["logo"])
+            logo_a.pack(side=tk.LEFT)
+            self._theme(logo_a, bg="sidebar_bg", fg="text")
+
+            logo_b = tk.Label(logo_frame, text="FIRE", font=self.fonts["logo"])
+            logo_b.pack(side=tk.LEFT)
+            self._theme(logo_b, bg="sidebar_bg", fg="accent")
+
+            # Only Install nav — About and Settings removed (no features
+            # behind them)
+            nav_data = [("Install", True)]
+            self._nav_items = []
+            for label, active in nav_data:
+                item = PillNavItem(
+                    self.sidebar, text=label,
+                    font=self.fonts["nav"],
+                    on_click=lambda l=label: self._on_nav_click(l),
+                )
+                item.pack(fill=tk.X, padx=14, pady=2)
+                item.set_active(active)
+                self._theme_custom(item.update_colors)
+                self._nav_items.append((label, item))
+
+            section_lbl = tk.Label(
+                self.sidebar, text="OTHER LINKS",
+                font=self.fonts["section"], anchor="w",
+            )
+            section_lbl.pack(fill=tk.X, padx=24, pady=(28, 8))
+            self._theme(section_lbl, bg="sidebar_bg", fg="text_dim")
+
+            for name, url in self.social_links.items():
+                item = PillNavItem(
+                    self.sidebar, text=name,
+                    font=self.fonts["nav"],
+                    on_click=lambda u=url: webbrowser.open(u),
+                )
+                item.pack(fill=tk.X, padx=14, pady=2)
+                self._theme_custom(item.update_colors)
+
+            spacer = tk.Frame(self.sidebar)
+            spacer.pack(fill=tk.BOTH, expand=True)
+            self._theme(spacer, bg="sidebar_bg")
+
+            toggle_row = tk.Frame(self.sidebar)
+            toggle_row.pack(fill=tk.X, padx=24, pady=(12, 28))
+            self._theme(toggle_row, bg="sidebar_bg")
+
+            sun = tk.Label(toggle_row, text="☀", font=self.fonts["body_bold"])
+            sun.pack(side=tk.LEFT)
+            self._theme(sun, bg="sidebar_bg", fg="text_muted")
+
+            self.theme_toggle = ToggleSwitch(
+                toggle_row,
+                parent_bg=self.colors["sidebar_bg"],
+                track_off=self.colors["toggle_off"],
+                track_on=self.colors["toggle_on"],
+                knob=self.colors["toggle_knob"],
+                on=(self.theme_name == "dark"),
+                command=self._toggle_theme,
+            )
+            self.theme_toggle.pack(side=tk.LEFT, padx=10)
+
+            def _update_toggle(colors):
+                self.theme_toggle.update_colors(
+                    parent_bg=colors["sidebar_bg"],
+                    track_off=colors["toggle_off"],
+                    track_on=colors["toggle_on"],
+                    knob=colors["toggle_knob"],
+                )
+            self._theme_custom(_update_toggle)
+
+            moon = tk.Label(toggle_row, text="☾", font=self.fonts["body_bold"])
+            moon.pack(side=tk.LEFT)
+            self._theme(moon, bg="sidebar_bg", fg="text_muted")
+
+        def _on_nav_click(self, label):
+            for name, item in self._nav_items:
+                item.set_active(name == label)
+
+        # ----- main area -----------------------------------------------------
+
+        def _build_main(self, parent):
+            wrap = tk.Frame(parent)
+            wrap.pack(fill=tk.BOTH, expand=True, padx=self.PADDING,
+                      pady=(16, 20))
+            self._theme(wrap, bg="bg")
+
+            self._build_header(wrap)
+
+            spacer1 = tk.Frame(wrap, height=20)
+            self._theme(spacer1, bg="bg")
+            spacer1.pack(fill=tk.X)
+            self._build_stat_cards(wrap)
+
+            spacer2 = tk.Frame(wrap, height=16)
+            self._theme(spacer2, bg="bg")
+            spacer2.pack(fill=tk.X)
+            self._build_middle_row(wrap)
+
+            spacer3 = tk.Frame(wrap, height=16)
+            self._theme(spacer3, bg="bg")
+            spacer3.pack(fill=tk.X)
+            self._build_cta_card(wrap)
+
+        def _build_header(self, parent):
+            header = tk.Frame(parent, height=44)
+            header.pack(fill=tk.X)
+            header.pack_propagate(False)
+            self._theme(header, bg="bg")
+
+            left = tk.Frame(header)
+            left.pack(side=tk.LEFT, fill=tk.Y)
+            self._theme(left, bg="bg")
+
+            welcome = tk.Label(left, text="Welcome to ",
+                               font=self.fonts["title"])
+            welcome.pack(side=tk.LEFT)
+            self._theme(welcome, bg="bg", fg="text")
+
+            brand = tk.Label(left, text="HellFire", font=self.fonts["title"])
+            brand.pack(side=tk.LEFT)
+            self._theme(brand, bg="bg", fg="accent")
+
+            right = tk.Frame(header)
+            right.pack(side=tk.RIGHT, fill=tk.Y)
+            self._theme(right, bg="bg")
+
+            version_pill = RoundedFrame(
+                right, width=130, height=36,
+                parent_bg=self.colors["bg"],
+                card_bg=self.colors["card_bg"], radius=18,
+            )
+            version_pill.pack(side=tk.RIGHT, padx=(0, 4))
+
+            # Colored dot + text inside the pill
+            pill_inner = tk.Frame(version_pill.interior,
+                                  bg=self.colors["card_bg"])
+            pill_inner.pack(expand=True)
+
+            dot = tk.Canvas(pill_inner, width=8, height=8,
+                            highlightthickness=0, bd=0,
+                            bg=self.colors["card_bg"])
+            dot.pack(side=tk.LEFT, padx=(0, 6))
+            dot.create_oval(0, 0, 8, 8, fill=self.colors["accent"], outline="")
+
+            def _upd_dot(colors):
+                dot.configure(bg=colors["card_bg"])
+                dot.delete("all")
+                dot.create_oval(0, 0, 8, 8, fill=colors["accent"], outline="")
+            self._theme_custom(_upd_dot)
+
+            ver_label = tk.Label(
+                pill_inner, text="Linux build",
+                font=self.fonts["small"], anchor="center",
+                bg=self.colors["card_bg"], fg=self.colors["text_muted"],
+            )
+            ver_label.pack(side=tk.LEFT)
+            self._theme(ver_label, bg="card_bg", fg="text_muted")
+
+            def _upd_pill(colors):
+                version_pill.update_theme(colors["bg"], colors["card_bg"])
+                pill_inner.configure(bg=colors["card_bg"])
+            self._theme_custom(_upd_pill)
+
+        # ----- stat cards row ------------------------------------------------
+
+        def _build_stat_cards(self, parent):
+            row = tk.Frame(parent, height=98)
+            row.pack(fill=tk.X)
+            row.pack_propagate(False)
+            self._theme(row, bg="bg")
+
+            inner_w = self.WINDOW_W - self.SIDEBAR_W - 2 * self.PADDING
+            gap = 12
+            card_w = (inner_w - gap * 3) // 4
+            card_h = 98
+
+            keys = ["source", "size", "files", "status"]
+            accent_colors = ["accent", "secondary", "accent", "secondary"]
+
+            for i, (key, accent) in enumerate(zip(keys, accent_colors)):
+                label, value, sub = self._stats[key]
+
+                card = RoundedFrame(
+                    row, width=card_w, height=card_h,
+                    parent_bg=self.colors["bg"],
+                    card_bg=self.colors["card_bg"], radius=14,
+                )
+                card.pack(side=tk.LEFT, padx=(0 if i == 0 else gap, 0))
+
+                def _upd_card(colors, c=card):
+                    c.update_theme(colors["bg"], colors["card_bg"])
+                self._theme_custom(_upd_card)
+
+                content = tk.Frame(card.interior)
+                content.pack(fill=tk.BOTH, expand=True, padx=10, pady=8)
+                self._theme(content, bg="card_bg")
+
+                top = tk.Frame(content)
+                top.pack(fill=tk.X)
+                self._theme(top, bg="card_bg")
+
+                lbl = tk.Label(top, text=label, font=self.fonts["small"],
+                               anchor="w")
+                lbl.pack(side=tk.LEFT)
+                self._theme(lbl, bg="card_bg", fg="text_muted")
+
+                dot = tk.Label(top, text="●", font=self.fonts["small"])
+                dot.pack(side=tk.RIGHT)
+                self._theme(dot, bg="card_bg", fg=accent)
+
+                val = tk.Label(content, text=value,
+                               font=self.fonts["stat_num"], anchor="w")
+                val.pack(fill=tk.X, pady=(6, 0))
+                self._theme(val, bg="card_bg", fg="text")
+
+                sub_lbl = tk.Label(content, text=sub,
+                                   font=self.fonts["tiny"], anchor="w")
+                sub_lbl.pack(fill=tk.X)
+                self._theme(sub_lbl, bg="card_bg", fg="text_dim")
+
+                self._stat_widgets[key] = (val, sub_lbl)
+
+        def _set_stat(self, key, value=None, sub=None):
+            if value is not None:
+                self.channel.publish(("stat", key, 0), value)
+            if sub is not None:
+                self.channel.publish(("stat", key, 1), sub)
+
+        # ----- middle row: progress + about ----------------------------------
+
+        def _build_middle_row(self, parent):
+            row = tk.Frame(parent, height=236)
+            row.pack(fill=tk.X)
+            row.pack_propagate(False)
+            self._theme(row, bg="bg")
+
+            inner_w = self.WINDOW_W - self.SIDEBAR_W - 2 * self.PADDING
+            gap = 12
+            progress_w = int(inner_w * 0.66)
+            about_w = inner_w - progress_w - gap
+
+            self._build_progress_card(row, progress_w, 236)
+            spacer = tk.Frame(row, width=gap)
+            spacer.pack(side=tk.LEFT)
+            self._theme(spacer, bg="bg")
+            self._build_about_card(row, about_w, 236)
+
+        def _build_progress_card(self, parent, w, h):
+            card = RoundedFrame(
+                parent, width=w, height=h,
+                parent_bg=self.colors["bg"],
+                card_bg=self.colors["card_bg"], radius=14,
+            )
+            card.pack(side=tk.LEFT)
+
+            def _upd(colors):
+                card.update_theme(colors["bg"], colors["card_bg"])
+            self._theme_custom(_upd)
+
+            body = tk.Frame(card.interior)
+            body.pack(fill=tk.BOTH, expand=True, padx=14, pady=10)
+            self._theme(body, bg="card_bg")
+
+            head = tk.Frame(body)
+            head.pack(fill=tk.X)
+            self._theme(head, bg="card_bg")
+
+            title = tk.Label(head, text="Installation",
+                             font=self.fonts["card_h"], anchor="w")
+            title.pack(side=tk.LEFT)
+            self._theme(title, bg="card_bg", fg="text")
+
+            self.percent_label = tk.Label(head, text="",
+                                          font=self.fonts["body_bold"])
+            self.percent_label.pack(side=tk.RIGHT)
+            self._theme(self.percent_label, bg="card_bg", fg="text_muted")
+
+            sub = tk.Label(
+                body,
+                text="Custom-compiled Firefox build, installed to your "
+                     "home folder.",
+                font=self.fonts["small"], anchor="w", justify="left",
+            )
+            sub.pack(fill=tk.X, pady=(4, 12))
+            self._theme(sub, bg="card_bg", fg="text_muted")
+
+            status_row = tk.Frame(body)
+            status_row.pack(fill=tk.X, pady=(0, 6))
+            self._theme(status_row, bg="card_bg")
+
+            self.status_dot = tk.Canvas(
+                status_row, width=10, height=10,
+                highlightthickness=0, bd=0,
+            )
+            self.status_dot.pack(side=tk.LEFT, padx=(0, 10))
+            self._set_status_dot(self.colors["text_dim"])
+
+            def _upd_dot(colors):
+                self.status_dot.configure(bg=colors["card_bg"])
+            self._theme_custom(_upd_dot)
+
+            self.status_label = tk.Label(
+                status_row, text="Ready to install",
+                font=self.fonts["body"], anchor="w",
+            )
+            self.status_label.pack(side=tk.LEFT, fill=tk.X, expand=True)
+            self._theme(self.status_label, bg="card_bg", fg="text")
+
+            bar_w = w - 2 * 14 - 28
+            self.progress = SmoothProgressBar(
+                body, width=bar_w, height=6,
+                bg_track=self.colors["track"],
+                fg=self.colors["accent"],
+                parent_bg=self.colors["card_bg"],
+            )
+            self.progress.pack(fill=tk.X, pady=(0, 10))
+
+            def _upd_bar(colors):
+                self.progress.update_colors(
+                    colors["card_bg"], colors["track"], colors["accent"]
+                )
+            self._theme_custom(_upd_bar)
+
+            path_row = tk.Frame(body)
+            path_row.pack(fill=tk.X, pady=(0, 6))
+            self._theme(path_row, bg="card_bg")
+
+            path_note = tk.Label(
+                path_row,
+                text=f"📁  Installs to  {self._tilde(self.base_dir)}",
+                font=self.fonts["small"], anchor="w",
+            )
+            path_note.pack(side=tk.LEFT, fill=tk.X, expand=True)
+            self._theme(path_note, bg="card_bg", fg="text_dim")
+
+            # Rolling back only flips the versions/current link.
+            self.rollback_button = RoundedButton(
+                path_row, text="↶  Roll back",
+                command=self._on_rollback_clicked,
+                width=104, height=24, radius=12,
+                bg=self.colors["card_bg"],
+                hover_bg=self.colors["nav_hover"],
+                active_bg=self.colors["track"],
+                disabled_bg=self.colors["card_bg"],
+                disabled_fg=self.colors["card_bg"],
+                fg=self.colors["text_muted"],
+                font=self.fonts["small"],
+                parent_bg=self.colors["card_bg"],
+            )
+            self.rollback_button.pack(side=tk.RIGHT)
+            self._refresh_rollback()
+
+            controls = tk.Frame(body)
+            controls.pack(fill=tk.X)
+            self._theme(controls, bg="card_bg")
+
+            self.action_button = RoundedButton(
+                controls, text="Install HellFire",
+                command=self._on_action_clicked,
+                width=170, height=42, radius=21,
+                bg=self.colors["accent"],
+                hover_bg=self.colors["accent_hover"],
+                active_bg=self.colors["accent_active"],
+                disabled_bg=self.colors["track"],
+                disabled_fg=self.colors["text_dim"],
+                fg="white",
+                font=self.fonts["btn"],
+                parent_bg=self.colors["card_bg"],
+            )
+            self.action_button.pack(side=tk.LEFT)
+
+            self.pause_button = RoundedButton(
+                controls, text="Pause",
+                command=self._on_pause_clicked,
+                width=96, height=42, radius=21,
+                bg=self.colors["secondary_soft"],
+                hover_bg=self.colors["nav_hover"],
+                active_bg=self.colors["track"],
+                disabled_bg=self.colors["card_alt"],
+                disabled_fg=self.colors["text_dim"],
+                fg=self.colors["secondary"],
+                font=self.fonts["btn"],
+                parent_bg=self.colors["card_bg"],
+            )
+            self.pause_button.pack(side=tk.LEFT, padx=(10, 0))
+            self.pause_button.set_enabled(False)
+
+            self.limit_button = RoundedButton(
+                controls, text=f"Limit: {format_rate(self.limit_rate)}",
+                command=self._on_limit_clicked,
+                width=150, height=42, radius=21,
+                bg=self.colors["secondary_soft"],
+                hover_bg=self.colors["nav_hover"],
+                active_bg=self.colors["track"],
+                disabled_bg=self.colors["card_alt"],
+                disabled_fg=self.colors["text_dim"],
+                fg=self.colors["secondary"],
+                font=self.fonts["btn"],
+                parent_bg=self.colors["card_bg"],
+            )
+            self.limit_button.pack(side=tk.LEFT, padx=(10, 0))
+
+            def _upd_btn(colors):
+                self.action_button.update_colors(
+                    parent_bg=colors["card_bg"],
+                    bg=colors["accent"],
+                    hover_bg=colors["accent_hover"],
+                    active_bg=colors["accent_active"],
+                    disabled_bg=colors["track"],
+                    disabled_fg=colors["text_dim"],
+                    fg="white",
+                )
+                for button in (self.pause_button, self.limit_button):
+                    button.update_colors(
+                        parent_bg=colors["card_bg"],
+                        bg=colors["secondary_soft"],
+                        hover_bg=colors["nav_hover"],
+                        active_bg=colors["track"],
+                        disabled_bg=colors["card_alt"],
+                        disabled_fg=colors["text_dim"],
+                        fg=colors["secondary"],
+                    )
+                self.rollback_button.update_colors(
+                    parent_bg=colors["card_bg"],
+                    bg=colors["card_bg"],
+                    hover_bg=colors["nav_hover"],
+                    active_bg=colors["track"],
+                    disabled_bg=colors["card_bg"],
+                    disabled_fg=colors["card_bg"],
+                    fg=colors["text_muted"],
+                )
+            self._theme_custom(_upd_btn)
+
+        def _build_about_card(self, parent, w, h):
+            card = RoundedFrame(
+                parent, width=w, height=h,
+                parent_bg=self.colors["bg"],
+                card_bg=self.colors["card_bg"], radius=14,
+            )
+            card.pack(side=tk.LEFT)
+
+            def _upd(colors):
+                card.update_theme(colors["bg"], colors["card_bg"])
+            self._theme_custom(_upd)
+
+            body = tk.Frame(card.interior)
+            body.pack(fill=tk.BOTH, expand=True, padx=10, pady=8)
+            self._theme(body, bg="card_bg")
+
+            self.avatar_canvas = tk.Canvas(
+                body, width=72, height=72,
+                highlightthickness=0, bd=0,
+            )
+            self.avatar_canvas.pack(pady=(8, 8))
+            self._draw_avatar_placeholder()
+
+            def _upd_avatar(colors):
+                self.avatar_canvas.configure(bg=colors["card_bg"])
+                self._draw_avatar_placeholder()
+            self._theme_custom(_upd_avatar)
+
+            name = tk.Label(body, text="HellFire Browser",
+                            font=self.fonts["card_h"])
+            name.pack()
+            self._theme(name, bg="card_bg", fg="text")
+
+            handle = tk.Label(body, text="@cyfarelabs",
+                              font=self.fonts["small"])
+            handle.pack(pady=(2, 8))
+            self._theme(handle, bg="card_bg", fg="text_muted")
+
+            divider = tk.Frame(body, height=1)
+            divider.pack(fill=tk.X, padx=8, pady=(2, 10))
+            self._theme(divider, bg="border")
+
+            stats_row = tk.Frame(body)
+            stats_row.pack()
+            self._theme(stats_row, bg="card_bg")
+
+            for i, (num, lbl) in enumerate(
+                [("Custom", "BUILD"), ("Firefox", "BASE"), ("MPL", "LICENSE")]
+            ):
+                if i > 0:
+                    sep = tk.Frame(stats_row, width=1)
+                    sep.pack(side=tk.LEFT, fill=tk.Y, padx=10)
+                    self._theme(sep, bg="border")
+
+                col = tk.Frame(stats_row)
+                col.pack(side=tk.LEFT)
+                self._theme(col, bg="card_bg")
+
+                n = tk.Label(col, text=num, font=self.fonts["body_bold"])
+                n.pack()
+                self._theme(n, bg="card_bg", fg="text")
+
+                l = tk.Label(col, text=lbl, font=self.fonts["tiny"])
+                l.pack()
+                self._theme(l, bg="card_bg", fg="text_dim")
+
+        # ----- CTA card ------------------------------------------------------
+
+        def _build_cta_card(self, parent):
+            inner_w = self.WINDOW_W - self.SIDEBAR_W - 2 * self.PADDING
+            h = 92
+
+            card = tk.Canvas(
+                parent, width=inner_w, height=h,
+                highlightthickness=0, bd=0,
+            )
+            card.pack()
+            self._theme(card, bg="bg")
+
+            self._cta_canvas = card
+            self._cta_w = inner_w
+            self._cta_h = h
+            self._draw_cta(self.colors)
+
+            def _upd(colors):
+                card.configure(bg=colors["bg"])
+                self._draw_cta(colors)
+            self._theme_custom(_upd)
+
+            card.bind("<Button-1>", self._on_cta_click)
+            card.bind("<Enter>", lambda e: card.configure(cursor="hand2"))
+            card.bind("<Leave>", lambda e: card.configure(cursor=""))
+
+        def _draw_cta(self, colors):
+            c = self._cta_canvas
+            c.delete("all")
+            w, h = self._cta_w, self._cta_h
+            r = 14
+
+            a = self._hex_to_rgb(colors["cta_grad_a"])
+            b = self._hex_to_rgb(colors["cta_grad_b"])
+
+            for y in range(h):
+                if y < r:
+                    dy = r - y
+                    inner = r * r - dy * dy
+                    offset = r - (inner ** 0.5) if inner >= 0 else r
+                elif y >= h - r:
+                    dy = y - (h - r - 1)
+                    inner = r * r - dy * dy
+                    offset = r - (inner ** 0.5) if inner >= 0 else r
+                else:
+                    offset = 0
+
+                t = y / max(1, h - 1)
+                r_c = int(a[0] + (b[0] - a[0]) * t)
+                g_c = int(a[1] + (b[1] - a[1]) * t)
+                b_c = int(a[2] + (b[2] - a[2]) * t)
+                color = f"#{r_c:02x}{g_c:02x}{b_c:02x}"
+                c.create_line(int(offset), y, int(w - offset), y, fill=color)
+
+            for x, y, size in [
+                (w - 80, 22, 8),
+                (w - 50, 56, 5),
+                (w - 130, 16, 4),
+                (w - 110, 64, 6),
+                (w - 170, 40, 5),
+            ]:
+                self._draw_sparkle(c, x, y, size, "#ffffff")
+
+            c.create_text(
+                28, 32, text="Optimized Firefox for GNU/Linux",
+                font=self.fonts["cta_h"], fill="#ffffff", anchor="w",
+            )
+            c.create_text(
+                28, 56,
+                text="Custom-compiled Firefox · view source on GitHub →",
+                font=self.fonts["cta_b"], fill="#e8e4ff", anchor="w",
+            )
+
+        @staticmethod
+        def _draw_sparkle(canvas, cx, cy, size, color):
+            s = size
+            canvas.create_polygon(
+                cx, cy - s,
+                cx + s * 0.3, cy - s * 0.3,
+                cx + s, cy,
+                cx + s * 0.3, cy + s * 0.3,
+                cx, cy + s,
+                cx - s * 0.3, cy + s * 0.3,
+                cx - s, cy,
+                cx - s * 0.3, cy - s * 0.3,
+                fill=color, outline="",
+            )
+
+        def _on_cta_click(self, _):
+            webbrowser.open(self.social_links["GitHub"])
+
+        # ----- avatar --------------------------------------------------------
+
+        def _draw_avatar_placeholder(self):
+            c = self.avatar_canvas
+            c.delete("all")
+            c.configure(bg=self.colors["card_bg"])
+            c.create_oval(2, 2, 70, 70,
+                          outline=self.colors["accent"], width=2)
+            c.create_oval(8, 8, 64, 64,
+                          fill=self.colors["accent_soft"], outline="")
+            c.create_text(36, 38, text="🔥",
+                          font=pick_font(SANS_BOLD_PREFERENCES, 24, "bold"),
+                          fill=self.colors["accent"])
+
+        def _load_avatar(self):
+            if not PIL_AVAILABLE:
+                return
+
+            def fetch():
+                try:
+                    resp = http_session().get(self.hero_image_url, timeout=10)
+                    resp.raise_for_status()
+                    img = Image.open(io.BytesIO(resp.content)).convert("RGBA")
+                    size = 64
+                    img = img.resize((size, size), Image.Resampling.LANCZOS)
+                    mask = Image.new("L", (size, size), 0)
+                    ImageDraw.Draw(mask).ellipse((0, 0, size, size), fill=255)
+                    circle = Image.new("RGBA", (size, size), (0, 0, 0, 0))
+                    circle.paste(img, (0, 0), mask)
+                    photo = ImageTk.PhotoImage(circle)
+                    self.avatar_image = photo
+                    self.root.after(0, self._apply_avatar)
+                except Exception as e:
+                    print(f"Avatar fetch failed: {e}", file=sys.stderr)
+
+            threading.Thread(target=fetch, daemon=True).start()
+
+        def _apply_avatar(self):
+            c = self.avatar_canvas
+            c.delete("all")
+            c.configure(bg=self.colors["card_bg"])
+            c.create_oval(1, 1, 71, 71,
+                          outline=self.colors["accent"], width=2)
+            c.create_image(36, 36, image=self.avatar_image)
+
+        # ----- status helpers ------------------------------------------------
+
+        def _set_status_dot(self, color):
+            self.status_dot.delete("all")
+            self.status_dot.configure(bg=self.colors["card_bg"])
+            self.status_dot.create_oval(0, 0, 10, 10, fill=color,
+                                        outline=color)
+
+        # Status and progress updates are published to self.channel from any
+        # thread and rendered by _poll_progress at most once per frame.
+
+        def update_status(self, message, *, dot=None):
+            self.channel.publish("status", message)
+            if dot is not None:
+                self.channel.publish("dot", dot)
+
+        def update_progress(self, fraction, text=None):
+            self.channel.publish("progress", fraction)
+            if text is not None:
+                self.channel.publish("status", text)
+
+        def show_indeterminate(self, message):
+            self.channel.publish("status", message)
+            self.channel.publish("dot", self.colors["accent"])
+            self.channel.publish("indeterminate", True)
+
+        def stop_indeterminate(self):
+            self.channel.publish("indeterminate", False)
+
+        def _poll_progress(self):
+            self._drain_worker()
+            if self._prefetch is not None and not self._prefetch.is_alive():
+                prefetched = self._prefetch.exitcode == 0
+                self._stop_prefetch()
+                if prefetched:
+                    DIAGNOSTICS.incr("prefetch_completed")
+                self._set_stat(
+                    "status",
+                    sub="Prefetched" if prefetched else "Click install",
+                )
+            changes = self.channel.changes(self._rendered_seq)
+            if changes:
+                DIAGNOSTICS.incr("ui_updates_published",
+                                 self.channel.published - self._rendered_seq)
+                DIAGNOSTICS.incr("ui_updates_rendered", len(changes))
+                DIAGNOSTICS.incr("ui_frames")
+                self._rendered_seq = changes[-1][0]
+                for _seq, key, value in changes:
+                    self._render_update(key, value)
+            self.root.after(self.UI_FRAME_MS, self._poll_progress)
+
+        def _render_update(self, key, value):
+            if key == "status":
+                self.status_label.configure(text=value)
+            elif key == "dot":
+                self._set_status_dot(value)
+            elif key == "progress":
+                self.progress.set_value(value)
+                self.percent_label.configure(text=f"{int(value * 100)}%")
+            elif key == "indeterminate":
+                if value:
+                    self.percent_label.configure(text="")
+                    self.progress.start_indeterminate()
+                else:
+                    self.progress.stop_indeterminate()
+            elif key == "done":
+                self._mark_done()
+            elif key == "retry":
+                self.action_button.set_enabled(True)
+                self.action_button.configure_text("Retry")
+            elif key == "release":
+                self._start_prefetch(*value)
+            else:
+                _, stat, field = key
+                self._stat_widgets[stat][field].configure(text=value)
+
+        # ----- install flow --------------------------------------------------
+
+        # The pipeline runs in a spawned child process so decompression never
+        # competes with Tk for the GIL; its events arrive over a pipe and are
+        # drained once per frame by _poll_progress.
+
+        def _on_action_clicked(self):
+            if self._installed:
+                return
+            if self._worker is not None:
+                self._cancel_install()
+                return
+            self._stop_prefetch()
+            self.action_button.configure_text("Cancel")
+            self._set_stat("status", value="Working", sub="In progress")
+            options = argparse.Namespace(**vars(self.options))
+            options.limit_rate = self.limit_rate
+            ctx = multiprocessing.get_context("spawn")
+            self._events, child_end = ctx.Pipe()
+            self._worker = ctx.Process(target=run_pipeline_process,
+                                       args=(options, child_end), daemon=True)
+            self._worker.start()
+            child_end.close()
+            self._paused = False
+            self.pause_button.configure_text("Pause")
+            self.pause_button.set_enabled(True)
+            self.rollback_button.set_enabled(False)
+
+        def _on_rollback_clicked(self):
+            if self._worker is not None:
+                return
+
+            def emit(kind, *args):
+                if kind == "done":
+                    self.update_status(args[0], dot=self.colors["success"])
+                elif kind == "fail":
+                    self.update_status(args[0], dot=self.colors["error"])
+                elif kind == "stat":
+                    self._set_stat(*args)
+
+            if InstallPipeline(self.options, emit).rollback() == EXIT_OK:
+                # The release is no longer the active version; allow updating.
+                self._installed = False
+                self.action_button.configure_text("Install HellFire")
+                self.action_button.set_enabled(True)
+            self._refresh_rollback()
+
+        def _refresh_rollback(self):
+            self.rollback_button.set_enabled(
+                self._worker is None
+                and previous_version(self.base_dir) is not None
+            )
+
+        def _on_pause_clicked(self):
+            if self._worker is None and self._prefetch is None:
+                return
+            self._paused = not self._paused
+            self._send_control(("pause",) if self._paused else ("resume",))
+            self.pause_button.configure_text(
+                "Resume" if self._paused else "Pause"
+            )
+            if self._paused:
+                self.update_status("Download paused",
+                                   dot=self.colors["text_dim"])
+
+        def _on_limit_clicked(self):
+            presets = sorted(set(RATE_PRESETS) | {self.options.limit_rate})
+            later = [rate for rate in presets if rate > self.limit_rate]
+            self.limit_rate = later[0] if later else 0
+            self.limit_button.configure_text(
+                f"Limit: {format_rate(self.limit_rate)}"
+            )
+            self._send_control(("limit", self.limit_rate))
+
+        def _send_control(self, message):
+            """Pass a download control to the install or prefetch child."""
+            if self._worker is not None:
+                conn = self._events
+            elif self._prefetch is not None:
+                conn = self._prefetch_controls
+            else:
+                return
+            try:
+                conn.send(message)
+            except OSError:
+                pass
+
+        def _drain_worker(self):
+            if self._worker is None:
+                return
+            try:
+                while self._events.poll():
+                    self._on_event(self._events.recv())
+            except (EOFError, OSError):
+                worker = self._stop_worker()
+                if worker.exitcode:
+                    self._fail(f"Installer process exited ({worker.exitcode})")
+
+        def _stop_worker(self):
+            worker, self._worker = self._worker, None
+            self.pause_button.configure_text("Pause")
+            self.pause_button.set_enabled(False)
+            self._refresh_rollback()
+            self._events.close()
+            worker.join(2)
+            if worker.is_alive():
+                worker.kill()
+                worker.join()
+            return worker
+
+        def _cancel_install(self):
+            self._worker.terminate()
+            self._stop_worker()
+            self.stop_indeterminate()
+            self.update_status("Installation cancelled",
+                               dot=self.colors["error"])
+            self._set_stat("status", value="Cancelled", sub="Click retry")
+            self.action_button.configure_text("Retry")
+
+        def _on_close(self):
+            if self._worker is not None:
+                self._worker.terminate()
+                self._stop_worker()
+            self._stop_prefetch()
+            self.root.destroy()
+
+        def _start_prefetch(self, url, name):
+            if self._prefetch is not None or self._worker is not None:
+                return
+            options = argparse.Namespace(**vars(self.options))
+            options.limit_rate = self.limit_rate
+            ctx = multiprocessing.get_context("spawn")
+            child_end, self._prefetch_controls = ctx.Pipe(duplex=False)
+            self._prefetch = ctx.Process(target=run_prefetch_process,
+                                         args=(options, url, name, child_end),
+                                         daemon=True)
+            self._prefetch.start()
+            child_end.close()
+            DIAGNOSTICS.incr("prefetch_started")
+            self._paused = False
+            self.pause_button.configure_text("Pause")
+            self.pause_button.set_enabled(True)
+            self._set_stat("status", value="Ready", sub="Prefetching…")
+
+        def _stop_prefetch(self):
+            """Cancel a running prefetch and wait for it to checkpoint."""
+            prefetch, self._prefetch = self._prefetch, None
+            if prefetch is None:
+                return
+            self._prefetch_controls.close()
+            self.pause_button.configure_text("Pause")
+            self.pause_button.set_enabled(False)
+            if prefetch.is_alive():
+                prefetch.terminate()
+                prefetch.join(3)
+                if prefetch.is_alive():
+                    prefetch.kill()
+            prefetch.join()
+
+        def _on_event(self, event):
+            kind, args = event[0], event[1:]
+            if kind == "status":
+                message, dot = args
+                self.update_status(message,
+                                   dot=self.colors[dot] if dot else None)
+            elif kind == "progress":
+                self.update_progress(*args)
+            elif kind == "busy":
+                self.show_indeterminate(*args)
+            elif kind == "idle":
+                self.stop_indeterminate()
+            elif kind == "stat":
+                self._set_stat(*args)
+            elif kind == "done":
+                self.update_status(args[0], dot=self.colors["success"])
+                self._installed = True
+                self.channel.publish("done", True)
+            elif kind == "fail":
+                self._fail(args[0])
+            elif kind == "diagnostics":
+                DIAGNOSTICS.merge(args[0])
+            elif kind == "release" and self.options.prefetch:
+                self.channel.publish("release", args)
+
+        def _mark_done(self):
+            self.action_button.configure_text("✓ Installed")
+            self.action_button.set_enabled(False)
+
+        def _fail(self, message):
+            self.update_status(message, dot=self.colors["error"])
+            self._set_stat("status", value="Failed", sub="Click retry")
+            self.channel.publish("retry", True)
+
+        # ----- utils ---------------------------------------------------------
+
+        @staticmethod
+        def _hex_to_rgb(h):
+            h = h.lstrip("#")
+            return tuple(int(h[i:i + 2], 16) for i in (0, 2, 4))
+
+        @staticmethod
+        def _tilde(path):
+            try:
+                return "~/" + str(path.relative_to(Path.home()))
+            except ValueError:
+                return str(path)
+
+    return HellFireInstallerTk
+
+
+def run_gui(options):
+    try:
+        import tkinter as tk
+    except ImportError:
+        sys.exit("The GUI needs python3-tk (tkinter); install it, or run "
+                 "with --headless.")
+    HellFireInstallerTk = build_gui()
     root = tk.Tk()
     try:
         root.tk.call("tk", "scaling", 1.25)
     except tk.TclError:
         pass
-    HellFireInstallerTk(root)
+    HellFireInstallerTk(root, options)
     root.mainloop()
 
 